@@ -7,16 +7,65 @@ const DB_PATH = path.join(__dirname, 'hive.db');
 const SCHEMA_PATH = path.join(__dirname, 'schema.sql');
 
 let db = null;
+let SQL = null;
+// mtime of hive.db when this process last read or wrote it
+let fileMtime = 0;
+
+// Lock file shared with the scrapers' direct SQLite sink (instagram_scraper_v2/src/utils/sqlite_sink.py).
+// sql.js rewrites the whole file, so only the holder may touch hive.db; the other side waits.
+const LOCK_PATH = DB_PATH + '.lock';
+const LOCK_WAIT_MS = 10000;
+const LOCK_STALE_MS = 30000; // Left behind by a crashed writer
+let lockDepth = 0;
+
+function sleepSync(ms) {
+    Atomics.wait(new Int32Array(new SharedArrayBuffer(4)), 0, 0, ms);
+}
+
+function withFileLock(fn) {
+    if (lockDepth > 0) return fn();
+
+    const deadline = Date.now() + LOCK_WAIT_MS;
+    while (true) {
+        try {
+            fs.writeFileSync(LOCK_PATH, String(process.pid), { flag: 'wx' });
+            break;
+        } catch (error) {
+            if (error.code !== 'EEXIST') throw error;
+            try {
+                if (Date.now() - fs.statSync(LOCK_PATH).mtimeMs > LOCK_STALE_MS) {
+                    fs.unlinkSync(LOCK_PATH);
+                    continue;
+                }
+            } catch (statError) {
+                continue; // Released meanwhile
+            }
+            if (Date.now() > deadline) throw new Error('hive.db is locked by another writer');
+            sleepSync(5);
+        }
+    }
+
+    lockDepth++;
+    try {
+        return fn();
+    } finally {
+        lockDepth--;
+        try { fs.unlinkSync(LOCK_PATH); } catch (error) { /* already gone */ }
+    }
+}
+// Set while transaction() runs: writes are saved to disk once, at COMMIT
+let inTransaction = false;
 
 // Initialize database
 async function initDatabase() {
-    const SQL = await initSqlJs();
+    SQL = await initSqlJs();
 
     // Try to load existing database
     try {
         if (fs.existsSync(DB_PATH)) {
             const buffer = fs.readFileSync(DB_PATH);
             db = new SQL.Database(buffer);
+            fileMtime = fs.statSync(DB_PATH).mtimeMs;
             console.log('Database loaded from file');
         } else {
             // Create new database
@@ -48,14 +97,31 @@ function saveDatabase() {
         const data = db.export();
         const buffer = Buffer.from(data);
         fs.writeFileSync(DB_PATH, buffer);
+        fileMtime = fs.statSync(DB_PATH).mtimeMs;
     }
 }
 
+// Reload hive.db if another process (the scrapers' direct SQLite sink) wrote it since,
+// so those rows show up and the next save does not overwrite them
+function refreshFromDisk() {
+    if (!db || inTransaction || !fs.existsSync(DB_PATH)) return;
+    if (fs.statSync(DB_PATH).mtimeMs === fileMtime) return;
+
+    withFileLock(() => {
+        const buffer = fs.readFileSync(DB_PATH);
+        db.close();
+        db = new SQL.Database(buffer);
+        fileMtime = fs.statSync(DB_PATH).mtimeMs;
+        console.log('Database reloaded (changed on disk)');
+    });
+}
+
 // Database wrapper with synchronous-like API
 const dbWrapper = {
     prepare: (sql) => ({
         get: (...params) => {
             try {
+                refreshFromDisk();
                 const stmt = db.prepare(sql);
                 stmt.bind(params);
                 if (stmt.step()) {
@@ -72,6 +138,7 @@ const dbWrapper = {
         },
         all: (...params) => {
             try {
+                refreshFromDisk();
                 const results = [];
                 const stmt = db.prepare(sql);
                 stmt.bind(params);
@@ -87,11 +154,14 @@ const dbWrapper = {
         },
         run: (...params) => {
             try {
-                db.run(sql, params);
-                const lastId = db.exec("SELECT last_insert_rowid() as id")[0]?.values[0][0];
-                const changes = db.getRowsModified();
-                saveDatabase();
-                return { lastInsertRowid: lastId, changes };
+                return withFileLock(() => {
+                    refreshFromDisk();
+                    db.run(sql, params);
+                    const lastId = db.exec("SELECT last_insert_rowid() as id")[0]?.values[0][0];
+                    const changes = db.getRowsModified();
+                    if (!inTransaction) saveDatabase();
+                    return { lastInsertRowid: lastId, changes };
+                });
             } catch (error) {
                 console.error('Query error:', error, sql, params);
                 return { lastInsertRowid: 0, changes: 0 };
@@ -100,12 +170,36 @@ const dbWrapper = {
     }),
     exec: (sql) => {
         try {
-            db.run(sql);
-            saveDatabase();
+            withFileLock(() => {
+                refreshFromDisk();
+                db.run(sql);
+                if (!inTransaction) saveDatabase();
+            });
         } catch (error) {
             console.error('Exec error:', error);
         }
     },
+    // Run fn() in one transaction; the database file is written once instead of per statement
+    // The lock file is held throughout, so the sink cannot write in between
+    transaction: (fn) => {
+        if (inTransaction) return fn();
+        return withFileLock(() => {
+            refreshFromDisk();
+            db.run('BEGIN');
+            inTransaction = true;
+            try {
+                const result = fn();
+                db.run('COMMIT');
+                return result;
+            } catch (error) {
+                db.run('ROLLBACK');
+                throw error;
+            } finally {
+                inTransaction = false;
+                saveDatabase();
+            }
+        });
+    },
     pragma: () => { } // No-op for compatibility
 };
 
@@ -27,6 +27,8 @@ CREATE TABLE IF NOT EXISTS events (
     status TEXT DEFAULT 'draft' CHECK(status IN ('draft', 'pending_review', 'published', 'archived')),
     source TEXT DEFAULT 'manual' CHECK(source IN ('manual', 'scraped')),
     instagram_post_url TEXT,
+    parser_version INTEGER, -- LLM parser version that last read a scraped event (reparse_events.py)
+    parsed_at DATETIME,
     created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
     updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
 );
@@ -55,6 +57,14 @@ CREATE TABLE IF NOT EXISTS scraped_clubs (
     name TEXT NOT NULL,
     instagram_url TEXT UNIQUE NOT NULL,
     last_scraped DATETIME,
+    last_shortcode TEXT,        -- newest post already synced (incremental scraping watermark)
+    last_post_at DATETIME,
+    post_rate REAL,             -- learned posting cadence (posts/day), see the scraper's ClubScheduler
+    posts_seen INTEGER,
+    events_found INTEGER,
+    avg_scrape_seconds REAL,
+    next_due DATETIME,
+    priority REAL,
     is_active INTEGER DEFAULT 1,
     created_at DATETIME DEFAULT CURRENT_TIMESTAMP
 );
@@ -63,5 +73,6 @@ CREATE TABLE IF NOT EXISTS scraped_clubs (
 CREATE INDEX IF NOT EXISTS idx_events_status ON events(status);
 CREATE INDEX IF NOT EXISTS idx_events_date ON events(event_date);
 CREATE INDEX IF NOT EXISTS idx_events_club ON events(club_id);
+CREATE INDEX IF NOT EXISTS idx_events_dedupe ON events(club_id, title, event_date);
 CREATE INDEX IF NOT EXISTS idx_reminders_student ON reminders(student_id);
 CREATE INDEX IF NOT EXISTS idx_reminders_event ON reminders(event_id);
@@ -305,63 +305,98 @@ router.post('/:id/archive', authenticateToken, (req, res) => {
     }
 });
 
-// POST /api/events/scraped - Receive scraped events (protected by API Key)
-router.post('/scraped', (req, res) => {
-    try {
-        const apiKey = req.headers['x-api-key'];
+// Largest batch accepted by POST /api/events/scraped/batch
+const MAX_SCRAPED_BATCH = 500;
 
-        // Simple API Key check
-        if (!apiKey || apiKey !== (process.env.SCRAPER_API_KEY || 'hive-scraper-secret-key')) {
-            return res.status(401).json({ error: 'Invalid API Key' });
-        }
+function hasScraperKey(req) {
+    const apiKey = req.headers['x-api-key'];
+    return Boolean(apiKey) && apiKey === (process.env.SCRAPER_API_KEY || 'hive-scraper-secret-key');
+}
 
-        const { title, description, event_date, location, category, source, instagram_post_url, club_name } = req.body;
+// Store one scraped event: { status: 'created' | 'duplicate' | 'invalid', id?, error? }
+// clubIds caches club lookups across the items of a batch
+function ingestScrapedEvent(item, clubIds = new Map()) {
+    const { title, description, event_date, location, category, instagram_post_url, club_name } = item || {};
 
-        if (!title || !event_date || !club_name) {
-            return res.status(400).json({ error: 'Title, event_date, and club_name are required' });
-        }
+    if (!title || !event_date || !club_name) {
+        return { status: 'invalid', error: 'Title, event_date, and club_name are required' };
+    }
+
+    // Find club by name (fuzzy match or exact)
+    const clubKey = club_name.trim().toLowerCase();
+    let clubId = clubIds.get(clubKey);
 
-        // Find club by name (fuzzy match or exact)
-        let club = db.prepare('SELECT id FROM clubs WHERE name = ? COLLATE NOCASE').get(club_name.trim());
+    if (clubId === undefined) {
+        const club = db.prepare('SELECT id FROM clubs WHERE name = ? COLLATE NOCASE').get(club_name.trim());
 
-        if (!club) {
+        if (club) {
+            clubId = club.id;
+        } else {
             // Auto-create club if it doesn't exist (for scraper integration)
             const newClub = db.prepare(`
                 INSERT INTO clubs (name, instagram_url, password_hash, is_admin)
                 VALUES (?, ?, 'scraped_account', 0)
             `).run(club_name.trim(), `https://instagram.com/${club_name.trim()}`);
 
-            club = { id: newClub.lastInsertRowid };
+            clubId = newClub.lastInsertRowid;
             console.log(`Auto-created club '${club_name}' from scraper`);
         }
+        clubIds.set(clubKey, clubId);
+    }
 
-        // Check for duplicates (same club, title, date)
-        const existingEvent = db.prepare(`
-            SELECT id FROM events 
-            WHERE club_id = ? AND title = ? AND event_date = ?
-        `).get(club.id, title, event_date);
+    // Check for duplicates (same club, title, date)
+    const existingEvent = db.prepare(`
+        SELECT id FROM events 
+        WHERE club_id = ? AND title = ? AND event_date = ?
+    `).get(clubId, title, event_date);
 
-        if (existingEvent) {
-            return res.status(200).json({ message: 'Event already exists', id: existingEvent.id });
+    if (existingEvent) {
+        return { status: 'duplicate', id: existingEvent.id };
+    }
+
+    // Insert new scraped event (now includes category from LLM)
+    const result = db.prepare(`
+        INSERT INTO events (club_id, title, description, event_date, location, category, source, status, image_url)
+        VALUES (?, ?, ?, ?, ?, ?, 'scraped', 'published', ?)
+    `).run(
+        clubId,
+        title,
+        description || '',
+        event_date,
+        location || '',
+        category || null,
+        instagram_post_url || null // Using post URL as image/link placeholder for now
+    );
+
+    if (!result.lastInsertRowid) {
+        return { status: 'error', error: 'Insert failed' };
+    }
+    return { status: 'created', id: result.lastInsertRowid };
+}
+
+// POST /api/events/scraped - Receive scraped events (protected by API Key)
+router.post('/scraped', (req, res) => {
+    try {
+        // Simple API Key check
+        if (!hasScraperKey(req)) {
+            return res.status(401).json({ error: 'Invalid API Key' });
         }
 
-        // Insert new scraped event (now includes category from LLM)
-        const result = db.prepare(`
-            INSERT INTO events (club_id, title, description, event_date, location, category, source, status, image_url)
-            VALUES (?, ?, ?, ?, ?, ?, 'scraped', 'published', ?)
-        `).run(
-            club.id,
-            title,
-            description || '',
-            event_date,
-            location || '',
-            category || null,
-            instagram_post_url // Using post URL as image/link placeholder for now
-        );
+        const outcome = ingestScrapedEvent(req.body);
+
+        if (outcome.status === 'invalid') {
+            return res.status(400).json({ error: outcome.error });
+        }
+        if (outcome.status === 'duplicate') {
+            return res.status(200).json({ message: 'Event already exists', id: outcome.id });
+        }
+        if (outcome.status === 'error') {
+            return res.status(500).json({ error: 'Internal server error', details: outcome.error });
+        }
 
         res.status(201).json({
             message: 'Scraped event created',
-            id: result.lastInsertRowid
+            id: outcome.id
         });
 
     } catch (error) {
@@ -370,4 +405,45 @@ router.post('/scraped', (req, res) => {
     }
 });
 
+// POST /api/events/scraped/batch - Receive many scraped events in one transaction
+// Body: { events: [...] }; the response has one result per event, in the same order
+router.post('/scraped/batch', (req, res) => {
+    try {
+        if (!hasScraperKey(req)) {
+            return res.status(401).json({ error: 'Invalid API Key' });
+        }
+
+        const events = req.body && req.body.events;
+
+        if (!Array.isArray(events)) {
+            return res.status(400).json({ error: 'events must be an array' });
+        }
+        if (events.length > MAX_SCRAPED_BATCH) {
+            return res.status(413).json({ error: `At most ${MAX_SCRAPED_BATCH} events per batch` });
+        }
+
+        const clubIds = new Map();
+        const results = db.transaction(() => events.map((item, index) => {
+            try {
+                return { index, ...ingestScrapedEvent(item, clubIds) };
+            } catch (error) {
+                return { index, status: 'error', error: error.message };
+            }
+        }));
+
+        const count = (status) => results.filter(result => result.status === status).length;
+        res.status(200).json({
+            created: count('created'),
+            duplicates: count('duplicate'),
+            invalid: count('invalid'),
+            failed: count('error'),
+            results
+        });
+
+    } catch (error) {
+        console.error('Error receiving scraped event batch:', error);
+        res.status(500).json({ error: 'Internal server error', details: error.message });
+    }
+});
+
 module.exports = router;
@@ -9,7 +9,7 @@ const PORT = process.env.PORT || 3001;
 
 // Middleware
 app.use(cors());
-app.use(express.json());
+app.use(express.json({ limit: '5mb' })); // Room for batches of scraped events
 
 // Request logging
 app.use((req, res, next) => {
@@ -60,7 +60,9 @@ db.ready.then(() => {
                     'PUT /api/events/:id': 'Update event (auth required)',
                     'DELETE /api/events/:id': 'Delete event (auth required)',
                     'POST /api/events/:id/publish': 'Publish event (admin only)',
-                    'POST /api/events/:id/archive': 'Archive event (admin only)'
+                    'POST /api/events/:id/archive': 'Archive event (admin only)',
+                    'POST /api/events/scraped': 'Receive a scraped event (scraper API key)',
+                    'POST /api/events/scraped/batch': 'Receive scraped events in one transaction (scraper API key)'
                 },
                 reminders: {
                     'POST /api/reminders': 'Set a reminder',
@@ -1,6 +1,6 @@
 /**
  * THE HIVE - Scraper API Integration Tests
- * Tests for /api/events/scraped endpoint
+ * Tests for /api/events/scraped and /api/events/scraped/batch endpoints
  */
 
 const request = require('supertest');
@@ -48,7 +48,8 @@ jest.mock('../database/db', () => {
                 }
                 return { lastInsertRowid: 0 };
             })
-        }))
+        })),
+        transaction: jest.fn((fn) => fn())
     };
 });
 
@@ -135,4 +136,55 @@ describe('Scraper API Integration Tests', () => {
         // Clean up or check side effects if needed (optional)
         // For now just ensuring it doesn't 404 is enough to match updated logic
     });
+
+    test('Should reject batch without API key', async () => {
+        await request(app)
+            .post('/api/events/scraped/batch')
+            .send({ events: [] })
+            .expect(401);
+    });
+
+    test('Should reject batch without events array', async () => {
+        await request(app)
+            .post('/api/events/scraped/batch')
+            .set('x-api-key', API_KEY)
+            .send({ title: 'Not a batch' })
+            .expect(400);
+    });
+
+    test('Should reject oversized batch', async () => {
+        const events = Array.from({ length: 501 }, (_, i) => ({
+            title: `Event ${i}`, event_date: '2025-12-01', club_name: 'Test Club'
+        }));
+
+        await request(app)
+            .post('/api/events/scraped/batch')
+            .set('x-api-key', API_KEY)
+            .send({ events })
+            .expect(413);
+    });
+
+    test('Should store batch in one transaction with a status per event', async () => {
+        const db = require('../database/db');
+        db.transaction.mockClear();
+
+        const events = [
+            { title: 'Batch Event A', event_date: '2025-12-01', club_name: 'Test Club' },
+            { title: 'Batch Event A', event_date: '2025-12-01', club_name: 'Test Club' },
+            { title: 'Missing Date', club_name: 'Test Club' },
+            { title: 'Batch Event B', event_date: '2025-12-02', club_name: 'test club' }
+        ];
+
+        const response = await request(app)
+            .post('/api/events/scraped/batch')
+            .set('x-api-key', API_KEY)
+            .send({ events })
+            .expect(200);
+
+        expect(db.transaction).toHaveBeenCalledTimes(1);
+        expect(response.body).toMatchObject({ created: 2, duplicates: 1, invalid: 1, failed: 0 });
+        expect(response.body.results.map(result => result.status))
+            .toEqual(['created', 'duplicate', 'invalid', 'created']);
+        expect(response.body.results[1].id).toBe(response.body.results[0].id);
+    });
 });
@@ -1,66 +1,184 @@
 import argparse
 import sys
-from src.core.browser import BrowserManager
-from src.scrapers.instagram import InstagramScraper
-from src.scrapers.club_finder import ClubSiteScraper
-from src.utils.storage import DataManager
-from src.utils.backend_client import BackendClient
+from pathlib import Path
+from typing import TYPE_CHECKING
+from src.core.config import config
+from src.core.har import HarSession
+
+# Playwright, pydantic and requests load with the command that needs them, so --help
+# and argument errors start fast (startup_budget.py keeps it that way)
+if TYPE_CHECKING:
+    from src.core.browser import BrowserManager
+    from src.utils.backend_client import BackendClient
+
+def sync_profile(profile, username: str, backend_client: "BackendClient") -> bool:
+    """Send the posts of a scraped profile to the backend, True if all of them arrived"""
+    try:
+        print("Syncing with backend...")
+        return backend_client.sync_profile(profile, username)
+    except Exception as e:
+        print(f"Sync failed: {e}")
+        return False
+
+def open_watermarks(full: bool):
+    """Watermark store from settings.yaml, None for full scrapes"""
+    if full or not config.get("watermark.enabled", False):
+        return None
+    from src.core.watermark import WatermarkStore
+    db_path = Path(__file__).parent / config.get("watermark.db_path", "../backend/database/hive.db")
+    return WatermarkStore(str(db_path))
+
+def open_sink(kind: str):
+    """Where scraped profiles go: the backend's HTTP API, or straight into hive.db"""
+    if kind == "db":
+        from src.utils.sqlite_sink import SQLiteSink
+        db_path = Path(__file__).parent / config.get("sqlite_sink.db_path", "../backend/database/hive.db")
+        return SQLiteSink(str(db_path), batch_size=config.get("sqlite_sink.batch_size", 500),
+                          busy_timeout=config.get("sqlite_sink.busy_timeout_seconds", 30))
+    from src.utils.backend_client import BackendClient
+    return BackendClient()
+
+def handle_profile(profile, username: str, backend_client: "BackendClient", watermarks):
+    """Sync a scraped profile and advance its watermark once the sync succeeded"""
+    print(f"Successfully scraped {username}")
+    if sync_profile(profile, username, backend_client) and watermarks:
+        watermarks.commit([username])
+
+def serve(args, browser_manager: "BrowserManager", har: HarSession):
+    """Run the warm-browser daemon until interrupted"""
+    import asyncio
+    from src.core.pool import BrowserPool
+    from src.scrapers.club_finder import ClubSiteScraper
+    from src.scrapers.instagram import InstagramScraper
+    from src.utils.daemon import ScrapeDaemon
+
+    pool = BrowserPool(
+        workers=args.workers,
+        concurrency=config.get("pool.concurrency_per_worker", 1),
+        headless=browser_manager.headless,
+        context_options=browser_manager.context_options(),
+        timeout=browser_manager.timeout,
+        route_policy=browser_manager.route_policy,
+        har=har,
+    )
+    daemon = ScrapeDaemon(
+        InstagramScraper(browser_manager, watermarks=open_watermarks(har.replaying)),
+        ClubSiteScraper(browser_manager),
+        pool,
+        recycle_minutes=config.get("serve.recycle_minutes", 30),
+        recycle_after_jobs=config.get("serve.recycle_after_jobs", 200),
+    )
+    asyncio.run(daemon.serve_forever(host=args.host, port=args.port, socket_path=args.socket))
 
 def main():
     parser = argparse.ArgumentParser(description="Instagram Public Data Scraper")
+    har_group = parser.add_mutually_exclusive_group()
+    har_group.add_argument("--record", metavar="HAR", help="Record all browser traffic to a HAR archive")
+    har_group.add_argument("--replay", metavar="HAR",
+                           help="Serve browser traffic from a recorded HAR archive, offline and without pacing")
     
     subparsers = parser.add_subparsers(dest="command", help="Command to run")
     
     # Command: scrape_users
     scrape_parser = subparsers.add_parser("scrape", help="Scrape Instagram profiles")
     scrape_parser.add_argument("usernames", nargs="+", help="List of usernames to scrape")
+    scrape_parser.add_argument("--workers", type=int, default=1,
+                               help="Scrape with N isolated browser contexts in parallel")
+    scrape_parser.add_argument("--capture", action="store_true",
+                               help="Read posts from the page's JSON responses instead of the DOM")
+    scrape_parser.add_argument("--full", action="store_true",
+                               help="Ignore the per-profile watermarks and return every visible post")
+    scrape_parser.add_argument("--sink", choices=["backend", "db"], default="backend",
+                               help="Send posts to the backend API, or write them straight into hive.db (on-box runs)")
     
     # Command: find_clubs
     find_parser = subparsers.add_parser("find", help="Find Instagram links on a club site")
     find_parser.add_argument("url", help="URL of the club directory page")
     
+    # Command: serve
+    serve_parser = subparsers.add_parser("serve", help="Keep a warm browser pool and accept jobs over HTTP")
+    # Defaults from settings.yaml are filled in after parsing, so --help never reads it
+    serve_parser.add_argument("--host", help="Address to listen on (default: serve.host)")
+    serve_parser.add_argument("--port", type=int, help="Port to listen on (default: serve.port)")
+    serve_parser.add_argument("--socket", help="Listen on this Unix socket instead of host:port")
+    serve_parser.add_argument("--workers", type=int,
+                              help="Isolated browser contexts kept warm (default: pool.workers)")
+    
     args = parser.parse_args()
     
     if not args.command:
         parser.print_help()
         sys.exit(1)
+    if args.command == "serve" and args.record:
+        parser.error("--record is not supported by serve; record with scrape or find instead")
+    if args.command == "serve":
+        args.host = args.host or config.get("serve.host", "127.0.0.1")
+        args.port = args.port or config.get("serve.port", 8765)
+        args.workers = args.workers or config.get("pool.workers", 4)
+
+    if args.record:
+        har = HarSession("record", args.record)
+    elif args.replay:
+        har = HarSession("replay", args.replay)
+    else:
+        har = HarSession()
+    print(har.describe())
+
+    from src.core.browser import BrowserManager
 
     print("Initializing Browser Manager...")
-    browser_manager = BrowserManager()
-    data_manager = DataManager()
+    browser_manager = BrowserManager(har=har)
+    profile_sink = None
+    store = None
     
     try:
         if args.command == "scrape":
-            scraper = InstagramScraper(browser_manager)
-            results = []
-            
-            scraper.start_browser()
+            from src.scrapers.base import Throttled
+            from src.scrapers.instagram import InstagramScraper
+            from src.utils.storage import DataManager
+
+            # Replays must not depend on (or move) the watermarks of earlier runs
+            watermarks = open_watermarks(args.full or har.replaying)
+            scraper = InstagramScraper(browser_manager, extraction="network" if args.capture else None,
+                                       watermarks=watermarks)
+            backend_client = profile_sink = open_sink(args.sink)
+            # Profiles are written out as they arrive instead of being kept until the end
+            store = DataManager().open_run()
             
-            for username in args.usernames:
-                print(f"\n--- Processing {username} ---")
-                profile = scraper.scrape(username)
-                if profile:
-                    results.append(profile)
-                    print(f"Successfully scraped {username}")
-                    
-                    # Sync to backend
+            if args.workers > 1:
+                print(f"Scraping {len(args.usernames)} profiles with {args.workers} workers...")
+                # Each profile is synced while the pool is already scraping the next ones
+                def sink(item):
+                    username, profile = item
+                    if not profile:
+                        print(f"Failed to scrape {username}")
+                        return None
+                    handle_profile(profile, username, backend_client, watermarks)
+                    store.write(profile)
+                    return None
+
+                scraper.scrape_streaming(args.usernames, sink, workers=args.workers)
+            else:
+                scraper.start_browser()
+
+                for username in args.usernames:
+                    print(f"\n--- Processing {username} ---")
                     try:
-                        print("Syncing with backend...")
-                        backend_client = BackendClient()
-                        sync_count = 0
-                        for post in profile.posts:
-                            if backend_client.sync_event(post.model_dump(), username):
-                                sync_count += 1
-                        print(f"Synced {sync_count} events to The Hive")
-                    except Exception as e:
-                        print(f"Sync failed: {e}")
-                else:
-                    print(f"Failed to scrape {username}")
-                
-            if results:
-                data_manager.save_profiles(results)
+                        profile = scraper.scrape(username)
+                    except Throttled as e:
+                        # Nothing is synced or committed, so the next run scrapes it again
+                        print(f"{e}; {username} is left for the next run")
+                        continue
+                    if profile:
+                        handle_profile(profile, username, backend_client, watermarks)
+                        store.write(profile)
+                    else:
+                        print(f"Failed to scrape {username}")
                 
         elif args.command == "find":
+            from src.scrapers.club_finder import ClubSiteScraper
+            from src.utils.storage import DataManager
+
             scraper = ClubSiteScraper(browser_manager)
             scraper.start_browser()
             
@@ -68,7 +186,10 @@ def main():
             links = scraper.scrape(args.url)
             
             if links:
-                data_manager.save_links(links)
+                DataManager().save_links(links)
+                
+        elif args.command == "serve":
+            serve(args, browser_manager, har)
                 
     except KeyboardInterrupt:
         print("\nOperation cancelled by user.")
@@ -77,6 +198,17 @@ def main():
     finally:
         print("\nShutting down browser...")
         browser_manager.stop()
+        if store:
+            store.close()
+        if hasattr(profile_sink, "report"):
+            profile_sink.close()
+            print(profile_sink.report())
+        if browser_manager.waiter.recorder.samples:
+            print(browser_manager.waiter.recorder.report())
+        if browser_manager.route_policy:
+            print(browser_manager.route_policy.stats.report())
+        if browser_manager.rate_limiter:
+            print(browser_manager.rate_limiter.report())
         print("Done.")
 
 if __name__ == "__main__":
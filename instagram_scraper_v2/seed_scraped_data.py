@@ -72,9 +72,8 @@ def seed_data():
     ]
 
     print("Seeding mock scraped data to verify website integration...")
-    for item in events:
-        print(f"Sending event for {item['club']}...")
-        client.sync_event(item['data'], item['club'])
+    synced = client.sync_events([(item['data'], item['club']) for item in events])
+    print(f"Sent {synced} of {len(events)} events")
     print("Done! Check localhost:5173")
 
 if __name__ == "__main__":
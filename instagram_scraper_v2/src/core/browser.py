@@ -1,15 +1,21 @@
 import random
 import time
-from typing import Optional
-from playwright.sync_api import sync_playwright, Browser, BrowserContext, Page, Playwright
+from typing import TYPE_CHECKING, Optional
 from src.core.config import config
+from src.core.waits import Waiter
+from src.core.routing import RoutePolicy
+from src.core.har import HarSession
+from src.core.ratelimit import RateLimiter
+
+if TYPE_CHECKING:
+    from playwright.sync_api import Browser, BrowserContext, Page, Playwright
 
 class BrowserManager:
-    def __init__(self):
-        self.playwright: Optional[Playwright] = None
-        self.browser: Optional[Browser] = None
-        self.context: Optional[BrowserContext] = None
-        self.page: Optional[Page] = None
+    def __init__(self, har: Optional[HarSession] = None):
+        self.playwright: Optional["Playwright"] = None
+        self.browser: Optional["Browser"] = None
+        self.context: Optional["BrowserContext"] = None
+        self.page: Optional["Page"] = None
         
         # Load config
         self.headless = config.get("browser.headless", False)
@@ -17,9 +23,33 @@ class BrowserManager:
         self.slow_mo = config.get("browser.slow_mo", 50)
         self.timeout = config.get("browser.timeout", 30000)
         self.user_data_path = config.get("paths.user_data_dir", "data/chrome_user_data")
+        self.waiter = Waiter(
+            default_timeout=config.get("waits.timeout", 10000),
+            floor_ms=config.get("waits.floor_ms", 0),
+        )
+        self.route_policy = RoutePolicy.from_config(config.get("routing"))
+        # HAR record/replay; replays skip every pacing delay, including the wait floor
+        self.har = har or HarSession()
+        if self.har.replaying:
+            self.waiter.floor_ms = 0
+        # One navigation budget per host, shared with every other worker and process
+        self.rate_limiter = None if self.har.replaying else RateLimiter.from_config(config.get("rate_limit"))
+
+    def context_options(self) -> dict:
+        """Context settings shared by the persistent context and pooled contexts"""
+        return {
+            "viewport": self.viewport,
+            "user_agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36", # Default fallback
+            "locale": "en-US",
+            "timezone_id": "Europe/Istanbul",
+        }
 
-    def start(self) -> Page:
+    def start(self) -> "Page":
         """Start the browser and return a page"""
+        # Playwright loads with the browser, not with the CLI
+        from playwright.sync_api import sync_playwright
+
+        config.ensure_directories()
         self.playwright = sync_playwright().start()
         
         # Launch with specific arguments to look more like a real user
@@ -43,14 +73,19 @@ class BrowserManager:
             user_data_dir=self.user_data_path,
             headless=self.headless,
             args=launch_args, # Using existing launch_args
-            viewport=self.viewport, # Using existing self.viewport
-            slow_mo=self.slow_mo, # Using existing self.slow_mo
-            user_agent="Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36", # Default fallback
-            locale="en-US",
-            timezone_id="Europe/Istanbul"
+            slow_mo=0 if self.har.replaying else self.slow_mo, # Using existing self.slow_mo
+            **self.context_options(),
+            **self.har.context_options()
         )      
         # Set default timeout
         self.context.set_default_timeout(self.timeout)
+
+        # Skip heavy resources (images, video, fonts, trackers) we never read
+        if self.route_policy:
+            self.route_policy.apply(self.context)
+
+        # Registered last so recorded responses are served before any other route
+        self.har.apply(self.context)
         
         # Get the default page or create new one
         if len(self.context.pages) > 0:
@@ -81,5 +116,7 @@ class BrowserManager:
 
     def random_sleep(self, min_ms: int = 1000, max_ms: int = 3000):
         """Sleep for a random amount of time"""
+        if self.har.replaying:
+            return
         sleep_time = random.randint(min_ms, max_ms) / 1000.0
         time.sleep(sleep_time)
@@ -1,20 +1,24 @@
-import yaml
 import os
 from pathlib import Path
-from typing import Dict, Any, Union
+from typing import Dict, Any, Optional, Union
 
 class ConfigManager:
+    """
+    settings.yaml, read on the first get() rather than at import, so importing a module
+    that uses config (or running --help) costs neither the YAML parse nor any mkdir
+    """
     _instance = None
-    _config: Dict[str, Any] = {}
+    _config: Optional[Dict[str, Any]] = None
 
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super(ConfigManager, cls).__new__(cls)
-            cls._instance._load_config()
         return cls._instance
 
     def _load_config(self):
         """Load configuration from settings.yaml"""
+        import yaml
+
         # Determine project root relative to this file
         # src/core/config.py -> src/core -> src -> root
         root_dir = Path(__file__).parent.parent.parent
@@ -25,14 +29,11 @@ class ConfigManager:
 
         with open(config_path, "r") as f:
             self._config = yaml.safe_load(f)
-        
-        # Ensure output directories exist
-        self._ensure_directories()
 
-    def _ensure_directories(self):
-        """Create necessary directories defined in config"""
+    def ensure_directories(self):
+        """Create necessary directories defined in config (done when the browser starts)"""
         root_dir = Path(__file__).parent.parent.parent
-        paths = self._config.get("paths", {})
+        paths = self.get("paths", {})
         
         for key, path_str in paths.items():
             full_path = root_dir / path_str
@@ -40,6 +41,8 @@ class ConfigManager:
 
     def get(self, key: str, default: Any = None) -> Any:
         """Get a configuration value using dot notation (e.g. 'browser.headless')"""
+        if self._config is None:
+            self._load_config()
         keys = key.split(".")
         value = self._config
         
@@ -0,0 +1,94 @@
+import glob
+import os
+import time
+from typing import Any, Dict, List, Optional
+
+RECORD = "record"
+REPLAY = "replay"
+
+
+class HarSession:
+    """
+    Record browser traffic to HAR archives, or replay it offline through route_from_har().
+
+    Recording embeds full response bodies so replays are byte-identical. While
+    replaying, every pause() is skipped, so a run measures pure extraction
+    throughput; requests missing from the archive are aborted, never sent.
+    With no mode the session is a pass-through and pause() just sleeps.
+
+    Pooled contexts record to one file per worker (`run.w0.har`, `run.w1.har`, ...);
+    replaying loads the main file and all worker files into every context.
+    Deliberately free of config lookups so it can be used from both the v2
+    package and the legacy `scraper/` scripts.
+    """
+
+    def __init__(self, mode: Optional[str] = None, path: Optional[str] = None):
+        if mode not in (None, RECORD, REPLAY):
+            raise ValueError(f"Unknown HAR mode: {mode}")
+        if mode and not path:
+            raise ValueError(f"HAR {mode} needs a file path")
+        self.mode = mode
+        self.path = os.path.abspath(path) if path else None
+        if mode == REPLAY and not self.replay_files():
+            raise FileNotFoundError(f"No HAR archive found at {self.path}")
+
+    @property
+    def recording(self) -> bool:
+        return self.mode == RECORD
+
+    @property
+    def replaying(self) -> bool:
+        return self.mode == REPLAY
+
+    def worker_path(self, worker: Optional[int] = None) -> str:
+        """Archive path for the whole run, or for one pooled worker"""
+        if worker is None:
+            return self.path
+        root, ext = os.path.splitext(self.path)
+        return f"{root}.w{worker}{ext or '.har'}"
+
+    def replay_files(self) -> List[str]:
+        root, ext = os.path.splitext(self.path)
+        files = [self.path] if os.path.exists(self.path) else []
+        return files + sorted(glob.glob(f"{glob.escape(root)}.w*{ext or '.har'}"))
+
+    def context_options(self, worker: Optional[int] = None) -> Dict[str, Any]:
+        """Extra new_context() / launch_persistent_context() options for recording"""
+        if not self.recording:
+            return {}
+        path = self.worker_path(worker)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        return {
+            "record_har_path": path,
+            "record_har_content": "embed",
+            "record_har_mode": "full",
+        }
+
+    def apply(self, context):
+        """Serve a sync BrowserContext from the recorded archives"""
+        for index, path in enumerate(self.replay_files() if self.replaying else []):
+            # Routes run newest first: only the first registered archive aborts unknown requests
+            context.route_from_har(path, not_found="abort" if index == 0 else "fallback")
+
+    async def apply_async(self, context):
+        """Serve an async BrowserContext from the recorded archives"""
+        for index, path in enumerate(self.replay_files() if self.replaying else []):
+            await context.route_from_har(path, not_found="abort" if index == 0 else "fallback")
+
+    def pause(self, seconds: float):
+        """Pacing delay between requests; skipped while replaying"""
+        if not self.replaying:
+            time.sleep(seconds)
+
+    async def pause_async(self, seconds: float):
+        import asyncio
+
+        if not self.replaying:
+            await asyncio.sleep(seconds)
+
+    def describe(self) -> str:
+        if self.recording:
+            return f"Recording traffic to {self.path}"
+        if self.replaying:
+            return f"Replaying {len(self.replay_files())} HAR archive(s) from {self.path}, pacing disabled"
+        return "Live network"
@@ -0,0 +1,160 @@
+import asyncio
+import inspect
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+# Queue marker: the upstream stage has finished
+_DONE = object()
+
+
+class StageStats:
+    """Per-stage counters; `starved` and `blocked` show which side of a stage is the bottleneck"""
+
+    def __init__(self, name: str, workers: int):
+        self.name = name
+        self.workers = workers
+        self.received = 0
+        self.emitted = 0
+        self.dropped = 0
+        self.failed = 0
+        self.busy_seconds = 0.0     # inside the handler, summed over workers
+        self.starved_seconds = 0.0  # waiting for input from upstream
+        self.blocked_seconds = 0.0  # waiting for room in the downstream queue (backpressure)
+
+    def as_dict(self, elapsed: float) -> Dict[str, Any]:
+        return {
+            "workers": self.workers,
+            "received": self.received,
+            "emitted": self.emitted,
+            "dropped": self.dropped,
+            "failed": self.failed,
+            "items_per_second": round(self.received / elapsed, 2) if elapsed else 0.0,
+            "utilization": round(self.busy_seconds / (self.workers * elapsed), 3) if elapsed else 0.0,
+            "busy_seconds": round(self.busy_seconds, 2),
+            "starved_seconds": round(self.starved_seconds, 2),
+            "blocked_seconds": round(self.blocked_seconds, 2),
+        }
+
+
+class Stage:
+    """
+    One step of a Pipeline: `handler(item)` runs on `workers` concurrent tasks.
+    Async handlers run on the event loop, plain functions in a worker thread.
+    The handler returns the item for the next stage or None to drop it; with
+    `fan_out` it returns an iterable of items (a profile -> its posts).
+    """
+
+    def __init__(self, name: str, handler: Callable[[Any], Any], workers: int = 1,
+                 queue_size: Optional[int] = None, fan_out: bool = False):
+        self.name = name
+        self.handler = handler
+        self.workers = max(1, int(workers))
+        self.queue_size = queue_size
+        self.fan_out = fan_out
+        self.stats = StageStats(name, self.workers)
+        self._is_async = inspect.iscoroutinefunction(handler)
+
+    async def call(self, item: Any) -> Any:
+        if self._is_async:
+            return await self.handler(item)
+        return await asyncio.to_thread(self.handler, item)
+
+
+class Pipeline:
+    """
+    Stages connected by bounded queues, all running at once: while the browser
+    stage opens the next profile, the parse stage works on the previous one and
+    the sink stage writes what is already parsed. A full queue makes its producer
+    wait (backpressure), so the slowest stage sets the pace and memory stays
+    bounded instead of every stage finishing before the next one starts.
+
+    A failing item is counted and dropped; the other items keep flowing.
+    Deliberately free of config lookups so it can be used from `scraper/` too.
+    """
+
+    def __init__(self, stages: List[Stage], queue_size: int = 8):
+        if not stages:
+            raise ValueError("a pipeline needs at least one stage")
+        self.stages = stages
+        self.queue_size = queue_size
+        self.elapsed = 0.0
+
+    async def run(self, items: Iterable[Any]) -> List[Any]:
+        """Feed `items` through every stage; returns what the last stage emitted, in completion order"""
+        inboxes = [asyncio.Queue(maxsize=stage.queue_size or max(self.queue_size, stage.workers))
+                   for stage in self.stages]
+        results: List[Any] = []
+
+        async def feed():
+            for item in items:
+                await inboxes[0].put(item)
+            for _ in range(self.stages[0].workers):
+                await inboxes[0].put(_DONE)
+
+        async def drain(index: int):
+            stage = self.stages[index]
+            outbox = inboxes[index + 1] if index + 1 < len(inboxes) else None
+            await asyncio.gather(*[self._work(stage, inboxes[index], outbox, results) for _ in range(stage.workers)])
+            if outbox is not None:
+                for _ in range(self.stages[index + 1].workers):
+                    await outbox.put(_DONE)
+
+        started = time.monotonic()
+        try:
+            await asyncio.gather(feed(), *[drain(index) for index in range(len(self.stages))])
+        finally:
+            self.elapsed = time.monotonic() - started
+        return results
+
+    def run_sync(self, items: Iterable[Any]) -> List[Any]:
+        """Blocking wrapper around run() for synchronous callers"""
+        return asyncio.run(self.run(items))
+
+    async def _work(self, stage: Stage, inbox: asyncio.Queue, outbox: Optional[asyncio.Queue], results: List[Any]):
+        stats = stage.stats
+        while True:
+            waited = time.monotonic()
+            item = await inbox.get()
+            stats.starved_seconds += time.monotonic() - waited
+            if item is _DONE:
+                return
+            stats.received += 1
+
+            started = time.monotonic()
+            try:
+                result = await stage.call(item)
+            except Exception as e:
+                stats.failed += 1
+                print(f"Pipeline stage {stage.name} failed: {e}")
+                continue
+            finally:
+                stats.busy_seconds += time.monotonic() - started
+
+            outputs = [] if result is None else (result if stage.fan_out else [result])
+            emitted = 0
+            for output in outputs:
+                if output is None:
+                    continue
+                emitted += 1
+                if outbox is None:
+                    results.append(output)
+                    continue
+                waited = time.monotonic()
+                await outbox.put(output)
+                stats.blocked_seconds += time.monotonic() - waited
+            stats.emitted += emitted
+            if not emitted:
+                stats.dropped += 1
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {stage.name: stage.stats.as_dict(self.elapsed) for stage in self.stages}
+
+    def report(self) -> str:
+        lines = [f"Pipeline ({self.elapsed:.1f}s):"]
+        for name, stats in self.as_dict().items():
+            lines.append(
+                f"  {name}: {stats['workers']} workers, {stats['received']} in, {stats['emitted']} out, "
+                f"{stats['failed']} failed, {stats['items_per_second']}/s, {stats['utilization']:.0%} busy, "
+                f"starved {stats['starved_seconds']}s, blocked {stats['blocked_seconds']}s"
+            )
+        return "\n".join(lines)
@@ -0,0 +1,228 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Set, Tuple
+from playwright.async_api import async_playwright, Browser, BrowserContext, Page, Playwright
+
+# A pool job receives a page owned by one worker slot and the target to scrape
+Handler = Callable[[Page, Any], Awaitable[Any]]
+
+
+class BrowserPool:
+    """
+    Async worker pool running N isolated browser contexts inside one Chromium process.
+
+    Every worker owns its own context (cookies, cache and storage are not shared)
+    and opens `concurrency` pages in it. All slots pull targets from one job queue
+    and push `(index, target, result)` tuples onto the shared `results` queue, so
+    consumers can start working while the sweep is still running.
+
+    Long-running callers (the `serve` daemon) use call() instead of run(): every
+    slot keeps one page open, jobs lease an idle page, and recycle() swaps the
+    contexts for fresh ones without interrupting jobs in flight.
+
+    Deliberately free of config lookups so it can be used from both the v2 package
+    and the legacy `scraper/` scripts.
+    """
+
+    def __init__(
+        self,
+        workers: int = 4,
+        concurrency: int = 1,
+        headless: bool = True,
+        launch_args: Optional[List[str]] = None,
+        context_options: Optional[Dict[str, Any]] = None,
+        timeout: Optional[int] = None,
+        route_policy=None,
+        har=None,
+    ):
+        self.workers = max(1, int(workers))
+        self.concurrency = max(1, int(concurrency))
+        self.headless = headless
+        self.launch_args = launch_args or ["--disable-blink-features=AutomationControlled"]
+        self.context_options = context_options or {}
+        self.timeout = timeout
+        # Optional RoutePolicy shared by all contexts, so its counters cover the whole run
+        self.route_policy = route_policy
+        # Optional HarSession: one archive per worker when recording, all archives when replaying
+        self.har = har
+
+        self.playwright: Optional[Playwright] = None
+        self.browser: Optional[Browser] = None
+        self.contexts: List[BrowserContext] = []
+        self.results: "asyncio.Queue[Tuple[int, Any, Any]]" = None
+        # Idle long-lived pages for call(), and contexts waiting for their last job to finish
+        self._idle: "Optional[asyncio.Queue[Page]]" = None
+        self._retired: Set[BrowserContext] = set()
+        self.generation = 0
+
+    async def __aenter__(self) -> "BrowserPool":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.stop()
+
+    async def start(self):
+        """Launch one browser and create an isolated context per worker"""
+        self.playwright = await async_playwright().start()
+        self.browser = await self.playwright.chromium.launch(
+            headless=self.headless,
+            args=self.launch_args,
+        )
+        for worker in range(self.workers):
+            self.contexts.append(await self._new_context(worker))
+
+    async def _new_context(self, worker: int) -> BrowserContext:
+        har_options = self.har.context_options(worker) if self.har else {}
+        context = await self.browser.new_context(**self.context_options, **har_options)
+        if self.timeout:
+            context.set_default_timeout(self.timeout)
+        if self.route_policy:
+            await self.route_policy.apply_async(context)
+        if self.har:
+            await self.har.apply_async(context)
+        return context
+
+    async def stop(self):
+        """Close all contexts and the shared browser"""
+        for context in self.contexts + list(self._retired):
+            try:
+                await context.close()
+            except Exception:
+                pass
+        self.contexts = []
+        self._retired = set()
+        self._idle = None
+        if self.browser:
+            await self.browser.close()
+            self.browser = None
+        if self.playwright:
+            await self.playwright.stop()
+            self.playwright = None
+
+    async def run(self, targets: Iterable[Any], handler: Handler) -> List[Any]:
+        """
+        Run `handler(page, target)` for every target and return the results
+        in input order. Failed jobs yield None.
+        """
+        if not self.browser:
+            await self.start()
+
+        targets = list(targets)
+        jobs: asyncio.Queue = asyncio.Queue()
+        for index, target in enumerate(targets):
+            jobs.put_nowait((index, target))
+        self.results = asyncio.Queue()
+
+        slots = [
+            self._slot(context, jobs, handler)
+            for context in self.contexts
+            for _ in range(self.concurrency)
+        ]
+        await asyncio.gather(*slots)
+
+        ordered: List[Any] = [None] * len(targets)
+        while not self.results.empty():
+            index, _, result = self.results.get_nowait()
+            ordered[index] = result
+        return ordered
+
+    def run_sync(self, targets: Iterable[Any], handler: Handler) -> List[Any]:
+        """Blocking wrapper around run() for synchronous callers"""
+        async def _main():
+            async with self:
+                return await self.run(targets, handler)
+
+        return asyncio.run(_main())
+
+    async def call(self, target: Any, handler: Handler) -> Any:
+        """Run one job on the next idle long-lived page; exceptions propagate to the caller"""
+        if not self.browser:
+            await self.start()
+        if self._idle is None:
+            self._idle = asyncio.Queue()
+            for context in self.contexts:
+                await self._open_slots(context)
+
+        page = await self._lease()
+        try:
+            return await handler(page, target)
+        finally:
+            await self._release(page)
+
+    async def recycle(self):
+        """
+        Replace every context with a fresh one (new cookies, cache and storage).
+        Idle pages of the old contexts are closed right away; busy ones when their job ends.
+        """
+        if not self.browser:
+            return
+        old_contexts = list(self.contexts)
+        self.contexts = [await self._new_context(worker) for worker in range(self.workers)]
+        self.generation += 1
+        if self._idle is None:
+            for context in old_contexts:
+                await context.close()
+            return
+
+        self._retired.update(old_contexts)
+        for context in self.contexts:
+            await self._open_slots(context)
+        # Drain the idle queue once: retired pages are closed, fresh ones go back
+        for _ in range(self._idle.qsize()):
+            page = self._idle.get_nowait()
+            if page.context in self._retired:
+                await self._close_retired(page)
+            else:
+                self._idle.put_nowait(page)
+
+    async def _open_slots(self, context: BrowserContext):
+        for _ in range(self.concurrency):
+            self._idle.put_nowait(await context.new_page())
+
+    async def _lease(self) -> Page:
+        while True:
+            page = await self._idle.get()
+            if page.context not in self._retired:
+                return page
+            await self._close_retired(page)
+
+    async def _release(self, page: Page):
+        if page.context in self._retired:
+            await self._close_retired(page)
+        elif page.is_closed():
+            # The job crashed the page: give the slot a new one
+            self._idle.put_nowait(await page.context.new_page())
+        else:
+            self._idle.put_nowait(page)
+
+    async def _close_retired(self, page: Page):
+        context = page.context
+        try:
+            await page.close()
+        except Exception:
+            pass
+        if not context.pages:
+            self._retired.discard(context)
+            try:
+                await context.close()
+            except Exception:
+                pass
+
+    async def _slot(self, context: BrowserContext, jobs: asyncio.Queue, handler: Handler):
+        """One concurrency slot: a single page draining the shared job queue"""
+        page = await context.new_page()
+        try:
+            while True:
+                try:
+                    index, target = jobs.get_nowait()
+                except asyncio.QueueEmpty:
+                    break
+
+                try:
+                    result = await handler(page, target)
+                except Exception as e:
+                    print(f"Pool job failed for {target}: {e}")
+                    result = None
+                await self.results.put((index, target, result))
+        finally:
+            await page.close()
@@ -0,0 +1,222 @@
+import os
+import random
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Optional
+from urllib.parse import urlparse
+
+# Shared by every worker and process on this machine (instagram_scraper_v2/data/ratelimit.db)
+DEFAULT_STATE_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "..", "..", "data", "ratelimit.db"
+)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS buckets (
+    name TEXT PRIMARY KEY,
+    rate REAL NOT NULL,             -- current allowed navigations per minute
+    tokens REAL NOT NULL,
+    updated_at REAL NOT NULL,       -- unix time of the last refill
+    cooldown_until REAL DEFAULT 0,
+    strikes INTEGER DEFAULT 0,      -- consecutive login walls / 429s
+    requests INTEGER DEFAULT 0,
+    blocks INTEGER DEFAULT 0
+)
+"""
+
+
+class RateLimiter:
+    """
+    Token bucket per host for every page navigation, shared through a SQLite file
+    so all pooled workers, the daemon and parallel CLI runs draw from one budget.
+
+    Login walls and HTTP 429s call penalize(): the host goes into an exponential
+    cooldown (base * 2^strikes, capped) and its rate is halved. Every clean
+    navigation calls success(), which clears a strike and raises the rate again
+    in small steps up to `max_rate_per_minute` (AIMD), so throughput climbs back
+    on its own instead of through hand-tuned sleeps.
+    Deliberately free of config lookups so it can be used from `scraper/` too.
+    """
+
+    def __init__(
+        self,
+        state_path: str = DEFAULT_STATE_PATH,
+        rate_per_minute: float = 20,
+        max_rate_per_minute: float = 40,
+        min_rate_per_minute: float = 2,
+        burst: float = 3,
+        increase_per_success: float = 0.5,
+        backoff_base_seconds: float = 60,
+        max_cooldown_seconds: float = 1800,
+    ):
+        self.state_path = os.path.abspath(state_path)
+        self.rate_per_minute = rate_per_minute
+        self.max_rate_per_minute = max_rate_per_minute
+        self.min_rate_per_minute = min_rate_per_minute
+        self.burst = burst
+        self.increase_per_success = increase_per_success
+        self.backoff_base_seconds = backoff_base_seconds
+        self.max_cooldown_seconds = max_cooldown_seconds
+        self.waited_seconds = 0.0
+
+        os.makedirs(os.path.dirname(self.state_path), exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.state_path, timeout=30, isolation_level=None,
+                                     check_same_thread=False)
+        self._conn.execute(SCHEMA)
+
+    @classmethod
+    def from_config(cls, settings: Optional[Dict[str, Any]], state_path: Optional[str] = None) -> Optional["RateLimiter"]:
+        """Build a limiter from the `rate_limit` section of settings.yaml (None when disabled)"""
+        if not settings or not settings.get("enabled", False):
+            return None
+        options = {k: v for k, v in settings.items() if k not in ("enabled", "state_path")}
+        return cls(state_path=state_path or DEFAULT_STATE_PATH, **options)
+
+    @staticmethod
+    def bucket_for(url: str) -> str:
+        host = urlparse(url if "//" in url else f"https://{url}").netloc.lower()
+        return host[4:] if host.startswith("www.") else host
+
+    # --- navigation hooks ---
+
+    def acquire(self, url: str) -> float:
+        """Block until the host of `url` may be navigated to; returns the seconds waited"""
+        bucket = self.bucket_for(url)
+        waited = 0.0
+        while True:
+            delay = self._take(bucket)
+            if delay <= 0:
+                self.waited_seconds += waited
+                return waited
+            time.sleep(delay)
+            waited += delay
+
+    async def acquire_async(self, url: str) -> float:
+        import asyncio
+
+        bucket = self.bucket_for(url)
+        waited = 0.0
+        while True:
+            delay = self._take(bucket)
+            if delay <= 0:
+                self.waited_seconds += waited
+                return waited
+            await asyncio.sleep(delay)
+            waited += delay
+
+    def success(self, url: str):
+        """A navigation went through cleanly"""
+        with self._transaction() as conn:
+            conn.execute(
+                """UPDATE buckets SET strikes = MAX(strikes - 1, 0), rate = MIN(rate + ?, ?)
+                   WHERE name = ?""",
+                (self.increase_per_success, self.max_rate_per_minute, self.bucket_for(url)),
+            )
+
+    def penalize(self, url: str, reason: str = "blocked") -> float:
+        """A login wall or 429 was hit: cool the host down; returns the cooldown in seconds"""
+        bucket = self.bucket_for(url)
+        now = time.time()
+        with self._transaction() as conn:
+            state = self._state(conn, bucket, now)
+            strikes = state["strikes"] + 1
+            cooldown = min(self.backoff_base_seconds * 2 ** (strikes - 1), self.max_cooldown_seconds)
+            cooldown *= random.uniform(0.8, 1.2)
+            conn.execute(
+                """UPDATE buckets SET strikes = ?, blocks = blocks + 1, tokens = 0,
+                          rate = MAX(rate / 2, ?), cooldown_until = MAX(cooldown_until, ?)
+                   WHERE name = ?""",
+                (strikes, self.min_rate_per_minute, now + cooldown, bucket),
+            )
+        print(f"Rate limiter: {reason} on {bucket}, cooling down {cooldown:.0f}s (strike {strikes})")
+        return cooldown
+
+    # --- reporting ---
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Current rate, tokens and cooldown of every host"""
+        now = time.time()
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT name, rate, tokens, cooldown_until, strikes, requests, blocks FROM buckets"
+            ).fetchall()
+        return {
+            name: {
+                "rate_per_minute": round(rate, 2),
+                "tokens": round(tokens, 2),
+                "cooldown_seconds": max(0, round(cooldown_until - now)),
+                "strikes": strikes,
+                "requests": requests,
+                "blocks": blocks,
+            }
+            for name, rate, tokens, cooldown_until, strikes, requests, blocks in rows
+        }
+
+    def report(self) -> str:
+        lines = [f"Rate limiter ({self.waited_seconds:.1f}s spent waiting this run):"]
+        for name, state in sorted(self.as_dict().items()):
+            cooling = f", cooling down {state['cooldown_seconds']}s" if state["cooldown_seconds"] else ""
+            lines.append(f"  {name}: {state['rate_per_minute']}/min, {state['requests']} requests, "
+                         f"{state['blocks']} blocks{cooling}")
+        return "\n".join(lines)
+
+    # --- internals ---
+
+    def _take(self, bucket: str) -> float:
+        """Consume one token if possible, else return how long to wait for one"""
+        now = time.time()
+        with self._transaction() as conn:
+            state = self._state(conn, bucket, now)
+            if state["cooldown_until"] > now:
+                return state["cooldown_until"] - now
+
+            per_second = state["rate"] / 60.0
+            tokens = min(self.burst, state["tokens"] + (now - state["updated_at"]) * per_second)
+            if tokens >= 1:
+                conn.execute(
+                    "UPDATE buckets SET tokens = ?, updated_at = ?, requests = requests + 1 WHERE name = ?",
+                    (tokens - 1, now, bucket),
+                )
+                return 0.0
+            conn.execute("UPDATE buckets SET tokens = ?, updated_at = ? WHERE name = ?", (tokens, now, bucket))
+            return (1 - tokens) / per_second
+
+    def _state(self, conn: sqlite3.Connection, bucket: str, now: float) -> Dict[str, Any]:
+        row = conn.execute(
+            "SELECT rate, tokens, updated_at, cooldown_until, strikes FROM buckets WHERE name = ?", (bucket,)
+        ).fetchone()
+        if row is None:
+            conn.execute(
+                "INSERT INTO buckets (name, rate, tokens, updated_at) VALUES (?, ?, ?, ?)",
+                (bucket, self.rate_per_minute, self.burst, now),
+            )
+            row = (self.rate_per_minute, self.burst, now, 0, 0)
+        return dict(zip(("rate", "tokens", "updated_at", "cooldown_until", "strikes"), row))
+
+    def _transaction(self):
+        return _Transaction(self._conn, self._lock)
+
+
+class _Transaction:
+    """BEGIN IMMEDIATE ... COMMIT: one writer across threads and processes"""
+
+    def __init__(self, conn: sqlite3.Connection, lock: threading.Lock):
+        self.conn = conn
+        self.lock = lock
+
+    def __enter__(self) -> sqlite3.Connection:
+        self.lock.acquire()
+        try:
+            self.conn.execute("BEGIN IMMEDIATE")
+        except BaseException:
+            # __exit__ only runs once __enter__ returned; "database is locked" must not leak the lock
+            self.lock.release()
+            raise
+        return self.conn
+
+    def __exit__(self, exc_type, *exc):
+        try:
+            self.conn.execute("ROLLBACK" if exc_type else "COMMIT")
+        finally:
+            self.lock.release()
@@ -0,0 +1,114 @@
+import re
+from typing import Any, Dict, Iterable, Optional
+
+# Resource types we never need for text/metadata scraping
+DEFAULT_BLOCKED_TYPES = ("image", "media", "font")
+
+# Rough transfer sizes (bytes) used to estimate what a blocked request would have cost
+DEFAULT_ESTIMATED_SIZES = {
+    "image": 60_000,
+    "media": 1_000_000,
+    "font": 40_000,
+    "stylesheet": 30_000,
+    "script": 80_000,
+    "other": 5_000,
+}
+
+
+class RouteStats:
+    """Per-run counters of requests allowed and blocked by a RoutePolicy"""
+
+    def __init__(self, estimated_sizes: Optional[Dict[str, int]] = None):
+        self.estimated_sizes = estimated_sizes or DEFAULT_ESTIMATED_SIZES
+        self.allowed = 0
+        self.blocked: Dict[str, int] = {}
+        self.bytes_saved_estimate = 0
+
+    def record_blocked(self, resource_type: str):
+        self.blocked[resource_type] = self.blocked.get(resource_type, 0) + 1
+        self.bytes_saved_estimate += self.estimated_sizes.get(
+            resource_type, self.estimated_sizes.get("other", 0)
+        )
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "allowed": self.allowed,
+            "blocked": sum(self.blocked.values()),
+            "blocked_by_type": dict(self.blocked),
+            "bytes_saved_estimate": self.bytes_saved_estimate,
+        }
+
+    def report(self) -> str:
+        stats = self.as_dict()
+        by_type = ", ".join(f"{k}={v}" for k, v in sorted(self.blocked.items())) or "none"
+        return (
+            f"Request routing: {stats['allowed']} allowed, {stats['blocked']} blocked ({by_type}), "
+            f"~{stats['bytes_saved_estimate'] / 1_000_000:.1f} MB saved"
+        )
+
+
+class RoutePolicy:
+    """
+    Allow/deny rules applied through context.route() before any byte is downloaded.
+
+    A request is blocked when its resource type is in `block_resource_types` or its
+    URL matches one of `block_url_patterns`, unless it matches an `allow_url_patterns`
+    entry (allow always wins). Patterns are regular expressions searched in the URL.
+    """
+
+    def __init__(
+        self,
+        block_resource_types: Iterable[str] = DEFAULT_BLOCKED_TYPES,
+        block_url_patterns: Iterable[str] = (),
+        allow_url_patterns: Iterable[str] = (),
+        estimated_sizes: Optional[Dict[str, int]] = None,
+    ):
+        self.block_resource_types = set(block_resource_types)
+        self.block_url_patterns = [re.compile(p) for p in block_url_patterns]
+        self.allow_url_patterns = [re.compile(p) for p in allow_url_patterns]
+        self.stats = RouteStats(estimated_sizes)
+
+    @classmethod
+    def from_config(cls, settings: Optional[Dict[str, Any]]) -> Optional["RoutePolicy"]:
+        """Build a policy from the `routing` section of settings.yaml (None when disabled)"""
+        if not settings or not settings.get("enabled", False):
+            return None
+        return cls(
+            block_resource_types=settings.get("block_resource_types", DEFAULT_BLOCKED_TYPES),
+            block_url_patterns=settings.get("block_url_patterns", []),
+            allow_url_patterns=settings.get("allow_url_patterns", []),
+            estimated_sizes=settings.get("estimated_sizes"),
+        )
+
+    def should_block(self, url: str, resource_type: str) -> bool:
+        if any(p.search(url) for p in self.allow_url_patterns):
+            return False
+        if resource_type in self.block_resource_types:
+            return True
+        return any(p.search(url) for p in self.block_url_patterns)
+
+    def apply(self, context):
+        """Install the policy on a sync BrowserContext"""
+        context.route("**/*", self._handle)
+
+    async def apply_async(self, context):
+        """Install the policy on an async BrowserContext"""
+        await context.route("**/*", self._handle_async)
+
+    def _handle(self, route):
+        request = route.request
+        if self.should_block(request.url, request.resource_type):
+            self.stats.record_blocked(request.resource_type)
+            route.abort()
+        else:
+            self.stats.allowed += 1
+            route.continue_()
+
+    async def _handle_async(self, route):
+        request = route.request
+        if self.should_block(request.url, request.resource_type):
+            self.stats.record_blocked(request.resource_type)
+            await route.abort()
+        else:
+            self.stats.allowed += 1
+            await route.continue_()
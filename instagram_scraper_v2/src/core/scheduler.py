@@ -0,0 +1,264 @@
+import os
+import sqlite3
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, List, Optional
+from src.core.watermark import DEFAULT_DB_PATH, canonical_url, club_key, connect_scraped_clubs
+
+# Learned per-club statistics, added to scraped_clubs on first use (schema.sql has them too)
+SCHEDULE_COLUMNS = (
+    ("post_rate", "REAL"),          # new posts per day (EWMA)
+    ("posts_seen", "INTEGER"),      # new posts checked over all runs
+    ("events_found", "INTEGER"),    # events extracted from them
+    ("avg_scrape_seconds", "REAL"), # cost of one visit (EWMA)
+    ("next_due", "DATETIME"),
+    ("priority", "REAL"),
+)
+
+DEFAULT_POST_RATE = 0.5      # posts/day assumed for clubs without history
+DEFAULT_SCRAPE_SECONDS = 30.0
+SMOOTHING = 0.3              # EWMA weight of the latest observation
+MIN_INTERVAL = timedelta(hours=6)
+MAX_INTERVAL = timedelta(days=14)
+UPCOMING_WINDOW_DAYS = 14    # clubs with an event this close post about it more often
+
+
+class ClubSchedule:
+    """Learned cadence and current standing of one club"""
+
+    def __init__(self, key: str, name: str, url: str, **stats):
+        self.key = key
+        self.name = name
+        self.url = url
+        self.last_scraped: Optional[datetime] = stats.get("last_scraped")
+        self.post_rate: Optional[float] = stats.get("post_rate")
+        self.posts_seen: int = stats.get("posts_seen") or 0
+        self.events_found: int = stats.get("events_found") or 0
+        self.avg_scrape_seconds: float = stats.get("avg_scrape_seconds") or DEFAULT_SCRAPE_SECONDS
+        self.next_event: Optional[datetime] = None
+        self.priority = 0.0
+        self.next_due: Optional[datetime] = None
+
+    @property
+    def event_yield(self) -> float:
+        """Share of new posts that turned out to be events (Laplace-smoothed)"""
+        return (self.events_found + 1) / (self.posts_seen + 2)
+
+    def upcoming_boost(self, now: datetime) -> float:
+        if not self.next_event:
+            return 1.0
+        days = (self.next_event - now).total_seconds() / 86400
+        if days > UPCOMING_WINDOW_DAYS:
+            return 1.0
+        return 1.0 + (UPCOMING_WINDOW_DAYS - max(days, 0)) / UPCOMING_WINDOW_DAYS
+
+    def update_standing(self, now: datetime):
+        """Recompute priority (expected new events) and the next due time"""
+        rate = self.post_rate if self.post_rate is not None else DEFAULT_POST_RATE
+        boost = self.upcoming_boost(now)
+        if self.last_scraped is None:
+            # Never scraped: due now, ahead of everything with history
+            self.priority = float("inf")
+            self.next_due = now
+            return
+
+        elapsed_days = max((now - self.last_scraped).total_seconds() / 86400, 0)
+        self.priority = rate * elapsed_days * self.event_yield * boost
+        interval = timedelta(days=1 / rate) / boost if rate > 0 else MAX_INTERVAL
+        self.next_due = self.last_scraped + min(max(interval, MIN_INTERVAL), MAX_INTERVAL)
+
+
+class ClubScheduler:
+    """
+    Adaptive per-club crawl scheduler backed by scraped_clubs in hive.db.
+
+    Each club carries an EWMA of its posting rate, the share of its posts that
+    became events and the cost of a visit. plan() returns the clubs that are
+    due, ordered by expected new events per second of scraping, and cut to a
+    time budget; clubs with an event in the next two weeks are boosted and
+    come due sooner, dormant clubs drift out to a two-week interval. record()
+    feeds the outcome of a visit back and save() persists it.
+    Deliberately free of config lookups so it can be used from `scraper/` too.
+    """
+
+    def __init__(self, db_path: str = DEFAULT_DB_PATH):
+        self.db_path = os.path.abspath(db_path)
+        self.clubs: Dict[str, ClubSchedule] = {}
+        self.inactive: set = set()
+        self.recorded: set = set()
+        self.enabled = os.path.exists(self.db_path)
+        if self.enabled:
+            self._load()
+        else:
+            print(f"Schedule database not found at {self.db_path}, scraping every club")
+
+    def _connect(self) -> sqlite3.Connection:
+        return connect_scraped_clubs(self.db_path, SCHEDULE_COLUMNS)
+
+    def _load(self):
+        try:
+            conn = self._connect()
+        except sqlite3.Error as e:
+            print(f"Scheduler disabled: {e}")
+            self.enabled = False
+            return
+
+        try:
+            conn.row_factory = sqlite3.Row
+            rows = conn.execute("SELECT * FROM scraped_clubs").fetchall()
+            # Upcoming events per club name (events reference clubs, not scraped_clubs);
+            # compared by day, so date-only events happening today still count
+            upcoming = conn.execute(
+                """SELECT LOWER(c.name) AS name, MIN(e.event_date) AS next_event
+                   FROM events e JOIN clubs c ON e.club_id = c.id
+                   WHERE e.event_date >= ? AND e.status != 'archived'
+                   GROUP BY LOWER(c.name)""",
+                (_now().date().isoformat(),),
+            ).fetchall()
+        finally:
+            conn.close()
+
+        next_events = {row["name"]: _parse(row["next_event"]) for row in upcoming}
+        for row in rows:
+            key = club_key(row["instagram_url"])
+            if not row["is_active"]:
+                self.inactive.add(key)
+                continue
+            club = ClubSchedule(
+                key, row["name"], row["instagram_url"],
+                last_scraped=_parse(row["last_scraped"]),
+                post_rate=row["post_rate"],
+                posts_seen=row["posts_seen"],
+                events_found=row["events_found"],
+                avg_scrape_seconds=row["avg_scrape_seconds"],
+            )
+            club.next_event = next_events.get((row["name"] or "").lower())
+            self.clubs[key] = club
+
+    def _club(self, url: str, name: Optional[str] = None) -> ClubSchedule:
+        key = club_key(url)
+        if key not in self.clubs:
+            self.clubs[key] = ClubSchedule(key, name or key, canonical_url(key))
+        return self.clubs[key]
+
+    def plan(self, clubs: Iterable[Dict[str, Any]], budget_seconds: Optional[float] = None,
+             now: Optional[datetime] = None) -> List[Dict[str, Any]]:
+        """
+        Pick the clubs to scrape this run from `clubs` ({name, instagram_url} dicts):
+        due clubs by expected events per second, until `budget_seconds` of estimated
+        scraping time is used up. Other scraped_clubs rows (accounts v2 keeps a
+        watermark for) are never added.
+        """
+        now = now or _now()
+        candidates = {}
+        for club in clubs:
+            key = club_key(club["instagram_url"])
+            if key not in self.inactive:
+                candidates[key] = club
+
+        due = []
+        for key, club in candidates.items():
+            schedule = self._club(club["instagram_url"], club.get("name"))
+            schedule.update_standing(now)
+            if schedule.next_due <= now:
+                due.append((club, schedule))
+
+        due.sort(key=lambda item: item[1].priority / item[1].avg_scrape_seconds, reverse=True)
+        selected, spent = [], 0.0
+        for club, schedule in due:
+            if budget_seconds is not None and selected and spent + schedule.avg_scrape_seconds > budget_seconds:
+                continue
+            selected.append(club)
+            spent += schedule.avg_scrape_seconds
+
+        print(f"Scheduler: {len(due)} of {len(candidates)} clubs due, "
+              f"{len(selected)} selected (~{spent / 60:.1f} min estimated)")
+        return selected
+
+    def record(self, url: str, name: str, new_posts: int, events: int, seconds: float,
+               now: Optional[datetime] = None):
+        """Feed back the outcome of one club visit"""
+        now = now or _now()
+        schedule = self._club(url, name)
+        if schedule.last_scraped is not None:
+            elapsed_days = max((now - schedule.last_scraped).total_seconds() / 86400, 1 / 24)
+            observed = new_posts / elapsed_days
+            previous = schedule.post_rate if schedule.post_rate is not None else observed
+            schedule.post_rate = SMOOTHING * observed + (1 - SMOOTHING) * previous
+        schedule.posts_seen += new_posts
+        schedule.events_found += events
+        schedule.avg_scrape_seconds = SMOOTHING * seconds + (1 - SMOOTHING) * schedule.avg_scrape_seconds
+        schedule.last_scraped = now
+        schedule.update_standing(now)
+        self.recorded.add(schedule.key)
+
+    def save(self) -> int:
+        """Persist the statistics of every club recorded this run"""
+        if not self.enabled or not self.recorded:
+            return 0
+
+        conn = self._connect()
+        try:
+            for key in self.recorded:
+                schedule = self.clubs[key]
+                values = (
+                    schedule.post_rate, schedule.posts_seen, schedule.events_found,
+                    schedule.avg_scrape_seconds, _format(schedule.next_due),
+                    schedule.priority, _format(schedule.last_scraped),
+                )
+                conn.execute(
+                    """INSERT INTO scraped_clubs
+                       (post_rate, posts_seen, events_found, avg_scrape_seconds,
+                        next_due, priority, last_scraped, name, instagram_url)
+                       VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                       ON CONFLICT(instagram_url) DO UPDATE SET
+                           post_rate = excluded.post_rate,
+                           posts_seen = excluded.posts_seen,
+                           events_found = excluded.events_found,
+                           avg_scrape_seconds = excluded.avg_scrape_seconds,
+                           next_due = excluded.next_due,
+                           priority = excluded.priority,
+                           last_scraped = excluded.last_scraped""",
+                    values + (schedule.name, schedule.url),
+                )
+            conn.commit()
+        finally:
+            conn.close()
+
+        count = len(self.recorded)
+        self.recorded = set()
+        return count
+
+    def report(self, limit: int = 10) -> str:
+        """The highest-priority clubs and when they are due"""
+        now = _now()
+        for schedule in self.clubs.values():
+            schedule.update_standing(now)
+        ranked = sorted(self.clubs.values(), key=lambda s: s.priority, reverse=True)[:limit]
+        lines = ["Club schedule (priority = expected new events):"]
+        for schedule in ranked:
+            due = "now" if schedule.next_due <= now else schedule.next_due.strftime("%Y-%m-%d %H:%M")
+            rate = f"{schedule.post_rate:.2f}" if schedule.post_rate is not None else "?"
+            lines.append(f"  {schedule.name[:30]:30} priority {schedule.priority:7.2f}  "
+                         f"posts/day {rate:>5}  due {due}")
+        return "\n".join(lines)
+
+
+def _now() -> datetime:
+    """Naive UTC, the format SQLite's CURRENT_TIMESTAMP writes"""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def _parse(value: Optional[str]) -> Optional[datetime]:
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if parsed.tzinfo:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+
+def _format(value: Optional[datetime]) -> Optional[str]:
+    return value.strftime("%Y-%m-%d %H:%M:%S") if value else None
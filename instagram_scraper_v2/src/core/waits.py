@@ -0,0 +1,201 @@
+import json
+import re
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Union
+
+# A response matcher is either a URL regex / substring or a predicate on the response
+ResponseMatcher = Union[str, "re.Pattern", Callable[[Any], bool]]
+
+
+class WaitRecorder:
+    """Collects how long each named wait actually took, so pacing can be tuned from data"""
+
+    def __init__(self):
+        self.samples: Dict[str, List[float]] = {}
+        self.timeouts: Dict[str, int] = {}
+
+    def record(self, name: str, elapsed_ms: float, satisfied: bool):
+        self.samples.setdefault(name, []).append(elapsed_ms)
+        if not satisfied:
+            self.timeouts[name] = self.timeouts.get(name, 0) + 1
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """Per-wait count, timeout count and latency percentiles in ms"""
+        stats = {}
+        for name, values in self.samples.items():
+            ordered = sorted(values)
+            stats[name] = {
+                "count": len(ordered),
+                "timeouts": self.timeouts.get(name, 0),
+                "p50_ms": round(self._percentile(ordered, 0.50), 1),
+                "p95_ms": round(self._percentile(ordered, 0.95), 1),
+                "max_ms": round(ordered[-1], 1),
+                "total_ms": round(sum(ordered), 1),
+            }
+        return stats
+
+    def report(self) -> str:
+        """Human readable summary table"""
+        lines = ["Wait timings (ms):"]
+        for name, s in sorted(self.summary().items()):
+            lines.append(
+                f"  {name:<20} n={s['count']:<4} timeouts={s['timeouts']:<3} "
+                f"p50={s['p50_ms']:<8} p95={s['p95_ms']:<8} max={s['max_ms']}"
+            )
+        return "\n".join(lines)
+
+    def save(self, path: Union[str, Path]):
+        """Write the summary as JSON"""
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.summary(), f, indent=2)
+
+    @staticmethod
+    def _percentile(ordered: List[float], q: float) -> float:
+        if not ordered:
+            return 0.0
+        index = min(len(ordered) - 1, int(round(q * (len(ordered) - 1))))
+        return ordered[index]
+
+
+class Waiter:
+    """
+    Event-driven waits with deadlines, replacing fixed sleeps.
+
+    Every wait returns as soon as its readiness condition holds (or False once the
+    deadline passes) and is timed into `recorder`. `floor_ms` is an optional minimum
+    duration per wait, kept as a politeness floor that can be lowered once the
+    recorded timings show how fast pages actually settle.
+
+    Each wait has a sync variant (for playwright.sync_api pages) and an `_async`
+    variant (for the worker pool).
+    """
+
+    def __init__(self, default_timeout: int = 10000, floor_ms: int = 0,
+                 recorder: Optional[WaitRecorder] = None):
+        self.default_timeout = default_timeout
+        self.floor_ms = floor_ms
+        self.recorder = recorder or WaitRecorder()
+
+    # --- sync waits ---
+
+    def selector(self, page, selector: str, timeout: Optional[int] = None,
+                 state: str = "attached", name: Optional[str] = None) -> bool:
+        """Wait until `selector` reaches `state` (attached, visible, hidden, detached)"""
+        return self._timed(
+            name or f"selector:{selector}",
+            lambda: page.wait_for_selector(selector, state=state, timeout=self._timeout(timeout)),
+        )
+
+    def network_idle(self, page, timeout: Optional[int] = None, name: str = "network_idle") -> bool:
+        """Wait until there are no network connections for at least 500 ms"""
+        return self._timed(
+            name,
+            lambda: page.wait_for_load_state("networkidle", timeout=self._timeout(timeout)),
+        )
+
+    def response(self, page, matcher: ResponseMatcher, timeout: Optional[int] = None,
+                 name: Optional[str] = None) -> Optional[Any]:
+        """Wait for a response (e.g. an XHR) matching `matcher` and return it"""
+        predicate = self._response_predicate(matcher)
+        result = {}
+
+        def wait():
+            result["response"] = page.wait_for_event(
+                "response", predicate=predicate, timeout=self._timeout(timeout)
+            )
+
+        self._timed(name or f"response:{self._label(matcher)}", wait)
+        return result.get("response")
+
+    def condition(self, page, expression: str, arg: Any = None, timeout: Optional[int] = None,
+                  name: str = "condition") -> bool:
+        """Wait until a JS expression/function evaluates truthy in the page"""
+        return self._timed(
+            name,
+            lambda: page.wait_for_function(expression, arg=arg, timeout=self._timeout(timeout)),
+        )
+
+    # --- async waits ---
+
+    async def selector_async(self, page, selector: str, timeout: Optional[int] = None,
+                             state: str = "attached", name: Optional[str] = None) -> bool:
+        return await self._timed_async(
+            name or f"selector:{selector}",
+            page.wait_for_selector(selector, state=state, timeout=self._timeout(timeout)),
+        )
+
+    async def network_idle_async(self, page, timeout: Optional[int] = None,
+                                 name: str = "network_idle") -> bool:
+        return await self._timed_async(
+            name,
+            page.wait_for_load_state("networkidle", timeout=self._timeout(timeout)),
+        )
+
+    async def response_async(self, page, matcher: ResponseMatcher, timeout: Optional[int] = None,
+                             name: Optional[str] = None) -> Optional[Any]:
+        import asyncio
+
+        predicate = self._response_predicate(matcher)
+        task = asyncio.ensure_future(
+            page.wait_for_event("response", predicate=predicate, timeout=self._timeout(timeout))
+        )
+        satisfied = await self._timed_async(name or f"response:{self._label(matcher)}", task)
+        return task.result() if satisfied else None
+
+    async def condition_async(self, page, expression: str, arg: Any = None,
+                              timeout: Optional[int] = None, name: str = "condition") -> bool:
+        return await self._timed_async(
+            name,
+            page.wait_for_function(expression, arg=arg, timeout=self._timeout(timeout)),
+        )
+
+    # --- helpers ---
+
+    def _timeout(self, timeout: Optional[int]) -> int:
+        return self.default_timeout if timeout is None else timeout
+
+    def _timed(self, name: str, wait: Callable[[], Any]) -> bool:
+        start = time.perf_counter()
+        try:
+            wait()
+            satisfied = True
+        except Exception:
+            satisfied = False
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        self.recorder.record(name, elapsed_ms, satisfied)
+
+        if self.floor_ms and elapsed_ms < self.floor_ms:
+            time.sleep((self.floor_ms - elapsed_ms) / 1000.0)
+        return satisfied
+
+    async def _timed_async(self, name: str, awaitable) -> bool:
+        import asyncio
+
+        start = time.perf_counter()
+        try:
+            await awaitable
+            satisfied = True
+        except Exception:
+            satisfied = False
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        self.recorder.record(name, elapsed_ms, satisfied)
+
+        if self.floor_ms and elapsed_ms < self.floor_ms:
+            await asyncio.sleep((self.floor_ms - elapsed_ms) / 1000.0)
+        return satisfied
+
+    @staticmethod
+    def _response_predicate(matcher: ResponseMatcher) -> Callable[[Any], bool]:
+        if callable(matcher):
+            return matcher
+        pattern = matcher if isinstance(matcher, re.Pattern) else re.compile(re.escape(matcher))
+        return lambda response: bool(pattern.search(response.url))
+
+    @staticmethod
+    def _label(matcher: ResponseMatcher) -> str:
+        if isinstance(matcher, re.Pattern):
+            return matcher.pattern
+        if callable(matcher):
+            return getattr(matcher, "__name__", "predicate")
+        return str(matcher)
@@ -0,0 +1,206 @@
+import os
+import re
+import sqlite3
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+# backend/database/hive.db, relative to src/core/watermark.py
+DEFAULT_DB_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "..", "..", "..", "backend", "database", "hive.db"
+)
+
+# Columns added to scraped_clubs on first use (schema.sql has them for new databases)
+WATERMARK_COLUMNS = (
+    ("last_shortcode", "TEXT"),
+    ("last_post_at", "DATETIME"),
+)
+
+_HANDLE_RE = re.compile(r"instagram\.com/([^/?#]+)", re.IGNORECASE)
+_SHORTCODE_RE = re.compile(r"/(?:p|reel)/([^/?#]+)")
+
+
+class Watermark(NamedTuple):
+    """Newest post already handed to a sink for one club"""
+    shortcode: Optional[str]
+    posted_at: Optional[datetime]
+
+
+def club_key(url_or_username: str) -> str:
+    """Normalise an Instagram URL or @username to the bare lowercase handle"""
+    value = (url_or_username or "").strip()
+    match = _HANDLE_RE.search(value)
+    if match:
+        value = match.group(1)
+    return value.strip("@/ ").lower()
+
+
+def canonical_url(key: str) -> str:
+    """instagram_url used for clubs that are not in scraped_clubs yet"""
+    return f"https://www.instagram.com/{key}/"
+
+
+def shortcode_from_url(url: Optional[str]) -> Optional[str]:
+    """Extract the shortcode from a /p/<code>/ (or /reel/<code>/) URL"""
+    match = _SHORTCODE_RE.search(url or "")
+    return match.group(1) if match else None
+
+
+def fresh_posts(posts: Iterable[Dict[str, Any]], mark: Optional[Watermark]) -> List[Dict[str, Any]]:
+    """
+    Posts newer than the watermark, in the order given (newest first).
+
+    `posts` are dicts with `shortcode`, optional `timestamp` (datetime) and optional
+    `pinned`. The walk stops at the first unpinned post that is the watermark itself
+    or older than it. Pinned posts sit above the timeline out of order, so they never
+    stop the walk and are only kept when they are known to be newer than the mark.
+    """
+    if not mark or not (mark.shortcode or mark.posted_at):
+        return list(posts)
+
+    fresh = []
+    for post in posts:
+        timestamp = post.get("timestamp")
+        known = post.get("shortcode") == mark.shortcode or (
+            timestamp is not None and mark.posted_at is not None and timestamp <= mark.posted_at
+        )
+        if post.get("pinned"):
+            if not known and timestamp is not None:
+                fresh.append(post)
+            continue
+        if known:
+            break
+        fresh.append(post)
+    return fresh
+
+
+def newest_post(posts: Iterable[Dict[str, Any]]) -> Optional[Watermark]:
+    """Watermark for the newest unpinned post (by timestamp when known, else list order)"""
+    candidates = [post for post in posts if post.get("shortcode") and not post.get("pinned")]
+    if not candidates:
+        return None
+    dated = [post for post in candidates if post.get("timestamp")]
+    post = max(dated, key=lambda p: p["timestamp"]) if dated else candidates[0]
+    return Watermark(post["shortcode"], post.get("timestamp"))
+
+
+class WatermarkStore:
+    """
+    Per-club incremental scraping watermark kept in the backend's hive.db
+    (`scraped_clubs.last_shortcode` / `last_post_at` / `last_scraped`).
+
+    Scrapers read a club's mark with get() and stage() the newest post they saw;
+    callers commit() a club only after its posts reached a sink, so a failed
+    sink never moves the watermark past unsaved posts. Deliberately free of
+    config lookups so it can be used from both the v2 package and `scraper/`.
+    """
+
+    def __init__(self, db_path: str = DEFAULT_DB_PATH):
+        self.db_path = os.path.abspath(db_path)
+        self.marks: Dict[str, Watermark] = {}
+        self.pending: Dict[str, Tuple[str, Optional[Watermark]]] = {}
+        self._urls: Dict[str, str] = {}
+        self.enabled = os.path.exists(self.db_path)
+        if self.enabled:
+            self._load()
+        else:
+            print(f"Watermark database not found at {self.db_path}, scraping full profiles")
+
+    def _connect(self) -> sqlite3.Connection:
+        return connect_scraped_clubs(self.db_path, WATERMARK_COLUMNS)
+
+    def _load(self):
+        try:
+            conn = self._connect()
+        except sqlite3.Error as e:
+            print(f"Watermarks disabled: {e}")
+            self.enabled = False
+            return
+
+        try:
+            rows = conn.execute(
+                "SELECT instagram_url, last_shortcode, last_post_at FROM scraped_clubs"
+            ).fetchall()
+        finally:
+            conn.close()
+
+        for url, shortcode, posted_at in rows:
+            key = club_key(url)
+            self._urls[key] = url
+            if shortcode or posted_at:
+                self.marks[key] = Watermark(shortcode, _parse(posted_at))
+
+    def get(self, club: str) -> Optional[Watermark]:
+        """Current watermark of a club (URL or username), None for a full scrape"""
+        return self.marks.get(club_key(club))
+
+    def stage(self, club: str, name: str, mark: Optional[Watermark]):
+        """Remember the newest post seen for a club until its posts have been sunk"""
+        key = club_key(club)
+        current = self.marks.get(key)
+        if mark is None or (current and _older(mark, current)):
+            mark = current
+        self.pending[key] = (name or key, mark)
+
+    def commit(self, clubs: Optional[Iterable[str]] = None) -> int:
+        """Persist staged watermarks (all of them, or only `clubs`); returns the count written"""
+        keys = list(self.pending) if clubs is None else [club_key(c) for c in clubs]
+        keys = [key for key in keys if key in self.pending]
+        if not self.enabled or not keys:
+            return 0
+
+        conn = self._connect()
+        try:
+            for key in keys:
+                name, mark = self.pending[key]
+                shortcode = mark.shortcode if mark else None
+                posted_at = mark.posted_at.isoformat() if mark and mark.posted_at else None
+                url = self._urls.setdefault(key, canonical_url(key))
+                conn.execute(
+                    """INSERT INTO scraped_clubs
+                       (name, instagram_url, last_shortcode, last_post_at, last_scraped)
+                       VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP)
+                       ON CONFLICT(instagram_url) DO UPDATE SET
+                           last_shortcode = excluded.last_shortcode,
+                           last_post_at = excluded.last_post_at,
+                           last_scraped = excluded.last_scraped""",
+                    (name, url, shortcode, posted_at),
+                )
+            conn.commit()
+        finally:
+            conn.close()
+
+        for key in keys:
+            _, mark = self.pending.pop(key)
+            if mark:
+                self.marks[key] = mark
+        return len(keys)
+
+
+def connect_scraped_clubs(db_path: str, columns: Iterable[Tuple[str, str]]) -> sqlite3.Connection:
+    """Open hive.db, adding any of `columns` that scraped_clubs does not have yet"""
+    conn = sqlite3.connect(db_path, timeout=10)
+    existing = {row[1] for row in conn.execute("PRAGMA table_info(scraped_clubs)")}
+    if not existing:
+        conn.close()
+        raise sqlite3.OperationalError("scraped_clubs table is missing")
+    for name, column_type in columns:
+        if name not in existing:
+            conn.execute(f"ALTER TABLE scraped_clubs ADD COLUMN {name} {column_type}")
+    conn.commit()
+    return conn
+
+
+def _parse(value: Optional[str]) -> Optional[datetime]:
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+
+
+def _older(mark: Watermark, current: Watermark) -> bool:
+    """True when `mark` does not move past `current`"""
+    if mark.posted_at and current.posted_at:
+        return mark.posted_at <= current.posted_at
+    return False
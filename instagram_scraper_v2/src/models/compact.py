@@ -0,0 +1,202 @@
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+from pydantic_core import to_json, to_jsonable_python
+
+# Plain __slots__ counterparts of InstagramPost / InstagramProfile for bulk runs: no
+# validation on construction and no per-instance __dict__. Serialization goes through
+# pydantic-core's encoder directly, so model_dump() / model_dump_json() give the same
+# output as the pydantic models and storage, the sinks and the daemon accept either;
+# to_model() converts to the validated models where data leaves the process.
+
+POST_FIELDS = ("id", "shortcode", "url", "caption", "timestamp", "display_url",
+               "likes_count", "comments_count", "is_video")
+PROFILE_FIELDS = ("username", "full_name", "biography", "external_url", "followers_count",
+                  "following_count", "posts_count", "is_private", "is_verified", "profile_pic_url")
+
+
+class PostRecord:
+    """InstagramPost without validation; the scraper's extractors already produce typed values"""
+    __slots__ = POST_FIELDS
+
+    def __init__(self, id: str, shortcode: str, url: str, caption: Optional[str] = None,
+                 timestamp: Optional[datetime] = None, display_url: Optional[str] = None,
+                 likes_count: Optional[int] = None, comments_count: Optional[int] = None,
+                 is_video: bool = False):
+        self.id = id
+        self.shortcode = shortcode
+        self.url = url
+        self.caption = caption
+        self.timestamp = timestamp
+        self.display_url = display_url
+        self.likes_count = likes_count
+        self.comments_count = comments_count
+        self.is_video = is_video
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "PostRecord":
+        """From an extractor dict; unknown keys are ignored, as the pydantic model does"""
+        get = data.get
+        return cls(data["id"], data["shortcode"], data["url"], get("caption"), get("timestamp"),
+                   get("display_url"), get("likes_count"), get("comments_count"), get("is_video", False))
+
+    @classmethod
+    def from_model(cls, post) -> "PostRecord":
+        return cls(*[getattr(post, name) for name in POST_FIELDS])
+
+    def to_model(self):
+        """The validated InstagramPost with the same values"""
+        from src.models.data_models import InstagramPost
+
+        return InstagramPost(**self.model_dump())
+
+    def model_dump(self, mode: str = "python") -> Dict[str, Any]:
+        data = {name: getattr(self, name) for name in POST_FIELDS}
+        return to_jsonable_python(data) if mode == "json" else data
+
+    def model_dump_json(self) -> str:
+        return self.to_json().decode("utf-8")
+
+    def to_json(self) -> bytes:
+        return to_json(self.model_dump())
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, PostRecord):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in POST_FIELDS)
+
+    def __repr__(self) -> str:
+        return f"PostRecord(shortcode={self.shortcode!r}, timestamp={self.timestamp!r})"
+
+
+class ProfileRecord:
+    """InstagramProfile without validation, holding PostRecords"""
+    __slots__ = PROFILE_FIELDS + ("posts", "scraped_at")
+
+    def __init__(self, username: str, full_name: Optional[str] = None, biography: Optional[str] = None,
+                 external_url: Optional[str] = None, followers_count: Optional[int] = None,
+                 following_count: Optional[int] = None, posts_count: Optional[int] = None,
+                 is_private: bool = False, is_verified: bool = False, profile_pic_url: Optional[str] = None,
+                 posts: Optional[List[PostRecord]] = None, scraped_at: Optional[datetime] = None):
+        self.username = username
+        self.full_name = full_name
+        self.biography = biography
+        self.external_url = external_url
+        self.followers_count = followers_count
+        self.following_count = following_count
+        self.posts_count = posts_count
+        self.is_private = is_private
+        self.is_verified = is_verified
+        self.profile_pic_url = profile_pic_url
+        self.posts = posts if posts is not None else []
+        self.scraped_at = scraped_at or datetime.now()
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], posts: Optional[List[PostRecord]] = None) -> "ProfileRecord":
+        """From an extractor dict; unknown keys are ignored, as the pydantic model does"""
+        return cls(**{name: data[name] for name in PROFILE_FIELDS if name in data}, posts=posts)
+
+    @classmethod
+    def from_model(cls, profile) -> "ProfileRecord":
+        return cls(*[getattr(profile, name) for name in PROFILE_FIELDS],
+                   posts=[PostRecord.from_model(post) for post in profile.posts],
+                   scraped_at=profile.scraped_at)
+
+    def to_model(self):
+        """The validated InstagramProfile with the same values"""
+        from src.models.data_models import InstagramProfile
+
+        return InstagramProfile(**self.model_dump())
+
+    def model_dump(self, mode: str = "python") -> Dict[str, Any]:
+        data = {name: getattr(self, name) for name in PROFILE_FIELDS}
+        data["posts"] = [post.model_dump() for post in self.posts]
+        data["scraped_at"] = self.scraped_at
+        return to_jsonable_python(data) if mode == "json" else data
+
+    def model_dump_json(self) -> str:
+        return self.to_json().decode("utf-8")
+
+    def to_json(self) -> bytes:
+        return to_json(self.model_dump())
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, ProfileRecord):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    def __repr__(self) -> str:
+        return f"ProfileRecord(username={self.username!r}, posts={len(self.posts)})"
+
+
+if __name__ == "__main__":
+    # Construction, serialization and memory per 100k posts against the pydantic models:
+    #   cd instagram_scraper_v2 && python -m src.models.compact [posts]
+    import sys
+    import time
+    import tracemalloc
+    from datetime import timezone
+    from src.models.data_models import InstagramPost
+
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    rows = [
+        {
+            "id": str(3_000_000_000 + i),
+            "shortcode": f"C{i:09d}",
+            "url": f"https://www.instagram.com/p/C{i:09d}/",
+            "caption": "📅 Tarih: 15 Mart 2025 🕐 Saat: 14:00 📍 Yer: İTÜ Ayazağa #etkinlik " * 3,
+            "timestamp": datetime.fromtimestamp(1_700_000_000 + i * 60, tz=timezone.utc),
+            "display_url": f"https://scontent.cdninstagram.com/v/{i}.jpg",
+            "likes_count": i % 500,
+            "comments_count": i % 40,
+            "is_video": i % 7 == 0,
+            "pinned": False,
+        }
+        for i in range(count)
+    ]
+
+    def timed(build):
+        """Result and seconds of build(), and the memory it holds (traced on a second run)"""
+        started = time.perf_counter()
+        result = build()
+        seconds = time.perf_counter() - started
+        tracemalloc.start()
+        kept = build()
+        memory = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        del kept
+        return result, seconds, memory
+
+    models, model_build, model_memory = timed(lambda: [InstagramPost(**row) for row in rows])
+    records, record_build, record_memory = timed(lambda: [PostRecord.from_dict(row) for row in rows])
+
+    def per_run(seconds: float) -> str:
+        return f"{seconds * 1000:8.0f} ms ({seconds / count * 1e6:5.2f} us/post)"
+
+    started = time.perf_counter()
+    model_json = [post.model_dump_json().encode("utf-8") for post in models]
+    model_encode = time.perf_counter() - started
+    started = time.perf_counter()
+    record_json = [post.to_json() for post in records]
+    record_encode = time.perf_counter() - started
+    started = time.perf_counter()
+    for post in models:
+        post.model_dump(mode="json")
+    model_dump = time.perf_counter() - started
+    started = time.perf_counter()
+    for post in records:
+        post.model_dump(mode="json")
+    record_dump = time.perf_counter() - started
+
+    assert model_json == record_json, "JSON output differs from pydantic's"
+    assert all(record.to_model() == model for record, model in zip(records[:1000], models))
+    assert all(PostRecord.from_model(model) == record for record, model in zip(records[:1000], models))
+    profile = ProfileRecord("itumdk", full_name="İTÜ MDK", followers_count=1200, posts=records[:12])
+    assert profile.to_model().model_dump_json().encode("utf-8") == profile.to_json()
+    assert ProfileRecord.from_model(profile.to_model()) == profile
+
+    print(f"{count} posts              pydantic InstagramPost          PostRecord")
+    print(f"construct        {per_run(model_build)}  {per_run(record_build)}")
+    print(f"JSON bytes       {per_run(model_encode)}  {per_run(record_encode)}")
+    print(f"dict (json mode) {per_run(model_dump)}  {per_run(record_dump)}")
+    print(f"memory           {model_memory / 1e6:8.1f} MB ({model_memory / count:5.0f} B/post)    "
+          f"{record_memory / 1e6:8.1f} MB ({record_memory / count:5.0f} B/post)")
@@ -1,13 +1,18 @@
 from abc import ABC, abstractmethod
-from typing import Any, Optional, Dict
-from playwright.sync_api import Page
+from typing import TYPE_CHECKING, Any, Callable, Optional, Dict, List, Tuple
 from src.core.browser import BrowserManager
 from src.core.config import config
 
+if TYPE_CHECKING:
+    from playwright.sync_api import Page
+
+class Throttled(RuntimeError):
+    """The site answered HTTP 429: the target is abandoned (no watermark moves) and retried later"""
+
 class BaseScraper(ABC):
     def __init__(self, browser_manager: BrowserManager):
         self.browser_manager = browser_manager
-        self.page: Optional[Page] = None
+        self.page: Optional["Page"] = None
         
     def start_browser(self):
         """Start the browser session"""
@@ -17,25 +22,149 @@ class BaseScraper(ABC):
         """Stop the browser session"""
         self.browser_manager.stop()
         
-    def navigate(self, url: str):
-        """Navigate to a URL with error handling"""
+    @property
+    def waiter(self):
+        return self.browser_manager.waiter
+
+    @property
+    def rate_limiter(self):
+        return self.browser_manager.rate_limiter
+
+    def navigate(self, url: str, ready_selector: Optional[str] = None):
+        """
+        Navigate to a URL with error handling.
+        Returns as soon as `ready_selector` is attached, or the network is idle if none is given.
+        Raises Throttled on HTTP 429, after the rate limiter has cooled the host down.
+        """
         if not self.page:
             self.start_browser()
             
         try:
             print(f"Navigating to {url}...")
-            self.page.goto(url, wait_until="networkidle")
-            self.browser_manager.random_sleep(1000, 2000)
+            if self.rate_limiter:
+                self.rate_limiter.acquire(url)
+            response = self.page.goto(url, wait_until="domcontentloaded")
+            if response and response.status == 429:
+                self.report_navigation(url, response.status)
+                raise Throttled(f"{url} answered HTTP 429 (rate limited)")
+            if ready_selector:
+                self.waiter.selector(self.page, ready_selector, name="navigate")
+            else:
+                self.waiter.network_idle(self.page, name="navigate")
+            self.report_navigation(url, response.status if response else None, self.is_blocked(self.page))
+        except Throttled:
+            raise
         except Exception as e:
             print(f"Error navigating to {url}: {e}")
+
+    async def navigate_async(self, page, url: str, ready_selector: Optional[str] = None):
+        """Async counterpart of navigate() for pooled pages"""
+        try:
+            print(f"Navigating to {url}...")
+            if self.rate_limiter:
+                await self.rate_limiter.acquire_async(url)
+            response = await page.goto(url, wait_until="domcontentloaded")
+            if response and response.status == 429:
+                self.report_navigation(url, response.status)
+                raise Throttled(f"{url} answered HTTP 429 (rate limited)")
+            if ready_selector:
+                await self.waiter.selector_async(page, ready_selector, name="navigate")
+            else:
+                await self.waiter.network_idle_async(page, name="navigate")
+            self.report_navigation(url, response.status if response else None, await self.is_blocked_async(page))
+        except Throttled:
+            raise
+        except Exception as e:
+            print(f"Error navigating to {url}: {e}")
+
+    def is_blocked(self, page) -> bool:
+        """Whether the site answered with a wall instead of content (login, captcha)"""
+        return False
+
+    async def is_blocked_async(self, page) -> bool:
+        return False
+
+    def report_navigation(self, url: str, status: Optional[int], blocked: bool = False):
+        """Feed the outcome of a navigation back to the shared rate limiter"""
+        if not self.rate_limiter:
+            return
+        if status == 429:
+            self.rate_limiter.penalize(url, "HTTP 429")
+        elif blocked:
+            self.rate_limiter.penalize(url, "login wall")
+        else:
+            self.rate_limiter.success(url)
             
     def scroll_to_bottom(self, max_scrolls: int = 5):
         """Scroll to the bottom of the page progressively"""
         for _ in range(max_scrolls):
+            height = self.page.evaluate("document.body.scrollHeight")
             self.page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-            self.browser_manager.random_sleep(1000, 2000)
+            # Stop early once a scroll no longer loads more content
+            if not self.waiter.condition(self.page, "h => document.body.scrollHeight > h",
+                                         arg=height, timeout=3000, name="scroll"):
+                break
             
     @abstractmethod
     def scrape(self, target: str) -> Any:
         """Main scrape method to be implemented by subclasses"""
         pass
+
+    @abstractmethod
+    async def scrape_async(self, page, target: str) -> Any:
+        """Async counterpart of scrape() run on a pooled page by scrape_many()"""
+        pass
+
+    def scrape_many(self, targets: List[str], workers: Optional[int] = None) -> List[Any]:
+        """
+        Scrape several targets concurrently, one isolated browser context per worker.
+        Pooled contexts are fresh (not the persistent user-data profile).
+        """
+        return self.new_pool(workers).run_sync(targets, self.scrape_async)
+
+    def scrape_streaming(self, targets: List[str], sink: Callable[[Tuple[str, Any]], Any],
+                         workers: Optional[int] = None) -> List[Any]:
+        """
+        Like scrape_many(), but every (target, result) goes on to `sink` as soon as it is
+        scraped, in a worker thread, while the pool keeps scraping. Returns what the sink
+        returned (None drops the item), in completion order.
+        """
+        import asyncio
+        from src.core.pipeline import Pipeline, Stage
+
+        pool = self.new_pool(workers)
+
+        async def browse(target: str) -> Tuple[str, Any]:
+            try:
+                return target, await pool.call(target, self.scrape_async)
+            except Throttled as e:
+                print(f"{e}; {target} is left for the next run")
+                return target, None
+
+        pipeline = Pipeline([
+            Stage("browser", browse, workers=pool.workers * pool.concurrency),
+            Stage("sink", sink, workers=config.get("pipeline.sink_workers", 1)),
+        ], queue_size=config.get("pipeline.queue_size", 8))
+
+        async def _main():
+            async with pool:
+                return await pipeline.run(targets)
+
+        try:
+            return asyncio.run(_main())
+        finally:
+            print(pipeline.report())
+
+    def new_pool(self, workers: Optional[int] = None):
+        """BrowserPool with this scraper's browser settings"""
+        from src.core.pool import BrowserPool
+
+        return BrowserPool(
+            workers=workers or config.get("pool.workers", 4),
+            concurrency=config.get("pool.concurrency_per_worker", 1),
+            headless=self.browser_manager.headless,
+            context_options=self.browser_manager.context_options(),
+            timeout=self.browser_manager.timeout,
+            route_policy=self.browser_manager.route_policy,
+            har=self.browser_manager.har,
+        )
@@ -30,6 +30,22 @@ class ClubSiteScraper(BaseScraper):
         print(f"Found {len(instagram_links)} unique Instagram handles.")
         return instagram_links
 
+    async def scrape_async(self, page, url: str) -> List[str]:
+        """Pooled variant of scrape() for sweeping several directory pages"""
+        instagram_links = []
+        await self.navigate_async(page, url)
+        try:
+            for element in await page.query_selector_all('a[href*="instagram.com"]'):
+                href = await element.get_attribute("href")
+                if href:
+                    clean_link = self._clean_instagram_link(href)
+                    if clean_link and clean_link not in instagram_links:
+                        instagram_links.append(clean_link)
+        except Exception as e:
+            print(f"Error finding links on {url}: {e}")
+
+        return instagram_links
+
     def _clean_instagram_link(self, url: str) -> Optional[str]:
         """Normalize Instagram URL to https://www.instagram.com/username/"""
         # Remove query params
@@ -0,0 +1,85 @@
+from datetime import datetime
+from typing import Any, Dict, Iterable, Optional
+
+# Runs entirely inside the page: one CDP round-trip regardless of how many elements match
+EXTRACT_SCRIPT = """
+(opts) => {
+    const posts = [];
+    const seenHrefs = new Set();
+    for (const link of document.querySelectorAll('a[href*="/p/"]')) {
+        const href = link.getAttribute('href');
+        if (!href || seenHrefs.has(href)) continue;
+        seenHrefs.add(href);
+        // Pinned posts sit above the timeline out of order
+        const pinned = !!link.querySelector('svg[aria-label*="inned"]');
+        // Everything below the watermark post is already known
+        if (opts.stopAt && !pinned && href.includes(`/p/${opts.stopAt}/`)) break;
+        const img = link.querySelector('img');
+        const time = link.querySelector('time[datetime]');
+        posts.push({
+            href: href,
+            alt: img ? img.getAttribute('alt') : null,
+            datetime: time ? time.getAttribute('datetime') : null,
+            pinned: pinned,
+        });
+        if (opts.maxPosts && posts.length >= opts.maxPosts) break;
+    }
+
+    const captions = [];
+    const seenText = new Set();
+    for (const selector of opts.captionSelectors) {
+        for (const element of document.querySelectorAll(selector)) {
+            const text = (element.innerText || '').trim();
+            if (text.length > opts.minCaptionLength && !seenText.has(text)) {
+                seenText.add(text);
+                captions.push(text);
+            }
+        }
+    }
+
+    const meta = {};
+    for (const prop of ['og:description', 'og:title', 'og:image']) {
+        const tag = document.querySelector(`meta[property="${prop}"]`);
+        meta[prop] = tag ? tag.getAttribute('content') : null;
+    }
+
+    const times = Array.from(document.querySelectorAll('time[datetime]'), t => t.getAttribute('datetime'));
+    return { posts, captions, meta, times };
+}
+"""
+
+
+def _options(caption_selectors: Iterable[str], max_posts: Optional[int],
+             min_caption_length: int, stop_at: Optional[str]) -> Dict[str, Any]:
+    return {
+        "captionSelectors": list(caption_selectors),
+        "maxPosts": max_posts or 0,
+        "minCaptionLength": min_caption_length,
+        "stopAt": stop_at,
+    }
+
+
+def extract_page(page, caption_selectors: Iterable[str] = (), max_posts: Optional[int] = None,
+                 min_caption_length: int = 20, stop_at: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Collect post links (href, img alt, <time datetime>, pinned), de-duplicated caption text,
+    og: meta tags and all <time datetime> values from a sync page in one evaluate call.
+    The grid walk stops at the unpinned post whose shortcode is `stop_at`.
+    """
+    return page.evaluate(EXTRACT_SCRIPT, _options(caption_selectors, max_posts, min_caption_length, stop_at))
+
+
+async def extract_page_async(page, caption_selectors: Iterable[str] = (), max_posts: Optional[int] = None,
+                             min_caption_length: int = 20, stop_at: Optional[str] = None) -> Dict[str, Any]:
+    """Async counterpart of extract_page() for pooled pages"""
+    return await page.evaluate(EXTRACT_SCRIPT, _options(caption_selectors, max_posts, min_caption_length, stop_at))
+
+
+def parse_datetime(value: Optional[str]) -> Optional[datetime]:
+    """Parse a <time datetime> value such as 2024-03-09T16:00:00.000Z"""
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
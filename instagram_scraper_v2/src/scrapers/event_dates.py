@@ -0,0 +1,297 @@
+import re
+from datetime import date, datetime, time, timedelta
+from typing import Iterator, List, NamedTuple, Optional, Tuple
+from src.scrapers.event_matcher import fold
+
+# Lookup tables, keyed by fold()ed name; ASCII spellings are common in captions too
+ENGLISH_MONTHS = {
+    "january": 1, "february": 2, "march": 3, "april": 4, "may": 5, "june": 6, "july": 7,
+    "august": 8, "september": 9, "october": 10, "november": 11, "december": 12,
+}
+ENGLISH_MONTH_ABBREVIATIONS = {
+    "jan": 1, "feb": 2, "mar": 3, "apr": 4, "jun": 6, "jul": 7, "aug": 8, "sep": 9, "sept": 9,
+    "oct": 10, "nov": 11, "dec": 12,
+}
+MONTHS = {
+    "ocak": 1, "şubat": 2, "subat": 2, "mart": 3, "nisan": 4, "mayis": 5, "haziran": 6,
+    "temmuz": 7, "ağustos": 8, "agustos": 8, "eylül": 9, "eylul": 9, "ekim": 10,
+    "kasim": 11, "aralik": 12,
+    **ENGLISH_MONTHS,
+}
+MONTH_ABBREVIATIONS = {
+    "oca": 1, "şub": 2, "sub": 2, "nis": 4, "haz": 6, "tem": 7, "ağu": 8,
+    "agu": 8, "eyl": 9, "eki": 10, "kas": 11, "ara": 12,
+    **ENGLISH_MONTH_ABBREVIATIONS,
+}
+WEEKDAYS = {
+    "pazartesi": 0, "sali": 1, "çarşamba": 2, "carsamba": 2, "perşembe": 3, "persembe": 3,
+    "cuma": 4, "cumartesi": 5, "pazar": 6,
+    "monday": 0, "tuesday": 1, "wednesday": 2, "thursday": 3, "friday": 4,
+    "saturday": 5, "sunday": 6,
+}
+
+# How sure a match is, before time and weekday adjustments
+CONFIDENCE = {
+    "iso": 1.0,          # 2025-03-15T14:00 (LLM output)
+    "numeric": 0.9,      # 15.03.2025, 15/03/25
+    "named": 0.85,       # 15 Mart 2025, March 15, 2025
+    "named_no_year": 0.75,
+    "weekday": 0.5,      # Cuma 18:00 -> the coming Friday
+}
+TIME_BONUS = 0.1
+WEEKDAY_AGREES = 0.05
+WEEKDAY_DISAGREES = -0.25
+
+
+def _alternation(names) -> str:
+    return "|".join(re.escape(name) for name in sorted(names, key=len, reverse=True))
+
+
+_LETTER = r"[^\W\d_]"
+# After a day, full month names may carry a Turkish suffix (Mart'ta, Martta); abbreviations may not
+_MONTH = rf"(?:{_alternation(MONTHS)}){_LETTER}*|(?:{_alternation(MONTH_ABBREVIATIONS)})\.?(?!{_LETTER})"
+# Month-first dates are English ("March 15"), and only whole words: in front of a number,
+# Turkish months and their suffixed forms are everyday words ("ara 5 dakika", "aralıksız 3 gün")
+_EN_MONTH = (rf"(?:{_alternation(ENGLISH_MONTHS)}"
+             rf"|(?:{_alternation(ENGLISH_MONTH_ABBREVIATIONS)})\.?)(?!{_LETTER})")
+_DASH = r"\s*[-–—]\s*"
+
+_DATE_RE = re.compile(
+    r"(?P<iso>(?P<iso_y>\d{4})-(?P<iso_m>\d{1,2})-(?P<iso_d>\d{1,2})"
+    r"(?:[t ](?P<iso_h>\d{1,2}):(?P<iso_min>\d{2}))?)"
+    r"|(?<![\d.:/])(?P<num_d>\d{1,2})(?P<sep>[./-])(?P<num_m>\d{1,2})(?P=sep)(?P<num_y>\d{4}|\d{2})(?![\d:/]|\.\d)"
+    rf"|(?<![\d.:/])(?P<day>\d{{1,2}})(?:{_DASH}(?P<day_end>\d{{1,2}}))?\.?\s+(?P<month>{_MONTH})"
+    r"(?:,?\s+(?P<year>\d{4}))?"
+    rf"|(?<!{_LETTER})(?P<en_month>{_EN_MONTH})\s+(?P<en_day>\d{{1,2}})(?:st|nd|rd|th)?(?!\d)"
+    r"(?:,?\s+(?P<en_year>\d{4}))?"
+)
+_WEEKDAY_RE = re.compile(rf"(?<!{_LETTER})(?P<weekday>{_alternation(WEEKDAYS)})(?!{_LETTER})")
+_TIME_RE = re.compile(
+    r"(?<![\d.:/])(?:(?P<h>\d{1,2})[:.](?P<m>\d{2})(?:\s*(?P<ampm>[ap]\.?m)\.?)?"
+    r"|(?P<h12>\d{1,2})\s*(?P<ampm12>[ap]\.?m)\.?"
+    r"|(?<=saat)(?::|\s)\s*(?P<hour>\d{1,2}))(?![\d:/]|\.\d)"
+)
+_DASH_RE = re.compile(_DASH)
+
+
+class EventDate(NamedTuple):
+    """When an event happens, as read from a caption or an LLM answer"""
+    start: datetime
+    end: Optional[datetime]
+    has_time: bool
+    confidence: float
+    text: str  # the matched date (and time) text, folded
+
+    @property
+    def date(self) -> date:
+        return self.start.date()
+
+    @property
+    def time(self) -> Optional[time]:
+        return self.start.time() if self.has_time else None
+
+    @property
+    def is_range(self) -> bool:
+        return self.end is not None
+
+
+class _DateMatch(NamedTuple):
+    kind: str
+    start: date
+    end: Optional[date]
+    year_known: bool
+    span: Tuple[int, int]
+    time: Optional[time]  # ISO strings carry their own time
+
+
+def parse_event_date(text: str, now: Optional[datetime] = None) -> Optional[EventDate]:
+    """
+    Find the event date in `text` (Turkish or English): "15 Mart 2025", "15-17 Mart",
+    "15.03.2025", "March 15", "Cuma 18:00", "2025-03-15T14:00", plus the first time or
+    time range ("14:00 - 22:00", "2pm"). Dates without a year that already passed
+    relative to `now` (the post time, default: now) are moved to next year.
+    Returns None when no date is found.
+    """
+    if not text:
+        return None
+    now = now or datetime.now()
+    folded = fold(text)
+
+    # Lazily: the scan stops once the first date (and a possible range end) is known
+    dates = _dates(folded, now)
+    first = next(dates, None)
+    weekday = _WEEKDAY_RE.search(folded)
+    times = _time(folded)
+
+    if first:
+        start_day, end_day = first.start, first.end
+        # "15 Mart - 17 Mart": the next date right after a dash ends the range
+        second = next(dates, None) if end_day is None else None
+        if second and _DASH_RE.fullmatch(folded, first.span[1], second.span[0]):
+            end_day = second.start
+            if not first.year_known and end_day < start_day:
+                start_day = start_day.replace(year=start_day.year - 1)
+            if second.year_known and not first.year_known:
+                start_day = start_day.replace(year=end_day.year)
+                if start_day > end_day:
+                    start_day = start_day.replace(year=end_day.year - 1)
+        kind = first.kind
+        span = first.span
+        confidence = CONFIDENCE[kind]
+        if weekday and weekday.start() < span[1] + 20 and weekday.end() > span[0] - 20:
+            agrees = WEEKDAYS[weekday.group("weekday")] == start_day.weekday()
+            confidence += WEEKDAY_AGREES if agrees else WEEKDAY_DISAGREES
+    elif weekday:
+        start_day = _next_weekday(now, WEEKDAYS[weekday.group("weekday")], times[0] if times else None)
+        end_day = None
+        kind = "weekday"
+        span = weekday.span()
+        confidence = CONFIDENCE[kind]
+    else:
+        return None
+
+    start_time, end_time = times or (first.time if first else None, None)
+    has_time = start_time is not None
+    if has_time:
+        confidence += TIME_BONUS
+
+    start = datetime.combine(start_day, start_time or time())
+    end = None
+    if end_day is not None:
+        end = datetime.combine(end_day, end_time or start_time or time())
+    elif end_time is not None:
+        end = datetime.combine(start_day, end_time)
+        if end <= start:
+            end += timedelta(days=1)  # 22:00 - 02:00
+
+    return EventDate(start, end, has_time, round(max(0.0, min(confidence, 1.0)), 2), folded[span[0]:span[1]])
+
+
+def _dates(folded: str, now: datetime) -> Iterator[_DateMatch]:
+    """Every valid date in the text, in order"""
+    for match in _DATE_RE.finditer(folded):
+        parsed = _read(match, now)
+        if parsed:
+            yield parsed
+
+
+def _read(match: re.Match, now: datetime) -> Optional[_DateMatch]:
+    group = match.group
+    try:
+        if group("iso"):
+            hour = group("iso_h")
+            at = time(int(hour), int(group("iso_min"))) if hour else None
+            day = date(int(group("iso_y")), int(group("iso_m")), int(group("iso_d")))
+            return _DateMatch("iso", day, None, True, match.span(), at)
+
+        if group("num_d"):
+            day, month, year = int(group("num_d")), int(group("num_m")), int(group("num_y"))
+            if month > 12 and day <= 12:
+                day, month = month, day  # 03/15/2025, month first
+            year += 2000 if year < 100 else 0
+            return _DateMatch("numeric", date(year, month, day), None, True, match.span(), None)
+
+        if group("day"):
+            month = _month(group("month"))
+            year = group("year")
+            day, day_end = int(group("day")), group("day_end")
+        else:
+            month = _month(group("en_month"))
+            year = group("en_year")
+            day, day_end = int(group("en_day")), None
+        if not month:
+            return None
+
+        if year:
+            start = date(int(year), month, day)
+        else:
+            start = date(now.year, month, day)
+            if start < now.date():
+                start = start.replace(year=now.year + 1)
+        end = start.replace(day=int(day_end)) if day_end else None
+        return _DateMatch("named" if year else "named_no_year", start, end, bool(year), match.span(), None)
+    except ValueError:
+        return None  # 31 Şubat, month 13, ...
+
+
+def _month(word: str) -> Optional[int]:
+    word = word.rstrip(".")
+    if word in MONTHS:
+        return MONTHS[word]
+    if word in MONTH_ABBREVIATIONS:
+        return MONTH_ABBREVIATIONS[word]
+    # Suffixed full name ("martta", "mayısın")
+    for name in sorted(MONTHS, key=len, reverse=True):
+        if word.startswith(name):
+            return MONTHS[name]
+    return None
+
+
+def _time(folded: str) -> Optional[Tuple[time, Optional[time]]]:
+    """First valid time, and the end of a "14:00 - 22:00" range"""
+    for match in _TIME_RE.finditer(folded):
+        start = _clock(match)
+        if start is None:
+            continue
+        dash = _DASH_RE.match(folded, match.end())
+        follow = _TIME_RE.match(folded, dash.end()) if dash else None
+        return start, _clock(follow) if follow else None
+    return None
+
+
+def _clock(match: re.Match) -> Optional[time]:
+    hour = match.group("h") or match.group("h12") or match.group("hour")
+    minute = int(match.group("m") or 0)
+    ampm = (match.group("ampm") or match.group("ampm12") or "").replace(".", "")
+    hour = int(hour)
+    if ampm:
+        if hour > 12:
+            return None
+        hour = hour % 12 + (12 if ampm == "pm" else 0)
+    if hour > 23 or minute > 59:
+        return None
+    return time(hour, minute)
+
+
+def _next_weekday(now: datetime, weekday: int, at: Optional[time]) -> date:
+    """The coming `weekday`; today only while its time has not passed"""
+    days = (weekday - now.weekday()) % 7
+    if days == 0 and at and at <= now.time():
+        days = 7
+    return (now + timedelta(days=days)).date()
+
+
+if __name__ == "__main__":
+    # Micro-benchmark against the dateutil path it replaces:
+    #   cd instagram_scraper_v2 && python -m src.scrapers.event_dates
+    import timeit
+
+    samples: List[str] = [
+        "📅 Tarih: 15 Mart 2025\n🕐 Saat: 14:00 - 22:00\n📍 Yer: İTÜ Ayazağa",
+        "Cuma 18:00'de Merkez Kütüphane önünde buluşuyoruz!",
+        "Workshop on March 15, 2025 at 2pm, room 101",
+        "KAYIT: 12.04.2025 saat 10.00",
+        "28 Şubat - 2 Mart tarihleri arasında festival",
+        "2025-03-15T14:00:00",
+    ]
+    for sample in samples:
+        print(f"{sample[:45]!r:50} -> {parse_event_date(sample)}")
+
+    runs = 2000
+    native = timeit.timeit(lambda: [parse_event_date(s) for s in samples], number=runs)
+    print(f"\nnative:   {native / runs / len(samples) * 1e6:7.1f} us per caption")
+    try:
+        from dateutil import parser as date_parser
+    except ImportError:
+        print("dateutil: not installed")
+    else:
+        def dateutil_path(sample):
+            try:
+                return date_parser.parse(sample, fuzzy=True)
+            except (ValueError, OverflowError):
+                return None
+
+        slow = timeit.timeit(lambda: [dateutil_path(s) for s in samples], number=runs)
+        parsed = sum(dateutil_path(s) is not None for s in samples)
+        print(f"dateutil: {slow / runs / len(samples) * 1e6:7.1f} us per caption "
+              f"({parsed}/{len(samples)} parsed, {slow / native:.1f}x slower)")
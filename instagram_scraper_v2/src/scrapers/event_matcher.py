@@ -0,0 +1,151 @@
+import re
+from collections import Counter
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Sequence
+
+
+def fold(text: str) -> str:
+    """
+    Turkish-safe casefold that keeps every character at its original index.
+    I/İ/ı all fold to "i": captions mix Turkish and English casing ("KATILIM",
+    "JOIN", "İTÜ"), and str.lower() alone turns "İ" into "i" plus a combining dot.
+    """
+    return text.replace("İ", "i").lower().replace("ı", "i")
+
+
+class Cue(NamedTuple):
+    """One date/time/location hit: which pattern matched, where, and the folded text"""
+    pattern: int
+    start: int
+    end: int
+    text: str
+
+
+class TextCues(NamedTuple):
+    """Everything the matcher found in one caption"""
+    keywords: Dict[str, int]  # matched keyword -> weight (times it is listed)
+    dates: List[Cue]          # leftmost hit of each date pattern, in pattern order
+    times: List[Cue]
+    locations: List[Cue]
+
+    @property
+    def keyword_count(self) -> int:
+        return sum(self.keywords.values())
+
+    @property
+    def is_event(self) -> bool:
+        """Same rule as EventMatcher.is_event()"""
+        return self.keyword_count >= 2 or (bool(self.dates) and self.keyword_count >= 1)
+
+
+class EventMatcher:
+    """
+    Precompiled event detector: finds keywords, dates, times and location cues
+    in one folded copy of a caption, for detection and extraction alike.
+
+    Keywords are compiled into a single prefix-trie regex and collected with one
+    findall; keywords nested in, or overlapping, a longer match are recovered
+    from precomputed tables, so the result equals `keyword in text` for each.
+    Date, time and location patterns yield their leftmost hit like re.search.
+    Deliberately free of config lookups so it can be used from `scraper/` too.
+    """
+
+    def __init__(self, keywords: Iterable[str], date_patterns: Sequence[str] = (),
+                 time_patterns: Sequence[str] = (), location_patterns: Sequence[str] = ()):
+        # A keyword listed twice counts twice, as with the plain substring scan
+        self.weights = Counter(fold(keyword) for keyword in keywords)
+        # Keywords inside another keyword are found along with it
+        self._implied = {k: [j for j in self.weights if j in k] for k in self.weights}
+        # Keywords that start inside another and run past its end ("date" + "event" in "datevent")
+        self._overlapping = {
+            k: [j for j in self.weights if j not in k and _overlaps(k, j)] for k in self.weights
+        }
+        self._keywords = re.compile(_trie_pattern(self.weights))
+
+        # CPython's re has no multi-pattern search: an alternation of these patterns is
+        # retried at every index and measured slower than one search per pattern, which
+        # stops at its leftmost hit, so they stay separate but compiled and run on one fold
+        self._dates = [re.compile(_fold_pattern(p)) for p in date_patterns]
+        self._times = [re.compile(_fold_pattern(p)) for p in time_patterns]
+        self._locations = [re.compile(_fold_pattern(p)) for p in location_patterns]
+
+    def scan(self, text: str) -> TextCues:
+        """Find every cue in one caption"""
+        folded = fold(text or "")
+        return TextCues(
+            self._scan_keywords(folded),
+            self._search(self._dates, folded),
+            self._search(self._times, folded),
+            self._search(self._locations, folded, value_group=True),
+        )
+
+    def scan_many(self, texts: Iterable[str]) -> Iterator[TextCues]:
+        """Scan captions lazily, e.g. every description in the events table"""
+        for text in texts:
+            yield self.scan(text)
+
+    def is_event(self, text: str) -> bool:
+        """Several keywords, or a date with at least one keyword"""
+        folded = fold(text or "")
+        count = sum(self._scan_keywords(folded).values())
+        if count != 1:
+            return count >= 2
+        # Dates are only looked up for the one case they decide
+        return any(pattern.search(folded) for pattern in self._dates)
+
+    def classify_many(self, texts: Iterable[str]) -> List[bool]:
+        """is_event() for a batch of captions, e.g. to re-score the whole events table"""
+        return [self.is_event(text) for text in texts]
+
+    def _scan_keywords(self, folded: str) -> Dict[str, int]:
+        found = {}
+        for keyword in set(self._keywords.findall(folded)):
+            for implied in self._implied[keyword]:
+                found[implied] = self.weights[implied]
+        # A keyword hidden by an overlapping match is not in the findall result
+        for keyword in list(found):
+            for other in self._overlapping[keyword]:
+                if other not in found and other in folded:
+                    for implied in self._implied[other]:
+                        found[implied] = self.weights[implied]
+        return found
+
+    @staticmethod
+    def _search(patterns: List[re.Pattern], folded: str, value_group: bool = False) -> List[Cue]:
+        """Leftmost hit of each pattern, in pattern order"""
+        cues = []
+        for index, pattern in enumerate(patterns):
+            match = pattern.search(folded)
+            if match:
+                # A location pattern's first group holds the value after the marker
+                group = 1 if value_group and pattern.groups else 0
+                cues.append(Cue(index, match.start(group), match.end(group), match.group(group)))
+        return cues
+
+
+def _overlaps(first: str, second: str) -> bool:
+    """Whether a proper suffix of `first` is a proper prefix of `second`"""
+    return any(first.endswith(second[:n]) for n in range(1, min(len(first), len(second))))
+
+
+def _fold_pattern(pattern: str) -> str:
+    # Only literal letters change; regex escapes like \d and \s are lowercase already
+    return pattern.replace("İ", "i").replace("ı", "i")
+
+
+def _trie_pattern(words: Iterable[str]) -> str:
+    """Regex alternation with shared prefixes factored out, longest match first"""
+    trie: Dict[str, dict] = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def build(node: Dict[str, dict]) -> str:
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        return f"(?:{body})?" if "" in node else body
+
+    return build(trie)
@@ -1,41 +1,195 @@
 import time
 import re
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from datetime import datetime
-from src.scrapers.base import BaseScraper
+from src.scrapers.base import BaseScraper, Throttled
 from src.models.data_models import InstagramProfile, InstagramPost
+from src.models.compact import PostRecord, ProfileRecord
+from src.scrapers.response_capture import ResponseCapture
+from src.scrapers.dom_extract import extract_page, extract_page_async, parse_datetime
+from src.core.watermark import WatermarkStore, fresh_posts, newest_post, shortcode_from_url
 from src.core.config import config
 
 class InstagramScraper(BaseScraper):
+    def __init__(self, browser_manager, extraction: Optional[str] = None,
+                 watermarks: Optional[WatermarkStore] = None, compact: Optional[bool] = None):
+        super().__init__(browser_manager)
+        # "dom" reads the rendered page, "network" reads the JSON the page downloads
+        self.extraction = extraction or config.get("scraper.extraction", "dom")
+        # Per-profile newest-post marks; only posts above them are returned
+        self.watermarks = watermarks
+        # Unvalidated __slots__ records instead of pydantic models, for bulk runs
+        self.compact = config.get("scraper.compact_models", False) if compact is None else compact
+
+    def _post(self, data: Dict[str, Any]):
+        """InstagramPost from extractor fields, or a PostRecord in compact mode"""
+        return PostRecord.from_dict(data) if self.compact else InstagramPost(**data)
+
+    def _profile(self, data: Dict[str, Any], posts: List[Any]):
+        """InstagramProfile from extractor fields, or a ProfileRecord in compact mode"""
+        return ProfileRecord.from_dict(data, posts) if self.compact else InstagramProfile(**data, posts=posts)
+
     def scrape(self, username: str) -> Optional[InstagramProfile]:
         """Scrape a public Instagram profile"""
         url = f"https://www.instagram.com/{username}/"
-        self.navigate(url)
-        
-        # Check for login wall or errors
-        if self._check_login_required():
-            print("Login wall detected. Attempting to scroll/scrape what is visible...")
-            # We might still be able to get some data
+
+        capture = None
+        if self.extraction == "network":
+            if not self.page:
+                self.start_browser()
+            capture = ResponseCapture()
+            capture.attach(self.page)
+
+        try:
+            self.navigate(url, ready_selector="main")
             
-        return self._parse_profile(username)
+            # Check for login wall or errors
+            if self._check_login_required():
+                print("Login wall detected. Attempting to scroll/scrape what is visible...")
+                # We might still be able to get some data
+
+            if capture:
+                if not capture.user:
+                    response = self.waiter.response(self.page, ResponseCapture.matches,
+                                                    timeout=5000, name="profile_json")
+                    if response:
+                        try:
+                            capture.ingest(response.json())
+                        except Exception:
+                            pass
+                return self._profile_from_capture(username, capture)
+                
+            return self._parse_profile(username)
+        finally:
+            if capture:
+                capture.detach(self.page)
+
+    def _profile_from_capture(self, username: str, capture: ResponseCapture) -> InstagramProfile:
+        """Build the profile from captured JSON, falling back to the DOM for missing parts"""
+        profile = None
+        if not capture.user:
+            print("No profile JSON captured, reading profile stats from the page")
+            profile = self._parse_profile(username)
+
+        # Captured posts carry timestamps, so they are staged for the watermark last
+        posts = self._capture_posts(username, capture)
+        print(f"Captured {len(posts)} new posts from {capture.responses_seen} JSON responses.")
+
+        if capture.user:
+            user = dict(capture.user, username=capture.user.get("username") or username)
+            return self._profile(user, posts)
+
+        if posts:
+            profile.posts = posts
+        return profile
 
     def _check_login_required(self) -> bool:
         """Check if login is strictly required (blocking content)"""
+        return self.is_blocked(self.page)
+
+    def is_blocked(self, page) -> bool:
         # This is a heuristic
         try:
-            return self.page.get_by_text("Log in to continue").is_visible()
+            return page.get_by_text("Log in to continue").is_visible()
         except:
             return False
 
+    async def is_blocked_async(self, page) -> bool:
+        try:
+            return await page.get_by_text("Log in to continue").is_visible()
+        except Exception:
+            return False
+
     def _parse_profile(self, username: str) -> InstagramProfile:
         """Parse the profile page content"""
-        # Wait for potential content load
-        self.page.wait_for_selector('main', timeout=5000)
-        
-        # 1. Get Basic Info from Meta Tags (most reliable for public scraping without login)
-        description = self.page.query_selector('meta[property="og:description"]')
-        desc_content = description.get_attribute("content") if description else ""
+        # Wait for the post grid; profiles without posts simply hit the deadline
+        self.waiter.selector(self.page, 'a[href*="/p/"]', timeout=5000, name="profile_grid")
         
+        # Meta tags and the visible grid come back from a single evaluate call
+        max_posts = config.get("scraper.max_posts_per_user", 10)
+        data = extract_page(self.page, max_posts=max_posts, stop_at=self._stop_at(username))
+        return self._profile_from_dom(username, data)
+
+    async def scrape_async(self, page, username: str) -> Optional[InstagramProfile]:
+        """Scrape a public Instagram profile on a pooled async page"""
+        url = f"https://www.instagram.com/{username}/"
+
+        capture = None
+        if self.extraction == "network":
+            capture = ResponseCapture()
+            capture.attach_async(page)
+
+        try:
+            await self.navigate_async(page, url, ready_selector="main")
+        except Throttled:
+            if capture:
+                capture.detach_async(page)
+            raise
+        await self.waiter.selector_async(page, 'a[href*="/p/"]', timeout=5000, name="profile_grid")
+
+        if capture:
+            if not capture.user:
+                response = await self.waiter.response_async(page, ResponseCapture.matches,
+                                                            timeout=5000, name="profile_json")
+                if response:
+                    try:
+                        capture.ingest(await response.json())
+                    except Exception:
+                        pass
+            capture.detach_async(page)
+
+            if capture.user:
+                posts = self._capture_posts(username, capture)
+                user = dict(capture.user, username=capture.user.get("username") or username)
+                return self._profile(user, posts)
+
+        max_posts = config.get("scraper.max_posts_per_user", 10)
+        data = await extract_page_async(page, max_posts=max_posts, stop_at=self._stop_at(username))
+        profile = self._profile_from_dom(username, data)
+        if capture and capture.posts:
+            profile.posts = self._capture_posts(username, capture)
+        return profile
+
+    def _stop_at(self, username: str) -> Optional[str]:
+        """Shortcode at which the grid walk can stop"""
+        mark = self.watermarks.get(username) if self.watermarks else None
+        return mark.shortcode if mark else None
+
+    def _fresh(self, username: str, posts: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Drop posts at or below the profile's watermark and stage the new newest post"""
+        if not self.watermarks:
+            return posts
+        mark = self.watermarks.get(username)
+        fresh = fresh_posts(posts, mark)
+        self.watermarks.stage(username, username, newest_post(fresh))
+        if mark:
+            print(f"{len(fresh)} new posts since {mark.shortcode or mark.posted_at}.")
+        return fresh
+
+    def _capture_posts(self, username: str, capture: ResponseCapture) -> List[InstagramPost]:
+        max_posts = config.get("scraper.max_posts_per_user", 10)
+        return [self._post(post) for post in self._fresh(username, capture.get_posts(max_posts))]
+
+    def _profile_from_dom(self, username: str, data: Dict[str, Any]) -> InstagramProfile:
+        """Build the profile from the batched DOM extraction result"""
+        # Meta tags are the most reliable source for public scraping without login
+        meta = data.get("meta") or {}
+        grid = [
+            dict(item, shortcode=shortcode_from_url(item.get("href")), timestamp=parse_datetime(item.get("datetime")))
+            for item in data.get("posts") or []
+        ]
+        posts = self._build_posts(self._fresh(username, grid))
+        return self._build_profile(
+            username,
+            meta.get("og:description") or "",
+            meta.get("og:title"),
+            meta.get("og:image"),
+            posts,
+        )
+
+    def _build_profile(self, username: str, desc_content: str, title_content: Optional[str],
+                       profile_pic: Optional[str], posts: List[InstagramPost]) -> InstagramProfile:
+        """Assemble a profile from raw meta tag values"""
         # Format: "100 Followers, 50 Following, 10 Posts - See Instagram photos..."
         followers = 0
         following = 0
@@ -54,77 +208,56 @@ class InstagramScraper(BaseScraper):
         except:
             print("Could not parse meta description for stats")
 
-        image_meta = self.page.query_selector('meta[property="og:image"]')
-        profile_pic = image_meta.get_attribute("content") if image_meta else None
-        
-        title_meta = self.page.query_selector('meta[property="og:title"]')
         full_name = ""
-        if title_meta:
-            title_content = title_meta.get_attribute("content")
+        if title_content:
             # "Name (@username) • Instagram photos..."
             if "(" in title_content:
                 full_name = title_content.split("(")[0].strip()
 
-        # 2. Extract Visible Posts
-        posts = self._extract_posts(username)
-
-        return InstagramProfile(
-            username=username,
-            full_name=full_name,
-            followers_count=followers,
-            following_count=following,
-            posts_count=posts_count,
-            profile_pic_url=profile_pic,
-            posts=posts
-        )
+        return self._profile({
+            "username": username,
+            "full_name": full_name,
+            "followers_count": followers,
+            "following_count": following,
+            "posts_count": posts_count,
+            "profile_pic_url": profile_pic,
+        }, posts)
 
-    def _extract_posts(self, username: str) -> List[InstagramPost]:
-        """Extract recent posts from the grid"""
+    def _build_posts(self, grid: List[Dict[str, Any]]) -> List[InstagramPost]:
+        """Turn grid entries ({href, alt, timestamp}) into posts"""
         posts = []
         max_posts = config.get("scraper.max_posts_per_user", 10)
-        
-        # Select all anchor tags linked to posts
-        # Typically /p/{shortcode}/
-        links = self.page.query_selector_all('a[href*="/p/"]')
-        
+
         unique_links = []
         seen = set()
         
-        for link in links:
-            href = link.get_attribute("href")
+        for item in grid:
+            href = item.get("href")
             if href and href not in seen:
                 seen.add(href)
-                unique_links.append(href)
+                unique_links.append(item)
                 if len(unique_links) >= max_posts:
                     break
                     
         print(f"Found {len(unique_links)} potential posts.")
 
-        for href in unique_links:
+        for item in unique_links:
+            href = item["href"]
             shortcode = href.split("/p/")[1].replace("/", "")
             full_url = f"https://www.instagram.com{href}"
             
             # For minimal public scraping without opening each post (which triggers login wall quickly),
             # we create a basic Post object. opening each post is high risk for rate limits.
             # If we need captions, we MUST open them or rely on data visible in the grid (often none).
-            # For now, we will try to visit the post URL briefly if configured, or just return links.
-            
-            # Let's try to get image alt text from the grid which sometimes contains the caption
-            alt_text = None
-            try:
-                img = self.page.query_selector(f'a[href="{href}"] img')
-                if img:
-                    alt_text = img.get_attribute("alt")
-            except:
-                pass
-
-            post = InstagramPost(
-                id=shortcode,
-                shortcode=shortcode,
-                url=full_url,
-                caption=alt_text, # Best effort from grid
-                display_url=None # Would need to extract src
-            )
+            # The grid image alt text sometimes contains the caption, so use it as a best effort.
+            post = self._post({
+                "id": shortcode,
+                "shortcode": shortcode,
+                "url": full_url,
+                "caption": item.get("alt"), # Best effort from grid
+                "timestamp": item.get("timestamp"),
+                "display_url": None # Would need to extract src
+            })
             posts.append(post)
             
         return posts
@@ -0,0 +1,165 @@
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+# Endpoints whose JSON carries profile / timeline data
+CAPTURE_URL_PATTERNS = (
+    "/api/v1/users/web_profile_info",
+    "/api/v1/feed/user/",
+    "/graphql/query",
+    "/api/graphql",
+)
+
+
+class ResponseCapture:
+    """
+    Collects profile and post data from the JSON responses a page already downloads,
+    instead of reconstructing it from the DOM.
+
+    Both the classic GraphQL shape (`edge_owner_to_timeline_media`, nodes with
+    `shortcode`) and the v1 feed shape (items with `code`/`taken_at`) are understood.
+    Results are plain dicts whose keys match InstagramProfile / InstagramPost fields,
+    so this module has no pydantic dependency and is shared with the legacy scraper.
+    """
+
+    def __init__(self):
+        self.user: Optional[Dict[str, Any]] = None
+        self.posts: Dict[str, Dict[str, Any]] = {}
+        self.responses_seen = 0
+
+    # --- wiring ---
+
+    def attach(self, page):
+        """Start listening on a sync page"""
+        page.on("response", self._on_response)
+
+    def detach(self, page):
+        page.remove_listener("response", self._on_response)
+
+    def attach_async(self, page):
+        """Start listening on an async (pooled) page"""
+        page.on("response", self._on_response_async)
+
+    def detach_async(self, page):
+        page.remove_listener("response", self._on_response_async)
+
+    @staticmethod
+    def matches(response) -> bool:
+        """True for responses that may carry profile/post JSON"""
+        return any(pattern in response.url for pattern in CAPTURE_URL_PATTERNS)
+
+    def _on_response(self, response):
+        if not self.matches(response):
+            return
+        try:
+            self.ingest(response.json())
+        except Exception:
+            pass
+
+    async def _on_response_async(self, response):
+        if not self.matches(response):
+            return
+        try:
+            self.ingest(await response.json())
+        except Exception:
+            pass
+
+    # --- parsing ---
+
+    def ingest(self, payload: Any):
+        """Walk a decoded JSON payload and pick up every user and post found in it"""
+        self.responses_seen += 1
+        stack = [payload]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, list):
+                stack.extend(reversed(node))
+                continue
+            if not isinstance(node, dict):
+                continue
+
+            if "edge_owner_to_timeline_media" in node and "username" in node:
+                self.user = self._parse_user(node)
+            if "shortcode" in node and ("taken_at_timestamp" in node or "edge_media_to_caption" in node):
+                post = self._parse_graph_node(node)
+                self.posts.setdefault(post["shortcode"], post)
+            elif "code" in node and "taken_at" in node:
+                post = self._parse_feed_item(node)
+                self.posts.setdefault(post["shortcode"], post)
+
+            stack.extend(reversed(list(node.values())))
+
+    def get_posts(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Captured posts, newest first"""
+        posts = sorted(
+            self.posts.values(),
+            key=lambda p: p["timestamp"] or datetime.min.replace(tzinfo=timezone.utc),
+            reverse=True,
+        )
+        return posts[:limit] if limit else posts
+
+    def _parse_user(self, user: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "username": user.get("username"),
+            "full_name": user.get("full_name"),
+            "biography": user.get("biography"),
+            "external_url": user.get("external_url"),
+            "followers_count": _count(user.get("edge_followed_by")),
+            "following_count": _count(user.get("edge_follow")),
+            "posts_count": _count(user.get("edge_owner_to_timeline_media")),
+            "is_private": bool(user.get("is_private")),
+            "is_verified": bool(user.get("is_verified")),
+            "profile_pic_url": user.get("profile_pic_url_hd") or user.get("profile_pic_url"),
+        }
+
+    def _parse_graph_node(self, node: Dict[str, Any]) -> Dict[str, Any]:
+        caption = None
+        caption_edges = (node.get("edge_media_to_caption") or {}).get("edges") or []
+        if caption_edges:
+            caption = caption_edges[0].get("node", {}).get("text")
+
+        shortcode = node["shortcode"]
+        return {
+            "id": str(node.get("id") or shortcode),
+            "shortcode": shortcode,
+            "url": f"https://www.instagram.com/p/{shortcode}/",
+            "caption": caption or node.get("accessibility_caption"),
+            "timestamp": _timestamp(node.get("taken_at_timestamp")),
+            "display_url": node.get("display_url"),
+            "likes_count": _count(node.get("edge_liked_by") or node.get("edge_media_preview_like")),
+            "comments_count": _count(node.get("edge_media_to_comment")),
+            "is_video": bool(node.get("is_video")),
+            "pinned": bool(node.get("pinned_for_users")),
+        }
+
+    def _parse_feed_item(self, item: Dict[str, Any]) -> Dict[str, Any]:
+        caption = item.get("caption")
+        if isinstance(caption, dict):
+            caption = caption.get("text")
+
+        candidates = (item.get("image_versions2") or {}).get("candidates") or []
+        shortcode = item["code"]
+        return {
+            "id": str(item.get("pk") or item.get("id") or shortcode),
+            "shortcode": shortcode,
+            "url": f"https://www.instagram.com/p/{shortcode}/",
+            "caption": caption,
+            "timestamp": _timestamp(item.get("taken_at")),
+            "display_url": candidates[0].get("url") if candidates else None,
+            "likes_count": item.get("like_count"),
+            "comments_count": item.get("comment_count"),
+            "is_video": item.get("media_type") == 2,
+            "pinned": bool(item.get("timeline_pinned_user_ids")),
+        }
+
+
+def _count(edge: Any) -> Optional[int]:
+    """Read `count` from a GraphQL edge container"""
+    if isinstance(edge, dict) and isinstance(edge.get("count"), int):
+        return edge["count"]
+    return None
+
+
+def _timestamp(value: Any) -> Optional[datetime]:
+    if isinstance(value, (int, float)) and value > 0:
+        return datetime.fromtimestamp(value, tz=timezone.utc)
+    return None
@@ -1,39 +1,49 @@
-import requests
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from src.core.config import config
 
+def event_payload(event_data: Dict[str, Any], club_name: str) -> Dict[str, Any]:
+    """Transform data to match backend expectations"""
+    payload = {
+        "title": event_data.get("caption", "Instagram Post")[:100] if event_data.get("caption") else "New Instagram Post",
+        "description": event_data.get("caption", ""),
+        "event_date": event_data.get("timestamp") or "2026-01-20T10:00:00Z", # Fallback date if null
+        "location": "Instagram",
+        "source": "scraped",
+        "instagram_post_url": event_data.get("url"),
+        "club_name": club_name
+    }
+
+    # If timestamp is null (which it is for public scrape), usage current or future date
+    # In a real scenario, we might want to skip events without dates,
+    # but for this demo visualization, we'll put them as 'Upcoming'
+    return payload
+
 class BackendClient:
-    def __init__(self, base_url: str = "http://localhost:3001"):
+    def __init__(self, base_url: str = "http://localhost:3001", batch_size: Optional[int] = None):
         self.base_url = base_url
         self.api_key = "hive-scraper-secret-key"
         self.headers = {
             "Content-Type": "application/json",
             "x-api-key": self.api_key
         }
+        self.batch_size = batch_size or config.get("backend.batch_size", 50)
+        # requests loads with the first client, not with every module that imports this one
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        # One keep-alive connection pool for every request, shared by the pipeline sink threads
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        self.session.mount("http://", HTTPAdapter(pool_maxsize=config.get("backend.pool_size", 4)))
+        self.session.mount("https://", HTTPAdapter(pool_maxsize=config.get("backend.pool_size", 4)))
 
     def sync_event(self, event_data: Dict[str, Any], club_name: str) -> bool:
         """Send a scraped event to the backend"""
         url = f"{self.base_url}/api/events/scraped"
-        
-        # Transform data to match backend expectations
-        payload = {
-            "title": event_data.get("caption", "Instagram Post")[:100] if event_data.get("caption") else "New Instagram Post",
-            "description": event_data.get("caption", ""),
-            "event_date": event_data.get("timestamp") or "2026-01-20T10:00:00Z", # Fallback date if null
-            "location": "Instagram",
-            "source": "scraped",
-            "instagram_post_url": event_data.get("url"),
-            "club_name": club_name
-        }
-        
-        # If timestamp is null (which it is for public scrape), usage current or future date
-        # In a real scenario, we might want to skip events without dates, 
-        # but for this demo visualization, we'll put them as 'Upcoming'
-        if not event_data.get("timestamp"):
-             pass 
+        payload = event_payload(event_data, club_name)
 
         try:
-            response = requests.post(url, json=payload, headers=self.headers)
+            response = self.session.post(url, json=payload)
             if response.status_code in [200, 201]:
                 print(f"  ✓ Synced: {payload['title'][:30]}...")
                 return True
@@ -43,3 +53,44 @@ class BackendClient:
         except Exception as e:
             print(f"  ✗ Connection error: {e}")
             return False
+
+    def sync_events(self, events: List[Tuple[Dict[str, Any], str]]) -> int:
+        """
+        Send (event_data, club_name) pairs in batches of batch_size, one request and one
+        backend transaction per batch. Returns how many arrived (created or already there).
+        """
+        url = f"{self.base_url}/api/events/scraped/batch"
+        payloads = [event_payload(event_data, club_name) for event_data, club_name in events]
+        synced = 0
+
+        for start in range(0, len(payloads), self.batch_size):
+            chunk = payloads[start:start + self.batch_size]
+            try:
+                response = self.session.post(url, json={"events": chunk})
+            except Exception as e:
+                print(f"  ✗ Connection error: {e}")
+                continue
+
+            if response.status_code == 404:
+                # Backend without the batch endpoint: fall back to one request per event
+                synced += sum(self.sync_event(event_data, club_name)
+                              for event_data, club_name in events[start:start + self.batch_size])
+                continue
+            if response.status_code != 200:
+                print(f"  ✗ Failed to sync batch: {response.text}")
+                continue
+
+            for result in response.json().get("results", []):
+                title = chunk[result["index"]]["title"]
+                if result["status"] in ("created", "duplicate"):
+                    synced += 1
+                    print(f"  ✓ Synced: {title[:30]}...")
+                else:
+                    print(f"  ✗ Failed to sync {title[:30]}: {result.get('error')}")
+        return synced
+
+    def sync_profile(self, profile, username: str) -> bool:
+        """Send every post of a scraped profile, True if all of them arrived"""
+        sync_count = self.sync_events([(post.model_dump(mode="json"), username) for post in profile.posts])
+        print(f"Synced {sync_count} events to The Hive")
+        return sync_count == len(profile.posts)
@@ -0,0 +1,209 @@
+import asyncio
+import json
+import os
+import time
+from typing import Any, Dict, Optional, Tuple
+from src.core.pool import BrowserPool
+from src.scrapers.instagram import InstagramScraper
+from src.scrapers.club_finder import ClubSiteScraper
+from src.utils.backend_client import BackendClient
+
+REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+           500: "Internal Server Error"}
+
+
+class ScrapeDaemon:
+    """
+    Warm-browser scrape service: keeps a BrowserPool open and answers JSON jobs
+    over a small HTTP endpoint on localhost or a Unix socket.
+
+        POST /scrape  {"usernames": [...], "sync": false}  -> {"profiles": [...]}
+        POST /find    {"urls": [...]}                       -> {"links": {url: [...]}}
+        GET  /health                                        -> pool, job and wait stats
+
+    Contexts are recycled every `recycle_minutes` and after `recycle_after_jobs`
+    jobs, without interrupting jobs in flight.
+    """
+
+    def __init__(self, instagram: InstagramScraper, finder: ClubSiteScraper, pool: BrowserPool,
+                 recycle_minutes: float = 30, recycle_after_jobs: int = 200):
+        self.instagram = instagram
+        self.finder = finder
+        self.pool = pool
+        self.recycle_minutes = recycle_minutes
+        self.recycle_after_jobs = recycle_after_jobs
+        # One client for the lifetime of the daemon instead of one per username
+        self.backend_client = BackendClient()
+        self.started_at = time.time()
+        self.jobs_done = 0
+        self.jobs_failed = 0
+        self._jobs_since_recycle = 0
+        self._recycling = asyncio.Lock()
+
+    async def serve_forever(self, host: str = "127.0.0.1", port: int = 8765,
+                            socket_path: Optional[str] = None):
+        """Start the pool and answer requests until cancelled (Ctrl+C)"""
+        await self.pool.start()
+        if socket_path:
+            if os.path.exists(socket_path):
+                os.remove(socket_path)
+            server = await asyncio.start_unix_server(self._handle, path=socket_path)
+            print(f"Serving on unix socket {socket_path}")
+        else:
+            server = await asyncio.start_server(self._handle, host=host, port=port)
+            print(f"Serving on http://{host}:{port}")
+
+        recycler = asyncio.create_task(self._recycle_on_schedule())
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            recycler.cancel()
+            await self.pool.stop()
+            self.backend_client.session.close()
+            if socket_path and os.path.exists(socket_path):
+                os.remove(socket_path)
+
+    # --- jobs ---
+
+    async def scrape(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        usernames = payload.get("usernames") or []
+        if isinstance(usernames, str):
+            usernames = [usernames]
+        if not usernames:
+            raise ValueError("usernames is required")
+
+        profiles = await asyncio.gather(*[
+            self._run(username, self.instagram.scrape_async) for username in usernames
+        ])
+        synced = {}
+        if payload.get("sync"):
+            for username, profile in zip(usernames, profiles):
+                if profile:
+                    synced[username] = await asyncio.to_thread(self._sync, profile, username)
+
+        return {
+            "profiles": [profile.model_dump(mode="json") if profile else None for profile in profiles],
+            "synced": synced,
+        }
+
+    async def find(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        urls = payload.get("urls") or ([payload["url"]] if payload.get("url") else [])
+        if not urls:
+            raise ValueError("url or urls is required")
+
+        results = await asyncio.gather(*[self._run(url, self.finder.scrape_async) for url in urls])
+        return {"links": {url: links or [] for url, links in zip(urls, results)}}
+
+    def health(self) -> Dict[str, Any]:
+        stats = {
+            "status": "ok",
+            "uptime_seconds": round(time.time() - self.started_at),
+            "workers": self.pool.workers,
+            "generation": self.pool.generation,
+            "jobs_done": self.jobs_done,
+            "jobs_failed": self.jobs_failed,
+            "waits": self.instagram.waiter.recorder.summary(),
+        }
+        route_policy = self.instagram.browser_manager.route_policy
+        if route_policy:
+            stats["routing"] = route_policy.stats.as_dict()
+        rate_limiter = self.instagram.rate_limiter
+        if rate_limiter:
+            stats["rate_limit"] = rate_limiter.as_dict()
+        return stats
+
+    async def _run(self, target: str, handler) -> Any:
+        """One pooled job; failures are counted and reported as None"""
+        async with self._recycling:
+            pass  # Don't start new jobs while contexts are being swapped
+        try:
+            result = await self.pool.call(target, handler)
+            self.jobs_done += 1
+        except Exception as e:
+            print(f"Job failed for {target}: {e}")
+            self.jobs_failed += 1
+            result = None
+
+        self._jobs_since_recycle += 1
+        if self.recycle_after_jobs and self._jobs_since_recycle >= self.recycle_after_jobs:
+            await self._recycle("job count")
+        return result
+
+    def _sync(self, profile, username: str) -> bool:
+        ok = self.backend_client.sync_profile(profile, username)
+        watermarks = self.instagram.watermarks
+        if ok and watermarks:
+            watermarks.commit([username])
+        return ok
+
+    async def _recycle(self, reason: str):
+        async with self._recycling:
+            self._jobs_since_recycle = 0
+            await self.pool.recycle()
+            print(f"Recycled browser contexts ({reason}), generation {self.pool.generation}")
+
+    async def _recycle_on_schedule(self):
+        if not self.recycle_minutes:
+            return
+        while True:
+            await asyncio.sleep(self.recycle_minutes * 60)
+            await self._recycle("schedule")
+
+    # --- HTTP ---
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            status, body = await self._respond(reader)
+        except Exception as e:
+            status, body = 500, {"error": str(e)}
+
+        data = json.dumps(body, ensure_ascii=False, default=str).encode("utf-8")
+        head = (
+            f"HTTP/1.1 {status} {REASONS.get(status, '')}\r\n"
+            "Content-Type: application/json\r\n"
+            f"Content-Length: {len(data)}\r\n"
+            "Connection: close\r\n\r\n"
+        )
+        try:
+            writer.write(head.encode("latin-1") + data)
+            await writer.drain()
+        finally:
+            writer.close()
+
+    async def _respond(self, reader: asyncio.StreamReader) -> Tuple[int, Dict[str, Any]]:
+        request_line = (await reader.readline()).decode("latin-1").strip()
+        if not request_line:
+            return 400, {"error": "empty request"}
+        method, path = request_line.split(" ")[:2]
+        path = path.split("?")[0].rstrip("/") or "/"
+
+        headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            key, _, value = line.decode("latin-1").partition(":")
+            headers[key.strip().lower()] = value.strip()
+
+        length = int(headers.get("content-length") or 0)
+        try:
+            payload = json.loads(await reader.readexactly(length)) if length else {}
+        except ValueError:
+            return 400, {"error": "body must be JSON"}
+
+        routes = {
+            ("GET", "/health"): None,
+            ("POST", "/scrape"): self.scrape,
+            ("POST", "/find"): self.find,
+        }
+        if (method, path) not in routes:
+            known = any(route_path == path for _, route_path in routes)
+            return (405 if known else 404), {"error": f"{method} {path} not supported"}
+        if path == "/health":
+            return 200, self.health()
+
+        try:
+            return 200, await routes[(method, path)](payload)
+        except ValueError as e:
+            return 400, {"error": str(e)}
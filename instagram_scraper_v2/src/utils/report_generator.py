@@ -1,10 +1,38 @@
-import pandas as pd
+import csv
+import html as html_lib
 import sys
 from pathlib import Path
 
+def render_cell(value: str) -> str:
+    """Escaped cell text; URLs become links"""
+    text = html_lib.escape(value)
+    if value.startswith(("http://", "https://")):
+        return f'<a href="{text}" target="_blank">{text}</a>'
+    return text
+
+def render_table(csv_path):
+    """HTML table of a profiles CSV, read row by row; returns (table, rows, total posts)"""
+    rows = 0
+    total_posts = 0
+    parts = []
+    with open(csv_path, newline="", encoding="utf-8") as f:
+        reader = csv.reader(f)
+        header = next(reader, [])
+        posts_column = header.index("posts") if "posts" in header else None
+        parts.append("<table><thead><tr>")
+        parts.extend(f"<th>{html_lib.escape(name)}</th>" for name in header)
+        parts.append("</tr></thead><tbody>")
+        for row in reader:
+            rows += 1
+            if posts_column is not None and posts_column < len(row) and row[posts_column].isdigit():
+                total_posts += int(row[posts_column])
+            parts.append("<tr>" + "".join(f"<td>{render_cell(cell)}</td>" for cell in row) + "</tr>")
+        parts.append("</tbody></table>")
+    return "\n".join(parts), rows, total_posts
+
 def generate_report(csv_path):
     try:
-        df = pd.read_csv(csv_path)
+        table, rows, total_posts = render_table(csv_path)
         
         # Add basic styling
         html = f"""
@@ -33,23 +61,23 @@ def generate_report(csv_path):
                 
                 <div class="stats">
                     <div class="stat-card">
-                        <div class="stat-value">{len(df)}</div>
+                        <div class="stat-value">{rows}</div>
                         <div class="stat-label">Profiles Scraped</div>
                     </div>
                     <div class="stat-card">
-                        <div class="stat-value">{df['posts'].sum() if 'posts' in df.columns else 0}</div>
+                        <div class="stat-value">{total_posts}</div>
                         <div class="stat-label">Total Posts Found In Batch</div>
                     </div>
                 </div>
 
-                {df.to_html(index=False, escape=False, render_links=True)}
+                {table}
             </div>
         </body>
         </html>
         """
         
         output_path = Path(csv_path).parent / "report.html"
-        with open(output_path, "w") as f:
+        with open(output_path, "w", encoding="utf-8") as f:
             f.write(html)
             
         return output_path
@@ -0,0 +1,319 @@
+import os
+import queue
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Tuple
+
+from src.core.watermark import DEFAULT_DB_PATH
+
+# Writer thread commands, queued behind the rows they follow
+_FLUSH = "flush"
+_STOP = "stop"
+
+# Same rules as POST /api/events/scraped: unknown clubs are created, and an event of the
+# same club, title and date is a duplicate. NOT EXISTS keeps both idempotent under executemany.
+CLUB_INSERT = """
+    INSERT INTO clubs (name, instagram_url, password_hash, is_admin)
+    SELECT ?, ?, 'scraped_account', 0
+    WHERE NOT EXISTS (SELECT 1 FROM clubs WHERE name = ? COLLATE NOCASE)
+"""
+EVENT_INSERT = """
+    INSERT INTO events (club_id, title, description, event_date, location, category, source, status, image_url)
+    SELECT ?, ?, ?, ?, ?, ?, 'scraped', 'published', ?
+    WHERE NOT EXISTS (SELECT 1 FROM events WHERE club_id = ? AND title = ? AND event_date = ?)
+"""
+# Added to events on first use (schema.sql has them for new databases):
+# which parser version last read the event, for reparse_events.py
+PARSE_COLUMNS = (
+    ("parser_version", "INTEGER"),
+    ("parsed_at", "DATETIME"),
+)
+# The duplicate check of every insert
+DEDUPE_INDEX = "CREATE INDEX IF NOT EXISTS idx_events_dedupe ON events(club_id, title, event_date)"
+# Empty fields keep the stored value
+EVENT_UPDATE = """
+    UPDATE events SET
+        title = COALESCE(?, title),
+        location = COALESCE(?, location),
+        category = COALESCE(?, category),
+        event_date = COALESCE(?, event_date),
+        updated_at = CURRENT_TIMESTAMP
+    WHERE id = ?
+"""
+EVENT_MARK_PARSED = "UPDATE events SET parser_version = ?, parsed_at = CURRENT_TIMESTAMP WHERE id = ?"
+
+
+class WriterLock:
+    """
+    hive.db.lock, which the backend (database/db.js) also takes before it touches the file.
+    sql.js rewrites the whole database file, so SQLite's own locking cannot keep the two
+    writers apart; whoever holds this lock file may write, the other side waits.
+    """
+
+    def __init__(self, db_path: str, timeout: float, stale_after: float = 30.0):
+        self.path = db_path + ".lock"
+        self.timeout = timeout
+        self.stale_after = stale_after  # Left behind by a crashed writer
+
+    def __enter__(self) -> "WriterLock":
+        deadline = time.monotonic() + self.timeout
+        while True:
+            try:
+                fd = os.open(self.path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            except FileExistsError:
+                try:
+                    if time.time() - os.path.getmtime(self.path) > self.stale_after:
+                        os.remove(self.path)
+                        continue
+                except FileNotFoundError:
+                    continue
+                if time.monotonic() > deadline:
+                    raise sqlite3.OperationalError(f"{self.path} is held by another writer")
+                time.sleep(0.005)
+                continue
+            os.write(fd, str(os.getpid()).encode())
+            os.close(fd)
+            return self
+
+    def __exit__(self, *exc) -> None:
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+
+def connect(db_path: str, busy_timeout: float) -> sqlite3.Connection:
+    """Autocommit connection in WAL mode that waits up to busy_timeout for locks"""
+    conn = sqlite3.connect(db_path, timeout=busy_timeout, isolation_level=None)
+    conn.execute(f"PRAGMA busy_timeout = {int(busy_timeout * 1000)}")
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    return conn
+
+
+def prepare_database(db_path: str = DEFAULT_DB_PATH, busy_timeout: float = 30.0):
+    """Add the parse columns and the dedupe index to an existing hive.db"""
+    with WriterLock(db_path, busy_timeout):
+        conn = connect(db_path, busy_timeout)
+        try:
+            existing = {row[1] for row in conn.execute("PRAGMA table_info(events)")}
+            for name, sql_type in PARSE_COLUMNS:
+                if name not in existing:
+                    conn.execute(f"ALTER TABLE events ADD COLUMN {name} {sql_type}")
+            conn.execute(DEDUPE_INDEX)
+            conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        finally:
+            conn.close()
+
+
+class SinkStats:
+    """What the writer thread did, for the run report"""
+
+    def __init__(self):
+        self.created = 0
+        self.duplicates = 0
+        self.updated = 0
+        self.marked = 0
+        self.invalid = 0
+        self.failed = 0
+        self.transactions = 0
+        self.write_seconds = 0.0
+
+    def rows_per_second(self) -> float:
+        rows = self.created + self.duplicates + self.updated + self.marked
+        return rows / self.write_seconds if self.write_seconds else 0.0
+
+
+class SQLiteSink:
+    """
+    Writes scraped events straight into hive.db, for on-box runs without the HTTP API.
+
+    Callers only enqueue rows (a full queue makes them wait); one writer thread turns
+    them into executemany statements, `batch_size` rows per transaction, so there is
+    never more than one writer and each transaction holds the write lock briefly.
+    Connections use WAL and a busy timeout, so readers are not blocked meanwhile.
+
+    The Node backend (sql.js) keeps hive.db in memory and rewrites the whole file on
+    every change, so each transaction holds the shared WriterLock, runs on a fresh
+    connection (the backend may have rewritten the file since) and is checkpointed
+    back into the main file, the only one sql.js reads, before the lock is released.
+    The backend notices the new mtime and reloads the file on its next query.
+    Deliberately free of config lookups so it can be used from `scraper/` too.
+    """
+
+    def __init__(self, db_path: str = DEFAULT_DB_PATH, batch_size: int = 500, busy_timeout: float = 30.0,
+                 max_pending: int = 10000, flush_interval: float = 0.5):
+        self.db_path = db_path
+        self.batch_size = batch_size
+        self.busy_timeout = busy_timeout
+        self.flush_interval = flush_interval
+        self.stats = SinkStats()
+        self._queue: queue.Queue = queue.Queue(maxsize=max_pending)
+        self._failed_since_flush = 0
+        prepare_database(db_path, busy_timeout)
+        self._thread = threading.Thread(target=self._run, name="sqlite-sink", daemon=True)
+        self._thread.start()
+
+    def __enter__(self) -> "SQLiteSink":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def write(self, events: Iterable[Dict[str, Any]]) -> int:
+        """
+        Queue events shaped like the POST /api/events/scraped body (title, event_date,
+        club_name, ...). Returns how many were queued; incomplete ones are skipped.
+        """
+        queued = 0
+        for event in events:
+            if not event.get("title") or not event.get("event_date") or not (event.get("club_name") or "").strip():
+                self.stats.invalid += 1
+                continue
+            self._queue.put(("insert", event))
+            queued += 1
+        return queued
+
+    def update(self, event_id: int, updates: Dict[str, Any]):
+        """Queue new title / location / category / event_date values for a stored event"""
+        self._queue.put(("update", (
+            updates.get("title") or None,
+            updates.get("location") or None,
+            updates.get("category") or None,
+            updates.get("event_date") or None,
+            event_id,
+        )))
+
+    def mark_parsed(self, event_id: int, parser_version: int):
+        """Queue the parser_version that has now read a stored event (parsed_at becomes now)"""
+        self._queue.put(("mark", (parser_version, event_id)))
+
+    def flush(self) -> bool:
+        """Wait until everything queued so far is committed; True if none of it failed"""
+        done = threading.Event()
+        self._queue.put((_FLUSH, done))
+        done.wait()
+        ok = self._failed_since_flush == 0
+        self._failed_since_flush = 0
+        return ok
+
+    def close(self):
+        if self._thread.is_alive():
+            self._queue.put((_STOP, None))
+            self._thread.join()
+
+    def sync_events(self, events: List[Tuple[Dict[str, Any], str]]) -> int:
+        """BackendClient.sync_events() without the HTTP round trips"""
+        from src.utils.backend_client import event_payload
+
+        queued = self.write(event_payload(event_data, club_name) for event_data, club_name in events)
+        return queued if self.flush() else 0
+
+    def sync_profile(self, profile, username: str) -> bool:
+        """Write every post of a scraped profile, True if all of them were stored"""
+        sync_count = self.sync_events([(post.model_dump(mode="json"), username) for post in profile.posts])
+        print(f"Wrote {sync_count} events to {self.db_path}")
+        return sync_count == len(profile.posts)
+
+    def report(self) -> str:
+        stats = self.stats
+        marked = f", {stats.marked} marked parsed" if stats.marked else ""
+        return (f"SQLite sink: {stats.created} created, {stats.duplicates} already stored, {stats.updated} updated"
+                f"{marked}, {stats.invalid} incomplete, {stats.failed} failed; {stats.transactions} transactions, "
+                f"{stats.rows_per_second():.0f} rows/s")
+
+    def _run(self):
+        pending: List[Tuple[str, Any]] = []
+        while True:
+            try:
+                kind, item = self._queue.get(timeout=self.flush_interval if pending else None)
+            except queue.Empty:
+                # Nothing new for a while: commit what has gathered instead of waiting for a full batch
+                self._commit(pending)
+                pending = []
+                continue
+
+            if kind in ("insert", "update", "mark"):
+                pending.append((kind, item))
+                if len(pending) >= self.batch_size:
+                    self._commit(pending)
+                    pending = []
+                continue
+
+            self._commit(pending)
+            pending = []
+            if kind == _FLUSH:
+                item.set()
+            else:
+                return
+
+    def _commit(self, pending: List[Tuple[str, Any]]):
+        if not pending:
+            return
+        inserts = [item for kind, item in pending if kind == "insert"]
+        updates = [item for kind, item in pending if kind == "update"]
+        marks = [item for kind, item in pending if kind == "mark"]
+
+        started = time.monotonic()
+        try:
+            with WriterLock(self.db_path, self.busy_timeout):
+                conn = connect(self.db_path, self.busy_timeout)
+                try:
+                    conn.execute("BEGIN IMMEDIATE")
+                    created = self._insert(conn, inserts) if inserts else 0
+                    before = conn.total_changes
+                    if updates:
+                        conn.executemany(EVENT_UPDATE, updates)
+                    updated = conn.total_changes - before
+                    if marks:
+                        conn.executemany(EVENT_MARK_PARSED, marks)
+                    conn.execute("COMMIT")
+                    conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+                except sqlite3.Error:
+                    if conn.in_transaction:
+                        conn.execute("ROLLBACK")
+                    raise
+                finally:
+                    conn.close()
+        except sqlite3.Error as e:
+            self.stats.failed += len(pending)
+            self._failed_since_flush += len(pending)
+            print(f"SQLite sink: could not write {len(pending)} rows: {e}")
+            return
+        finally:
+            self.stats.write_seconds += time.monotonic() - started
+
+        self.stats.transactions += 1
+        self.stats.created += created
+        self.stats.duplicates += len(inserts) - created
+        self.stats.updated += updated
+        self.stats.marked += len(marks)
+
+    def _insert(self, conn: sqlite3.Connection, events: List[Dict[str, Any]]) -> int:
+        """Create missing clubs, then the events; returns how many events were new"""
+        names = {event["club_name"].strip().lower(): event["club_name"].strip() for event in events}
+        conn.executemany(CLUB_INSERT, [(name, f"https://instagram.com/{name}", name) for name in names.values()])
+        club_ids = {
+            key: conn.execute("SELECT id FROM clubs WHERE name = ? COLLATE NOCASE ORDER BY id LIMIT 1",
+                              (name,)).fetchone()[0]
+            for key, name in names.items()
+        }
+
+        before = conn.total_changes
+        conn.executemany(EVENT_INSERT, [
+            (
+                club_ids[event["club_name"].strip().lower()],
+                event["title"],
+                event.get("description") or "",
+                event["event_date"],
+                event.get("location") or "",
+                event.get("category") or None,
+                event.get("instagram_post_url"),  # Post URL as image/link placeholder, like the backend
+                club_ids[event["club_name"].strip().lower()],
+                event["title"],
+                event["event_date"],
+            )
+            for event in events
+        ])
+        return conn.total_changes - before
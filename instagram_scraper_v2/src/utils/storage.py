@@ -1,58 +1,213 @@
-import json
-import pandas as pd
+import csv
+import threading
+from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import List, Union, Dict, Any
+from typing import TYPE_CHECKING, List, Iterable, Dict, Any, Optional
 from datetime import datetime
 from src.core.config import config
-from src.models.data_models import InstagramProfile
+
+if TYPE_CHECKING:
+    from src.models.data_models import InstagramProfile
+
+# Flattened high-level columns of the CSV and Parquet outputs
+PROFILE_COLUMNS = ["username", "full_name", "followers", "following", "posts", "url", "scraped_at"]
+
+def flat_profile(p: "InstagramProfile") -> Dict[str, Any]:
+    """One CSV / Parquet row of a profile"""
+    return {
+        "username": p.username,
+        "full_name": p.full_name,
+        "followers": p.followers_count,
+        "following": p.following_count,
+        "posts": p.posts_count,
+        "url": f"https://instagram.com/{p.username}/",
+        "scraped_at": p.scraped_at
+    }
+
+class ProfileWriter(ABC):
+    """Appends profiles to one output file as they arrive, so a run never holds them all"""
+    suffix = ""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.count = 0
+
+    @abstractmethod
+    def write(self, profile: "InstagramProfile"):
+        """Append one profile to the file"""
+        pass
+
+    def close(self):
+        pass
+
+class JsonlWriter(ProfileWriter):
+    """Full nested data, one profile per line (pydantic-core's encoder, no dict round trip)"""
+    suffix = ".jsonl"
+
+    def __init__(self, path: Path):
+        super().__init__(path)
+        self._file = open(path, "wb")
+
+    def write(self, profile: "InstagramProfile"):
+        self._file.write(profile.model_dump_json().encode("utf-8") + b"\n")
+        self.count += 1
+
+    def close(self):
+        self._file.close()
+
+class JsonWriter(JsonlWriter):
+    """Full nested data as one JSON array, still written a profile at a time"""
+    suffix = ".json"
+
+    def write(self, profile: "InstagramProfile"):
+        self._file.write(b",\n" if self.count else b"[\n")
+        self._file.write(profile.model_dump_json().encode("utf-8"))
+        self.count += 1
+
+    def close(self):
+        self._file.write(b"\n]\n" if self.count else b"[]\n")
+        self._file.close()
+
+class CsvWriter(ProfileWriter):
+    """Flattened high-level data, a row per profile"""
+    suffix = ".csv"
+
+    def __init__(self, path: Path):
+        super().__init__(path)
+        self._file = open(path, "w", encoding="utf-8", newline="")
+        self._writer = csv.DictWriter(self._file, fieldnames=PROFILE_COLUMNS)
+        self._writer.writeheader()
+
+    def write(self, profile: "InstagramProfile"):
+        self._writer.writerow(flat_profile(profile))
+        self.count += 1
+
+    def close(self):
+        self._file.close()
+
+class ParquetWriter(ProfileWriter):
+    """Flattened high-level data as Parquet (needs pyarrow), a row group per `row_group` profiles"""
+    suffix = ".parquet"
+
+    def __init__(self, path: Path, row_group: int = 1000):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        super().__init__(path)
+        self._pa = pa
+        self.row_group = row_group
+        self.schema = pa.schema([
+            ("username", pa.string()),
+            ("full_name", pa.string()),
+            ("followers", pa.int64()),
+            ("following", pa.int64()),
+            ("posts", pa.int64()),
+            ("url", pa.string()),
+            ("scraped_at", pa.timestamp("us")),
+        ])
+        self._writer = pq.ParquetWriter(str(path), self.schema)
+        self._rows: List[Dict[str, Any]] = []
+
+    def write(self, profile: "InstagramProfile"):
+        self._rows.append(flat_profile(profile))
+        self.count += 1
+        if len(self._rows) >= self.row_group:
+            self._flush()
+
+    def close(self):
+        self._flush()
+        self._writer.close()
+
+    def _flush(self):
+        if self._rows:
+            self._writer.write_table(self._pa.Table.from_pylist(self._rows, schema=self.schema))
+            self._rows = []
+
+WRITERS = {
+    "jsonl": JsonlWriter,
+    "json": JsonWriter,
+    "csv": CsvWriter,
+    "parquet": ParquetWriter,
+}
+
+class RunStore:
+    """
+    The output files of one run, fed a profile at a time. Nothing is created until the
+    first profile arrives, so a run without results leaves no empty directory behind.
+    Safe to share between the pipeline's sink threads.
+    """
+
+    def __init__(self, run_dir: Path, filename_prefix: str, formats: List[str]):
+        self.run_dir = run_dir
+        self.filename_prefix = filename_prefix
+        self.formats = formats
+        self.writers: List[ProfileWriter] = []
+        self._opened = False
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> "RunStore":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def write(self, profile: "InstagramProfile"):
+        with self._lock:
+            if not self._opened:
+                self._open()
+            for writer in self.writers:
+                writer.write(profile)
+
+    def close(self):
+        with self._lock:
+            for writer in self.writers:
+                writer.close()
+                print(f"Saved {writer.count} profiles to {writer.path}")
+            self.writers = []
+
+    def _open(self):
+        self._opened = True
+        self.run_dir.mkdir(parents=True, exist_ok=True)
+        for fmt in self.formats:
+            writer_class = WRITERS.get(fmt)
+            if writer_class is None:
+                print(f"Unknown output format '{fmt}', expected one of {', '.join(WRITERS)}")
+                continue
+            path = self.run_dir / f"{self.filename_prefix}{writer_class.suffix}"
+            try:
+                if writer_class is ParquetWriter:
+                    writer = ParquetWriter(path, row_group=config.get("storage.parquet_row_group", 1000))
+                else:
+                    writer = writer_class(path)
+            except ImportError:
+                print(f"Skipping {fmt} output: pyarrow is not installed")
+                continue
+            self.writers.append(writer)
 
 class DataManager:
-    def __init__(self):
+    def __init__(self, formats: Optional[List[str]] = None):
         self.output_dir = Path(config.get("paths.output_dir", "data/output"))
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.formats = formats or config.get("storage.formats", ["jsonl", "csv"])
 
-    def save_profiles(self, profiles: List[InstagramProfile], filename_prefix: str = "profiles"):
-        """Save list of profiles to JSON and CSV"""
+    def run_dir(self) -> Path:
+        """Specific dir for a run started now"""
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        
-        # specific dir for this run
-        run_dir = self.output_dir / f"run_{timestamp}"
-        run_dir.mkdir(exist_ok=True)
-        
-        # Convert to list of dicts
-        data = [p.model_dump() for p in profiles]
-        
-        # Save JSON (Full nested data)
-        json_path = run_dir / f"{filename_prefix}.json"
-        with open(json_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2, default=str)
-            
-        print(f"Saved JSON to {json_path}")
-        
-        # Save CSV (Flattened high-level data)
-        flat_data = []
-        for p in profiles:
-            flat = {
-                "username": p.username,
-                "full_name": p.full_name,
-                "followers": p.followers_count,
-                "following": p.following_count,
-                "posts": p.posts_count,
-                "url": f"https://instagram.com/{p.username}/",
-                "scraped_at": p.scraped_at
-            }
-            flat_data.append(flat)
-            
-        if flat_data:
-            df = pd.DataFrame(flat_data)
-            csv_path = run_dir / f"{filename_prefix}.csv"
-            df.to_csv(csv_path, index=False)
-            print(f"Saved CSV to {csv_path}")
+        return self.output_dir / f"run_{timestamp}"
+
+    def open_run(self, filename_prefix: str = "profiles") -> RunStore:
+        """Writers for profiles as they are scraped, in the configured storage.formats"""
+        return RunStore(self.run_dir(), filename_prefix, self.formats)
+
+    def save_profiles(self, profiles: Iterable["InstagramProfile"], filename_prefix: str = "profiles"):
+        """Save profiles (any iterable, consumed once) in the configured formats"""
+        with self.open_run(filename_prefix) as store:
+            for p in profiles:
+                store.write(p)
 
     def save_links(self, links: List[str], filename: str = "found_links.txt"):
         """Save a simple list of links"""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        run_dir = self.output_dir / f"run_{timestamp}"
+        run_dir = self.run_dir()
         run_dir.mkdir(exist_ok=True)
 
         path = run_dir / filename
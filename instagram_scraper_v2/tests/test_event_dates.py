@@ -0,0 +1,49 @@
+from datetime import datetime
+
+import pytest
+
+from src.scrapers.event_dates import parse_event_date
+
+NOW = datetime(2025, 3, 1, 12, 0)
+
+
+@pytest.mark.parametrize("text, start, end", [
+    ("📅 Tarih: 15 Mart 2025\n🕐 Saat: 14:00 - 22:00\n📍 Yer: İTÜ Ayazağa",
+     datetime(2025, 3, 15, 14, 0), datetime(2025, 3, 15, 22, 0)),
+    ("Cuma 18:00'de Merkez Kütüphane önünde buluşuyoruz!", datetime(2025, 3, 7, 18, 0), None),
+    ("Workshop on March 15, 2025 at 2pm, room 101", datetime(2025, 3, 15, 14, 0), None),
+    ("KAYIT: 12.04.2025 saat 10.00", datetime(2025, 4, 12, 10, 0), None),
+    ("28 Şubat - 2 Mart tarihleri arasında festival", datetime(2025, 2, 28), datetime(2025, 3, 2)),
+    ("2025-03-15T14:00:00", datetime(2025, 3, 15, 14, 0), None),
+    ("Sept. 3, 2025", datetime(2025, 9, 3), None),
+    ("Mar 15", datetime(2025, 3, 15), None),
+    ("15 Mart'ta Ayazağa'da", datetime(2025, 3, 15), None),
+    ("3 Aralıkta başlıyoruz", datetime(2025, 12, 3), None),
+])
+def test_dates(text, start, end):
+    parsed = parse_event_date(text, now=NOW)
+    assert parsed is not None
+    assert (parsed.start, parsed.end) == (start, end)
+
+
+@pytest.mark.parametrize("text", [
+    "aralıksız 3 gün",   # suffixed "aralık" in front of a number
+    "ekimizle 20 kişi",  # suffixed "ekim"
+    "Martin 3",
+    "ara 5 dakika",      # Turkish abbreviation that is an everyday word
+    "",
+])
+def test_not_dates(text):
+    assert parse_event_date(text, now=NOW) is None
+
+
+def test_past_date_without_year_moves_to_next_year():
+    assert parse_event_date("15 Şubat", now=NOW).start == datetime(2026, 2, 15)
+
+
+def test_confidence():
+    assert parse_event_date("2025-03-15T14:00", now=NOW).confidence == 1.0
+    assert parse_event_date("15 Mart", now=NOW).confidence == 0.75
+    # Cumartesi is the weekday of 15 March 2025; Pazartesi is not
+    assert parse_event_date("15 Mart Cumartesi", now=NOW).confidence == 0.8
+    assert parse_event_date("15 Mart Pazartesi", now=NOW).confidence == 0.5
@@ -1,11 +1,18 @@
 """
 The Hive - Reparse Scraped Events
-Re-processes existing scraped events in the database using the LLM parser
+Re-processes scraped events in the database using the LLM parser.
+Only events that were never parsed, or were parsed by an older PARSER_VERSION, are
+picked up; they stream through in chunks, and an interrupted run resumes where it
+left off (reparse_checkpoint.json) when started again.
 """
 
+import argparse
+import json
 import sqlite3
 import os
 import sys
+import time
+from datetime import datetime
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -14,62 +21,115 @@ load_dotenv()
 # Add scraper directory to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'scraper'))
 
-from scraper.llm_parser import parse_event_with_llm
+from scraper.llm_parser import (LLM_MAX_CONCURRENCY, PARSE_FAILED, PARSER_VERSION, get_cache,
+                                parse_events_with_batch_job, parse_events_with_llm)
+
+# Direct hive.db writer shared with the v2 package
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'instagram_scraper_v2'))
+from src.utils.sqlite_sink import SQLiteSink, prepare_database
 
 DB_PATH = os.path.join(os.path.dirname(__file__), 'backend', 'database', 'hive.db')
+JOB_PATH = os.path.join(os.path.dirname(__file__), 'reparse_job.jsonl')
+CHECKPOINT_PATH = os.path.join(os.path.dirname(__file__), 'reparse_checkpoint.json')
+# Events per chunk: read, parsed concurrently, then committed and checkpointed together
+CHUNK_SIZE = 200
+BATCH_JOB_CHUNK_SIZE = 5000
 
+EVENT_COLUMNS = '''e.id, e.title, e.description, e.location, e.category, e.event_date,
+               c.name as club_name'''
 
-def get_scraped_events():
-    """Get all scraped events from the database"""
-    conn = sqlite3.connect(DB_PATH)
-    conn.row_factory = sqlite3.Row
-    cursor = conn.cursor()
-    
-    cursor.execute('''
-        SELECT e.id, e.title, e.description, e.location, e.category, e.event_date,
-               c.name as club_name
+
+def events_query(columns, after_id, reparse_all):
+    """Scraped events after after_id in id order; only stale or never parsed ones unless reparse_all"""
+    query = f'''
+        SELECT {columns}
         FROM events e
         LEFT JOIN clubs c ON e.club_id = c.id
-        WHERE e.source = 'scraped'
-    ''')
-    
-    events = cursor.fetchall()
-    conn.close()
-    return events
+        WHERE e.source = 'scraped' AND e.id > ?
+    '''
+    params = [after_id]
+    if not reparse_all:
+        query += ' AND (e.parser_version IS NULL OR e.parser_version < ?)'
+        params.append(PARSER_VERSION)
+    return query + ' ORDER BY e.id', params
 
 
-def update_event(event_id, updates):
-    """Update an event in the database"""
+def count_scraped_events(after_id=0, reparse_all=False):
+    """How many scraped events are left to parse"""
     conn = sqlite3.connect(DB_PATH)
-    cursor = conn.cursor()
-    
-    set_clauses = []
-    values = []
-    
-    if updates.get('title'):
-        set_clauses.append('title = ?')
-        values.append(updates['title'])
-    if updates.get('location'):
-        set_clauses.append('location = ?')
-        values.append(updates['location'])
-    if updates.get('category'):
-        set_clauses.append('category = ?')
-        values.append(updates['category'])
-    if updates.get('event_date'):
-        set_clauses.append('event_date = ?')
-        values.append(updates['event_date'])
-    
-    if set_clauses:
-        set_clauses.append('updated_at = CURRENT_TIMESTAMP')
-        query = f"UPDATE events SET {', '.join(set_clauses)} WHERE id = ?"
-        values.append(event_id)
-        cursor.execute(query, values)
-        conn.commit()
-    
+    count = conn.execute(*events_query('COUNT(*)', after_id, reparse_all)).fetchone()[0]
     conn.close()
+    return count
+
+
+def iter_scraped_events(after_id=0, chunk_size=CHUNK_SIZE, reparse_all=False):
+    """
+    Scraped events to parse, chunk_size rows at a time. Each chunk is read on its own
+    short connection, so no read transaction stays open (and pins the WAL) while the
+    sink commits the previous chunk.
+    """
+    while True:
+        conn = sqlite3.connect(DB_PATH)
+        conn.row_factory = sqlite3.Row
+        rows = conn.execute(*events_query(EVENT_COLUMNS, after_id, reparse_all)).fetchmany(chunk_size)
+        conn.close()
+        
+        if not rows:
+            return
+        yield rows
+        after_id = rows[-1]['id']
+
+
+def load_checkpoint(path, reparse_all):
+    """Progress of an interrupted run with the same parser version and scope, or None"""
+    if not os.path.exists(path):
+        return None
+    with open(path, encoding='utf-8') as f:
+        checkpoint = json.load(f)
+    if checkpoint.get('parser_version') != PARSER_VERSION or checkpoint.get('all') != reparse_all:
+        print(f"[!] Ignoring {os.path.basename(path)}: it belongs to a run with other settings")
+        return None
+    return checkpoint
+
+
+def save_checkpoint(path, checkpoint):
+    """Write the checkpoint atomically, so a crash leaves the previous one intact"""
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(checkpoint, f, indent=2)
+    os.replace(tmp_path, path)
+
+
+def parse_chunk(rows, args):
+    """LLM results for one chunk of events, in order; PARSE_FAILED where the LLM could not answer"""
+    # Combine title and description for parsing; the whole chunk goes to the LLM at once
+    contents = [(f"{event['title']}\n\n{event['description'] or ''}", event['club_name']) for event in rows]
+    if args.batch_job:
+        return parse_events_with_batch_job(contents, args.job_file, poll_seconds=args.poll,
+                                           use_cache=not args.refresh, report_failures=True)
+    return parse_events_with_llm(contents, use_cache=not args.refresh, report_failures=True)
 
 
 def main():
+    arg_parser = argparse.ArgumentParser(description="The Hive - Reparse scraped events with the LLM parser")
+    arg_parser.add_argument('--all', action='store_true',
+                            help=f'Reparse every scraped event, not only those parser v{PARSER_VERSION} has not read')
+    arg_parser.add_argument('--restart', action='store_true',
+                            help='Start from the first event instead of resuming an interrupted run')
+    arg_parser.add_argument('--chunk', type=int, metavar='EVENTS',
+                            help=f'Events read, parsed and committed together (default {CHUNK_SIZE}, '
+                                 f'{BATCH_JOB_CHUNK_SIZE} with --batch-job)')
+    arg_parser.add_argument('--refresh', action='store_true',
+                            help='Ask the LLM again instead of reusing cached answers (they are still updated)')
+    arg_parser.add_argument('--batch-job', action='store_true',
+                            help='Submit each chunk as one offline batch job and wait for it '
+                                 'instead of making interactive calls')
+    arg_parser.add_argument('--job-file', default=JOB_PATH, help='JSONL job file written for --batch-job')
+    arg_parser.add_argument('--poll', type=float, default=30, metavar='SECONDS',
+                            help='How often to check on the batch job')
+    args = arg_parser.parse_args()
+    chunk_size = args.chunk or (BATCH_JOB_CHUNK_SIZE if args.batch_job else CHUNK_SIZE)
+    
     print("=" * 60)
     print("THE HIVE - Reparse Scraped Events with LLM")
     print("=" * 60)
@@ -79,68 +139,120 @@ def main():
         print("[X] Error: OPENAI_API_KEY not set in environment")
         return
     
-    # Get scraped events
-    events = get_scraped_events()
-    print(f"\nFound {len(events)} scraped events in database\n")
+    # Older databases get the parser_version / parsed_at columns here
+    prepare_database(DB_PATH)
+    
+    checkpoint = None if args.restart else load_checkpoint(CHECKPOINT_PATH, args.all)
+    if checkpoint:
+        print(f"\nResuming the run started {checkpoint['started_at']}: "
+              f"{checkpoint['processed']} events done, continuing after event {checkpoint['last_id']}")
+    else:
+        checkpoint = {
+            'parser_version': PARSER_VERSION,
+            'all': args.all,
+            'started_at': datetime.now().isoformat(timespec='seconds'),
+            'last_id': 0,
+            'processed': 0,
+            'updated': 0,
+        }
+    
+    remaining = count_scraped_events(checkpoint['last_id'], args.all)
+    total = checkpoint['processed'] + remaining
+    scope = "scraped events" if args.all else f"scraped events not parsed by parser v{PARSER_VERSION} yet"
+    print(f"\nFound {remaining} {scope} in database\n")
     
-    if not events:
+    if not remaining:
         print("No scraped events to process.")
+        if os.path.exists(CHECKPOINT_PATH):
+            os.remove(CHECKPOINT_PATH)
         return
     
-    updated_count = 0
+    if args.batch_job:
+        print(f"Parsing {chunk_size} events per batch job ({args.job_file})...")
+    else:
+        print(f"Parsing {chunk_size} events per chunk with up to {LLM_MAX_CONCURRENCY} concurrent LLM requests...")
     
-    for i, event in enumerate(events):
-        event_id = event['id']
-        title = event['title']
-        description = event['description'] or ''
-        current_location = event['location']
-        current_category = event['category']
-        club_name = event['club_name']
-        
-        # Encode title for safe printing on Windows
-        safe_title = title[:50].encode('ascii', 'replace').decode('ascii')
-        print(f"[{i+1}/{len(events)}] Processing: {safe_title}...")
-        print(f"    Current location: {current_location}")
-        print(f"    Current category: {current_category}")
-        
-        # Combine title and description for parsing
-        content = f"{title}\n\n{description}"
-        
-        # Parse with LLM
-        parsed = parse_event_with_llm(content, club_name)
-        
-        if parsed:
-            updates = {}
-            
-            # Only update if LLM found better data
-            new_location = parsed.get('location')
-            new_category = parsed.get('category')
-            new_title = parsed.get('title')
-            
-            # Update location if current is empty, "Instagram", or LLM found something better
-            if new_location:
-                if not current_location or current_location.lower() == 'instagram' or len(current_location) < 5:
-                    updates['location'] = new_location
-                    print(f"    -> New location: {new_location}")
+    # Updates go through one writer thread; each chunk is committed before the checkpoint moves
+    sink = SQLiteSink(DB_PATH)
+    
+    try:
+        for rows in iter_scraped_events(checkpoint['last_id'], chunk_size, args.all):
+            started = time.perf_counter()
+            results = parse_chunk(rows, args)
+            print(f"Parsed {len(rows)} events in {time.perf_counter() - started:.1f}s\n")
             
-            # Update category if not set
-            if new_category and not current_category:
-                updates['category'] = new_category
-                print(f"    -> New category: {new_category}")
+            for i, (event, parsed) in enumerate(zip(rows, results)):
+                event_id = event['id']
+                title = event['title']
+                current_location = event['location']
+                current_category = event['category']
+                
+                # Encode title for safe printing on Windows
+                safe_title = title[:50].encode('ascii', 'replace').decode('ascii')
+                print(f"[{checkpoint['processed'] + i + 1}/{total}] Processing: {safe_title}...")
+                print(f"    Current location: {current_location}")
+                print(f"    Current category: {current_category}")
+                
+                if parsed is PARSE_FAILED:
+                    # Left unmarked, so the next run tries it again
+                    print(f"    [!] LLM parsing failed, skipping")
+                    print()
+                    continue
+                
+                if parsed:
+                    updates = {}
+                    
+                    # Only update if LLM found better data
+                    new_location = parsed.get('location')
+                    new_category = parsed.get('category')
+                    new_title = parsed.get('title')
+                    
+                    # Update location if current is empty, "Instagram", or LLM found something better
+                    if new_location:
+                        if not current_location or current_location.lower() == 'instagram' or len(current_location) < 5:
+                            updates['location'] = new_location
+                            print(f"    -> New location: {new_location}")
+                    
+                    # Update category if not set
+                    if new_category and not current_category:
+                        updates['category'] = new_category
+                        print(f"    -> New category: {new_category}")
+                    
+                    if updates:
+                        sink.update(event_id, updates)
+                        checkpoint['updated'] += 1
+                        print(f"    [OK] Updated!")
+                    else:
+                        print(f"    [--] No updates needed")
+                else:
+                    # Not an event, or too short to parse: asking again would give the same answer
+                    print(f"    [--] No event found")
+                sink.mark_parsed(event_id, PARSER_VERSION)
+                
+                print()
             
-            if updates:
-                update_event(event_id, updates)
-                updated_count += 1
-                print(f"    [OK] Updated!")
-            else:
-                print(f"    [--] No updates needed")
-        else:
-            print(f"    [!] LLM parsing failed, skipping")
-        
-        print()
+            if not sink.flush():
+                print("[X] Could not write this chunk to the database; run again to resume")
+                return
+            checkpoint['last_id'] = rows[-1]['id']
+            checkpoint['processed'] += len(rows)
+            save_checkpoint(CHECKPOINT_PATH, checkpoint)
+    
+    except KeyboardInterrupt:
+        print(f"\n\nInterrupted after {checkpoint['processed']} events; run again to resume.")
+        return
+    
+    finally:
+        sink.close()
+        print(sink.report())
+        cache = get_cache()
+        if cache:
+            print(cache.report())
+    
+    os.remove(CHECKPOINT_PATH)
     
     print("=" * 60)
-    print(f"Done! Updated {updated_count} out of {len(events)} events")
+    print(f"Done! Updated {checkpoint['updated']} out of {checkpoint['processed']} events")
     print("=" * 60)
 
 
@@ -3,25 +3,33 @@ The Hive - Club Scraper
 Scrapes ITU club list from ari24.com/kulupler to extract Instagram URLs
 """
 
+import argparse
 import json
+import os
 import re
-import time
+import sys
 from datetime import datetime
+from typing import Optional
 from playwright.sync_api import sync_playwright, Page
 
+# HAR record/replay is shared with the v2 package
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'instagram_scraper_v2'))
+from src.core.har import HarSession
 
-def scrape_clubs_list(page: Page) -> list[dict]:
+
+def scrape_clubs_list(page: Page, har: Optional[HarSession] = None) -> list[dict]:
     """
     Scrape the list of ITU clubs from ari24.com/kulupler
     Returns a list of clubs with their name and Instagram URL
     """
+    har = har or HarSession()
     clubs = []
     
     print("Navigating to clubs page...")
     page.goto("https://ari24.com/kulupler", wait_until="networkidle")
     
-    # Wait for content to load
-    time.sleep(2)
+    # Wait for content to load (skipped when replaying a HAR archive)
+    har.pause(2)
     
     # Get all club elements - adjust selectors based on actual page structure
     # This is a generic approach, may need adjustment based on actual HTML
@@ -88,6 +96,20 @@ def save_clubs_to_file(clubs: list[dict], filename: str = "clubs.json"):
 
 def main():
     """Main function to scrape clubs"""
+    arg_parser = argparse.ArgumentParser(description="The Hive - Club Scraper")
+    har_group = arg_parser.add_mutually_exclusive_group()
+    har_group.add_argument('--record', metavar='HAR', help='Record all browser traffic to a HAR archive')
+    har_group.add_argument('--replay', metavar='HAR',
+                           help='Serve browser traffic from a recorded HAR archive, offline and without pacing')
+    args = arg_parser.parse_args()
+    
+    if args.record:
+        har = HarSession('record', args.record)
+    elif args.replay:
+        har = HarSession('replay', args.replay)
+    else:
+        har = HarSession()
+    
     print("=" * 60)
     print("THE HIVE - Club Scraper")
     print("Scraping ITU clubs from ari24.com/kulupler")
@@ -101,12 +123,15 @@ def main():
         # Create a new page with a reasonable viewport
         context = browser.new_context(
             viewport={'width': 1280, 'height': 720},
-            user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+            user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+            **har.context_options()
         )
+        har.apply(context)
+        print(har.describe())
         page = context.new_page()
         
         try:
-            clubs = scrape_clubs_list(page)
+            clubs = scrape_clubs_list(page, har)
             
             if clubs:
                 save_clubs_to_file(clubs)
@@ -123,6 +148,7 @@ def main():
             
         finally:
             print("\nClosing browser...")
+            context.close()  # Flushes the HAR archive when recording
             browser.close()
     
     print("\nDone!")
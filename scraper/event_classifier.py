@@ -0,0 +1,291 @@
+"""
+The Hive - Local Event Classifier
+Small naive Bayes model that decides the clear cases before a caption is sent to the LLM.
+Trained from the reviewed rows of the events table in hive.db:
+
+    python event_classifier.py train [--examples extra.jsonl] [--threshold 0.9]
+    python event_classifier.py predict "Caption text..."
+
+Published events are events; archived scraped events are not. Extra labelled captions
+({"text": ..., "is_event": true/false, "category": ...} per line) can be added with
+--examples, e.g. recruitment posts and announcements that never made it into the table.
+"""
+
+import argparse
+import json
+import math
+import os
+import random
+import re
+import sqlite3
+import sys
+from collections import Counter
+from datetime import datetime
+from typing import NamedTuple, Optional
+
+# Turkish-safe casefolding, shared with the v2 package
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'instagram_scraper_v2'))
+from src.scrapers.event_matcher import fold
+
+DB_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'backend', 'database', 'hive.db')
+MODEL_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'event_model.json')
+# Bumped when the file layout or the features change; older files are ignored
+MODEL_FORMAT = 1
+# Event probability at or above this (or at or below 1 - this) is decided locally
+DEFAULT_THRESHOLD = 0.9
+
+# Words, digit runs folded to "#", and the emoji captions use as field markers (📅 📍 🕐)
+TOKEN_RE = re.compile(r'[^\W\d_]+|\d+|[\u2600-\u27bf\U0001f300-\U0001faff]')
+
+
+def tokenize(text: str) -> set[str]:
+    """Unigrams and bigrams of the folded text"""
+    words = ['#' if word.isdigit() else word for word in TOKEN_RE.findall(fold(text or ''))]
+    return set(words) | {f"{first} {second}" for first, second in zip(words, words[1:])}
+
+
+class NaiveBayes:
+    """Multinomial naive Bayes over token presence (binarized counts), add-one smoothing"""
+    
+    def __init__(self, class_counts: dict[str, int] = None, token_counts: dict[str, dict[str, int]] = None):
+        self.class_counts = class_counts or {}
+        self.token_counts = token_counts or {}
+        self._prepare()
+    
+    def fit(self, documents: list[set[str]], labels: list[str]) -> 'NaiveBayes':
+        self.class_counts = dict(Counter(labels))
+        self.token_counts = {label: Counter() for label in self.class_counts}
+        for tokens, label in zip(documents, labels):
+            self.token_counts[label].update(tokens)
+        self.token_counts = {label: dict(counts) for label, counts in self.token_counts.items()}
+        self._prepare()
+        return self
+    
+    def predict_proba(self, tokens: set[str]) -> dict[str, float]:
+        scores = {}
+        for label, prior in self._priors.items():
+            log_probs = self._log_probs[label]
+            unseen = self._unseen[label]
+            scores[label] = prior + sum(log_probs.get(token, unseen) for token in tokens if token in self._vocabulary)
+        top = max(scores.values(), default=0.0)
+        weights = {label: math.exp(score - top) for label, score in scores.items()}
+        total = sum(weights.values())
+        return {label: weight / total for label, weight in weights.items()}
+    
+    def to_dict(self) -> dict:
+        return {'class_counts': self.class_counts, 'token_counts': self.token_counts}
+    
+    def _prepare(self):
+        """Precompute log probabilities so prediction is one dict lookup per token"""
+        documents = sum(self.class_counts.values())
+        self._vocabulary = {token for counts in self.token_counts.values() for token in counts}
+        self._priors = {label: math.log(count / documents) for label, count in self.class_counts.items()}
+        self._log_probs = {}
+        self._unseen = {}
+        for label, counts in self.token_counts.items():
+            denominator = math.log(sum(counts.values()) + len(self._vocabulary))
+            self._log_probs[label] = {token: math.log(count + 1) - denominator for token, count in counts.items()}
+            self._unseen[label] = -denominator
+
+
+class Prediction(NamedTuple):
+    event_probability: float
+    category: Optional[str]
+    category_probability: float
+
+
+class EventClassifier:
+    """
+    Event likelihood and category of a caption. decide() returns 'event' or
+    'not_event' when the model is confident and 'uncertain' otherwise; only
+    uncertain captions need the LLM. Decisions are counted for the run report.
+    """
+    
+    def __init__(self, event_model: Optional[NaiveBayes], category_model: Optional[NaiveBayes],
+                 threshold: float = DEFAULT_THRESHOLD, version: int = 1, trained_at: str = None,
+                 examples: dict = None):
+        self.event_model = event_model
+        self.category_model = category_model
+        self.threshold = threshold
+        self.version = version
+        self.trained_at = trained_at
+        self.examples = examples or {}
+        self.decisions = Counter()
+    
+    def predict(self, text: str) -> Prediction:
+        tokens = tokenize(text)
+        event_probability = 0.5
+        if self.event_model:
+            event_probability = self.event_model.predict_proba(tokens).get('event', 0.0)
+        category, category_probability = None, 0.0
+        if self.category_model:
+            category, category_probability = max(self.category_model.predict_proba(tokens).items(),
+                                                  key=lambda item: item[1])
+        return Prediction(event_probability, category, category_probability)
+    
+    def decide(self, text: str) -> tuple[str, Prediction]:
+        prediction = self.predict(text)
+        if not self.event_model:
+            decision = 'uncertain'  # Trained without non-events: can't rule anything out
+        elif prediction.event_probability >= self.threshold:
+            decision = 'event'
+        elif prediction.event_probability <= 1 - self.threshold:
+            decision = 'not_event'
+        else:
+            decision = 'uncertain'
+        self.decisions[decision] += 1
+        return decision, prediction
+    
+    def report(self) -> str:
+        return (f"Event classifier v{self.version}: {self.decisions['event']} events and "
+                f"{self.decisions['not_event']} non-events decided locally, "
+                f"{self.decisions['uncertain']} sent on to the LLM")
+    
+    def save(self, path: str = MODEL_PATH):
+        model = {
+            'format': MODEL_FORMAT,
+            'version': self.version,
+            'trained_at': self.trained_at,
+            'threshold': self.threshold,
+            'examples': self.examples,
+            'event_model': self.event_model.to_dict() if self.event_model else None,
+            'category_model': self.category_model.to_dict() if self.category_model else None,
+        }
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(model, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+    
+    @classmethod
+    def load(cls, path: str = MODEL_PATH) -> Optional['EventClassifier']:
+        """The trained model, or None if there is none (every caption then goes to the LLM)"""
+        if not os.path.exists(path):
+            return None
+        with open(path, encoding='utf-8') as f:
+            model = json.load(f)
+        if model.get('format') != MODEL_FORMAT:
+            print(f"  [!] {os.path.basename(path)} has format {model.get('format')}, expected {MODEL_FORMAT}; "
+                  f"retrain with: python event_classifier.py train")
+            return None
+        return cls(
+            NaiveBayes(**model['event_model']) if model.get('event_model') else None,
+            NaiveBayes(**model['category_model']) if model.get('category_model') else None,
+            threshold=model.get('threshold', DEFAULT_THRESHOLD),
+            version=model.get('version', 1),
+            trained_at=model.get('trained_at'),
+            examples=model.get('examples'),
+        )
+
+
+def load_examples(db_path: str = DB_PATH, examples_path: str = None) -> list[tuple[str, bool, Optional[str]]]:
+    """(text, is_event, category) from the reviewed events rows plus an optional JSONL file"""
+    conn = sqlite3.connect(db_path)
+    rows = conn.execute('''
+        SELECT title, description, category, status = 'published'
+        FROM events
+        WHERE status = 'published' OR (status = 'archived' AND source = 'scraped')
+    ''').fetchall()
+    conn.close()
+    examples = [(f"{title}\n\n{description or ''}", bool(published), category) for title, description, category, published in rows]
+    
+    if examples_path:
+        with open(examples_path, encoding='utf-8') as f:
+            for line in f:
+                if line.strip():
+                    item = json.loads(line)
+                    examples.append((item['text'], bool(item.get('is_event')), item.get('category')))
+    return examples
+
+
+def fit(examples: list[tuple[str, bool, Optional[str]]], threshold: float = DEFAULT_THRESHOLD,
+        version: int = 1) -> EventClassifier:
+    documents = [tokenize(text) for text, _, _ in examples]
+    labels = ['event' if is_event else 'not_event' for _, is_event, _ in examples]
+    categorized = [(tokens, category) for tokens, (_, is_event, category) in zip(documents, examples)
+                   if is_event and category]
+    
+    event_model = NaiveBayes().fit(documents, labels) if len(set(labels)) == 2 else None
+    category_model = None
+    if len({category for _, category in categorized}) >= 2:
+        category_model = NaiveBayes().fit([tokens for tokens, _ in categorized],
+                                          [category for _, category in categorized])
+    
+    return EventClassifier(event_model, category_model, threshold=threshold, version=version,
+                           trained_at=datetime.now().isoformat(timespec='seconds'),
+                           examples={'events': labels.count('event'), 'non_events': labels.count('not_event'),
+                                     'categorized': len(categorized)})
+
+
+def cross_validate(examples: list[tuple[str, bool, Optional[str]]], threshold: float, folds: int = 5) -> Optional[dict]:
+    """How many captions the threshold decides locally, and how many of those it gets right"""
+    if len(examples) < folds or len({is_event for _, is_event, _ in examples}) < 2:
+        return None
+    shuffled = examples[:]
+    random.Random(0).shuffle(shuffled)
+    decided = correct = 0
+    for fold_index in range(folds):
+        train = [example for i, example in enumerate(shuffled) if i % folds != fold_index]
+        test = [example for i, example in enumerate(shuffled) if i % folds == fold_index]
+        classifier = fit(train, threshold)
+        for text, is_event, _ in test:
+            decision, _ = classifier.decide(text)
+            if decision != 'uncertain':
+                decided += 1
+                correct += (decision == 'event') == is_event
+    return {'decided': decided / len(examples), 'accuracy': correct / decided if decided else 0.0}
+
+
+def train(db_path: str = DB_PATH, examples_path: str = None, threshold: float = DEFAULT_THRESHOLD,
+          path: str = MODEL_PATH) -> EventClassifier:
+    """Fit on every labelled example and save the model as the next version"""
+    examples = load_examples(db_path, examples_path)
+    previous = EventClassifier.load(path)
+    classifier = fit(examples, threshold, version=previous.version + 1 if previous else 1)
+    
+    counts = classifier.examples
+    print(f"Trained on {counts['events']} events ({counts['categorized']} with a category) "
+          f"and {counts['non_events']} non-events")
+    if not classifier.event_model:
+        print("  [!] No non-event examples (archived scraped events or --examples): "
+              "every caption stays uncertain and goes to the LLM")
+    scores = cross_validate(examples, threshold)
+    if scores:
+        print(f"5-fold check at threshold {threshold}: {scores['decided']:.0%} of captions decided locally, "
+              f"{scores['accuracy']:.0%} of those correctly")
+    
+    classifier.save(path)
+    print(f"[OK] Saved model v{classifier.version} to {path}")
+    return classifier
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="The Hive - local event classifier")
+    commands = arg_parser.add_subparsers(dest='command', required=True)
+    
+    train_parser = commands.add_parser('train', help='Train on the labelled events in hive.db')
+    train_parser.add_argument('--db', default=DB_PATH, help='Path to hive.db')
+    train_parser.add_argument('--examples', help='Extra labelled captions (JSONL: text, is_event, category)')
+    train_parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                              help='Event probability from which captions are decided without the LLM')
+    train_parser.add_argument('--out', default=MODEL_PATH, help='Model file to write')
+    
+    predict_parser = commands.add_parser('predict', help='Classify a caption with the saved model')
+    predict_parser.add_argument('text')
+    predict_parser.add_argument('--model', default=MODEL_PATH)
+    args = arg_parser.parse_args()
+    
+    if args.command == 'train':
+        train(args.db, args.examples, args.threshold, args.out)
+        return
+    
+    classifier = EventClassifier.load(args.model)
+    if not classifier:
+        print("[X] No model found, run: python event_classifier.py train")
+        return
+    decision, prediction = classifier.decide(args.text)
+    print(f"{decision}: event probability {prediction.event_probability:.2f}, "
+          f"category {prediction.category} ({prediction.category_probability:.2f})")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,40 +3,83 @@ The Hive - Instagram Event Scraper
 Scrapes Instagram posts from club pages to extract event information
 """
 
+import argparse
 import json
 import re
+import sys
 import time
-import requests
 import os
 from datetime import datetime, timedelta
-from dateutil import parser as date_parser
-from playwright.sync_api import sync_playwright, Page
 from typing import Optional
 from dotenv import load_dotenv
 
 import logging
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler("scraper.log", encoding='utf-8'),
-        logging.StreamHandler()
-    ]
-)
+# Playwright, requests, asyncio and the LLM parser (OpenAI SDK) are imported where they
+# are first needed, so --help and --dry-run start fast (see startup_budget.py)
 
 # Load environment variables
 load_dotenv()
 
-# Import LLM parser
-try:
-    from llm_parser import parse_event_with_llm
-    LLM_AVAILABLE = True
-    logging.info("LLM parser imported successfully")
-except ImportError:
-    LLM_AVAILABLE = False
-    logging.warning("LLM parser not available, using regex fallback")
+
+def setup_logging():
+    """Log to scraper.log and the console; done by main(), not on import"""
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s',
+        handlers=[
+            logging.FileHandler("scraper.log", encoding='utf-8'),
+            logging.StreamHandler()
+        ]
+    )
+
+
+# llm_parser module once imported, False if it could not be
+_llm_parser = None
+
+
+def load_llm_parser():
+    """The LLM parser, imported on first use; None if unavailable (regex fallback)"""
+    global _llm_parser
+    if _llm_parser is None:
+        try:
+            import llm_parser
+            _llm_parser = llm_parser
+            logging.info("LLM parser imported successfully")
+        except ImportError:
+            _llm_parser = False
+            logging.warning("LLM parser not available, using regex fallback")
+    return _llm_parser or None
+
+
+def llm_parser_for(count: int):
+    """The LLM parser when there is something to parse and an API key to parse it with"""
+    if count and os.getenv('OPENAI_API_KEY'):
+        return load_llm_parser()
+    return None
+
+# Local model that settles clear event/non-event captions before they reach the LLM
+from event_classifier import EventClassifier
+from run_log import RunLog, build_json
+
+
+# Shared browser infrastructure (worker pool, waits, routing, response capture, DOM extraction,
+# watermarks, HAR record/replay, scheduling) lives in the v2 package
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'instagram_scraper_v2'))
+from src.core.waits import Waiter
+from src.scrapers.response_capture import ResponseCapture
+from src.scrapers.dom_extract import extract_page, extract_page_async, parse_datetime
+from src.core.routing import RoutePolicy
+from src.core.watermark import Watermark, WatermarkStore, club_key, fresh_posts, newest_post, shortcode_from_url
+from src.core.har import HarSession
+from src.core.scheduler import ClubScheduler
+from src.core.ratelimit import RateLimiter
+from src.scrapers.event_matcher import EventMatcher, TextCues
+from src.scrapers.event_dates import parse_event_date
+from src.utils.sqlite_sink import SQLiteSink
+
+VIEWPORT = {'width': 1280, 'height': 720}
+USER_AGENT = 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
 
 
 # Keywords that might indicate an event (Turkish and English)
@@ -65,28 +108,85 @@ TIME_PATTERNS = [
     r'\d{1,2}\s*(am|pm)',  # 2pm
 ]
 
+# Location indicators; the first group is the location itself
+LOCATION_PATTERNS = [
+    r'(?:yer|konum|location|where)[:\s]+([^\n]+)',
+    r'(?:@|📍)\s*([^\n]+)',
+]
+
+# All of the above compiled once, matched on Turkish-casefolded text
+EVENT_MATCHER = EventMatcher(EVENT_KEYWORDS, DATE_PATTERNS, TIME_PATTERNS, LOCATION_PATTERNS)
+
+# Selectors that may hold the caption text of a post page
+POST_CONTENT_SELECTORS = [
+    'article div span',
+    'article h1',
+    '[data-testid="post-content"]',
+    'div[role="button"] span',
+]
+POST_CONTENT_SELECTOR_LIST = ', '.join(POST_CONTENT_SELECTORS)
+
+# Login buttons/prompts Instagram shows to logged-out visitors
+LOGIN_PROMPT_SELECTOR = 'button:has-text("Log In"), a:has-text("Log In")'
+
+# Tracking/telemetry endpoints that never carry post data
+BLOCKED_URL_PATTERNS = [
+    r'google-analytics\.com',
+    r'googletagmanager\.com',
+    r'doubleclick\.net',
+    r'connect\.facebook\.net',
+    r'/logging_client_events',
+]
+
+
+class Throttled(RuntimeError):
+    """Instagram answered HTTP 429: the whole profile is abandoned and retried later"""
+
 
 class InstagramScraper:
-    def __init__(self, headless: bool = False):
+    def __init__(self, headless: bool = False, capture_responses: bool = False, block_resources: bool = True,
+                 watermarks: Optional[WatermarkStore] = None, har: Optional[HarSession] = None,
+                 rate_limiter: Optional[RateLimiter] = None, classifier: Optional[EventClassifier] = None):
         self.headless = headless
+        # Skip images, video, fonts and trackers - we only read text and metadata
+        self.route_policy = RoutePolicy(block_url_patterns=BLOCKED_URL_PATTERNS) if block_resources else None
+        # Read captions/timestamps from the profile JSON instead of opening every post
+        self.capture_responses = capture_responses
         self.browser = None
         self.context = None
         self.page = None
         self.playwright = None
+        # Readiness waits replace fixed sleeps; timings are recorded per wait name
+        self.waiter = Waiter(default_timeout=10000)
+        # Per-club newest-post marks in hive.db; only posts above them are opened
+        self.watermarks = watermarks
+        # New posts found per club (club_key of the profile URL) in this run, fed back to the scheduler
+        self.new_post_counts: dict[str, int] = {}
+        # HAR record/replay of all traffic
+        self.har = har or HarSession()
+        # Token bucket per host shared with every other scraper process; replaces fixed pauses
+        self.rate_limiter = rate_limiter
+        # Local event/category model; only captions it is unsure about go to the LLM
+        self.classifier = classifier
     
     def start(self):
         """Start the browser"""
+        from playwright.sync_api import sync_playwright
+        
         self.playwright = sync_playwright().start()
         self.browser = self.playwright.chromium.launch(headless=self.headless)
-        self.context = self.browser.new_context(
-            viewport={'width': 1280, 'height': 720},
-            user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-        )
+        self.context = self.browser.new_context(viewport=VIEWPORT, user_agent=USER_AGENT,
+                                                **self.har.context_options())
+        if self.route_policy:
+            self.route_policy.apply(self.context)
+        self.har.apply(self.context)
         self.page = self.context.new_page()
         print("Browser started")
     
     def stop(self):
         """Stop the browser"""
+        if self.context:
+            self.context.close()  # Flushes the HAR archive when recording
         if self.browser:
             self.browser.close()
         if self.playwright:
@@ -106,39 +206,270 @@ class InstagramScraper:
         
         print(f"\nScraping: {instagram_url}")
         
+        capture = None
+        if self.capture_responses:
+            capture = ResponseCapture()
+            capture.attach(self.page)
+        
         try:
-            self.page.goto(instagram_url, wait_until="domcontentloaded", timeout=30000)
-            time.sleep(3)  # Wait for dynamic content
+            self._goto(self.page, instagram_url)
+            # Wait for the post grid to render
+            grid_ready = self.waiter.selector(self.page, 'a[href*="/p/"]', name="profile_grid")
             
             # Check if we hit a login wall
-            if self._check_login_required():
+            login_prompt = self._check_login_required()
+            if login_prompt:
                 print("  [!] Login required - trying to bypass...")
                 self._try_bypass_login()
+            self._report_visit(instagram_url, self._is_login_wall(self.page.url, grid_ready, login_prompt))
+            
+            if capture:
+                if not capture.posts:
+                    response = self.waiter.response(self.page, ResponseCapture.matches,
+                                                    timeout=5000, name="profile_json")
+                    if response:
+                        try:
+                            capture.ingest(response.json())
+                        except Exception:
+                            pass
+                if capture.posts:
+                    return self._events_from_capture(capture, instagram_url, club_name)
+                print("  [!] No post JSON captured - opening posts instead")
             
-            # Get all post links
-            post_links = self._get_post_links()
+            # Get links to the posts published since the last run
+            posts, newest = self._new_posts(instagram_url, self._get_grid_posts(instagram_url))
+            post_links = self._absolute_links(posts)
             print(f"  Found {len(post_links)} posts")
             
-            # Scrape each post (limit to most recent 10)
+            # Read each post (limit to most recent 10), then parse them in one concurrent batch
+            contents = []
+            unread = 0
             for i, post_url in enumerate(post_links[:10]):
                 print(f"  Checking post {i+1}/{min(len(post_links), 10)}...")
-                event = self._scrape_post(post_url, club_name=club_name)
+                content = self._scrape_post(post_url)
+                unread += content is None
+                contents.append((content or '', post_url))
+            
+            for event in self._build_events(contents, club_name):
                 if event:
                     events.append(event)
                     print(f"    [OK] Found potential event: {event.get('title', 'Unknown')[:50]}")
-                time.sleep(1)  # Be nice to Instagram
             
+            self._stage_read_watermark(instagram_url, club_name, newest, unread)
+            
+        except Throttled:
+            raise
         except Exception as e:
             print(f"  [X] Error scraping profile: {e}")
+        finally:
+            if capture:
+                capture.detach(self.page)
+        
+        return events
+    
+    def _events_from_capture(self, capture: ResponseCapture, instagram_url: str, club_name: str = None) -> list[dict]:
+        """Build events from captured post JSON without opening the posts"""
+        events = []
+        posts, newest = self._new_posts(instagram_url, capture.get_posts(10))
+        print(f"  Captured {len(posts)} posts from JSON")
+        
+        built = self._build_events([(post['caption'] or '', post['url']) for post in posts], club_name)
+        for post, event in zip(posts, built):
+            if event:
+                if post['timestamp']:
+                    event['posted_at'] = post['timestamp'].isoformat()
+                events.append(event)
+                print(f"    [OK] Found potential event: {event.get('title', 'Unknown')[:50]}")
+        
+        self._stage_watermark(instagram_url, club_name, newest)
+        return events
+    
+    def _new_posts(self, instagram_url: str, posts: list[dict]) -> tuple[list[dict], Optional[Watermark]]:
+        """Posts above the club's watermark, and the watermark they would advance it to"""
+        if not self.watermarks:
+            self.new_post_counts[club_key(instagram_url)] = len(posts)
+            return posts, None
+        mark = self.watermarks.get(instagram_url)
+        fresh = fresh_posts(posts, mark)
+        if mark:
+            print(f"  {len(fresh)} new posts since the last run")
+        self.new_post_counts[club_key(instagram_url)] = len(fresh)
+        return fresh, newest_post(fresh)
+    
+    def _stage_watermark(self, instagram_url: str, club_name: str, newest: Optional[Watermark]):
+        """Remember the newest post of a fully scraped club; main() commits it after saving"""
+        if self.watermarks:
+            self.watermarks.stage(instagram_url, club_name, newest)
+    
+    def _stage_read_watermark(self, instagram_url: str, club_name: str, newest: Optional[Watermark], unread: int):
+        """
+        _stage_watermark for a club whose posts were opened one by one: if any of them
+        could not be read (timeout, login redirect, 429), the watermark stays where it was
+        so the next run reads those posts again
+        """
+        if unread:
+            print(f"  [!] {unread} posts could not be read - keeping the previous watermark")
+            return
+        self._stage_watermark(instagram_url, club_name, newest)
+    
+    def _stop_at(self, instagram_url: str) -> Optional[str]:
+        """Shortcode at which the grid walk can stop"""
+        mark = self.watermarks.get(instagram_url) if self.watermarks else None
+        return mark.shortcode if mark else None
+    
+    async def scrape_instagram_profile_async(self, page, instagram_url: str, club_name: str = None) -> list[dict]:
+        """
+        Async variant of scrape_instagram_profile for the worker pool.
+        Runs on the pooled page it is given instead of self.page.
+        """
+        posts = await self.collect_posts_async(page, instagram_url, club_name)
+        return await self.parse_posts_async(posts, club_name)
+    
+    async def collect_posts_async(self, page, instagram_url: str, club_name: str = None) -> list[dict]:
+        """
+        Browser half of scrape_instagram_profile_async: the new posts of a profile as
+        {'content', 'post_url', 'posted_at'} dicts, read but not parsed yet
+        """
+        posts = []
         
+        if not instagram_url.startswith('http'):
+            instagram_url = 'https://' + instagram_url
+        
+        print(f"\nScraping: {instagram_url}")
+        
+        capture = None
+        if self.capture_responses:
+            capture = ResponseCapture()
+            capture.attach_async(page)
+        
+        try:
+            await self._goto_async(page, instagram_url)
+            grid_ready = await self.waiter.selector_async(page, 'a[href*="/p/"]', name="profile_grid")
+            login_prompt = await page.query_selector(LOGIN_PROMPT_SELECTOR) is not None
+            self._report_visit(instagram_url, self._is_login_wall(page.url, grid_ready, login_prompt))
+            
+            if capture:
+                if not capture.posts:
+                    response = await self.waiter.response_async(page, ResponseCapture.matches,
+                                                                timeout=5000, name="profile_json")
+                    if response:
+                        try:
+                            capture.ingest(await response.json())
+                        except Exception:
+                            pass
+                if capture.posts:
+                    captured, newest = self._new_posts(instagram_url, capture.get_posts(10))
+                    print(f"  Captured {len(captured)} posts from JSON")
+                    posts = [{
+                        'content': post['caption'] or '',
+                        'post_url': post['url'],
+                        'posted_at': post['timestamp'].isoformat() if post['timestamp'] else None,
+                    } for post in captured]
+                    self._stage_watermark(instagram_url, club_name, newest)
+                    return posts
+            
+            data = await extract_page_async(page, stop_at=self._stop_at(instagram_url))
+            grid, newest = self._new_posts(instagram_url, self._grid_posts(data['posts']))
+            post_links = self._absolute_links(grid)
+            print(f"  Found {len(post_links)} posts on {instagram_url}")
+            
+            unread = 0
+            for post_url in post_links[:10]:
+                content = await self._read_post_async(page, post_url)
+                unread += content is None
+                posts.append({'content': content or '', 'post_url': post_url, 'posted_at': None})
+            
+            self._stage_read_watermark(instagram_url, club_name, newest, unread)
+            
+        except Throttled:
+            raise
+        except Exception as e:
+            print(f"  [X] Error scraping profile {instagram_url}: {e}")
+        finally:
+            if capture:
+                capture.detach_async(page)
+        
+        return posts
+    
+    async def parse_posts_async(self, posts: list[dict], club_name: str = None) -> list[dict]:
+        """Parse half of scrape_instagram_profile_async: the events among collected posts"""
+        built = await self._build_events_async([(post['content'], post['post_url']) for post in posts], club_name)
+        events = []
+        for post, event in zip(posts, built):
+            if event:
+                if post['posted_at']:
+                    event['posted_at'] = post['posted_at']
+                events.append(event)
+                print(f"    [OK] Found potential event: {event.get('title', 'Unknown')[:50]}")
         return events
     
+    async def _read_post_async(self, page, post_url: str) -> Optional[str]:
+        """Async variant of _scrape_post running on a pooled page"""
+        try:
+            await self._goto_async(page, post_url)
+            login_wall = '/accounts/login' in page.url
+            self._report_visit(post_url, login_wall)
+            if login_wall:
+                print("    [!] Redirected to login - post not read")
+                return None
+            if not await self.waiter.selector_async(page, POST_CONTENT_SELECTOR_LIST, name="post_content"):
+                print("    [!] Post did not render - not read")
+                return None
+            
+            data = await extract_page_async(page, caption_selectors=POST_CONTENT_SELECTORS)
+            return "\n".join(data['captions'])
+            
+        except Throttled:
+            raise
+        except Exception as e:
+            print(f"    Error scraping post: {e}")
+            return None
+    
     def _check_login_required(self) -> bool:
         """Check if Instagram requires login"""
         # Look for login buttons or prompts
-        login_indicators = self.page.query_selector_all('button:has-text("Log In"), a:has-text("Log In")')
+        login_indicators = self.page.query_selector_all(LOGIN_PROMPT_SELECTOR)
         return len(login_indicators) > 0
     
+    @staticmethod
+    def _is_login_wall(page_url: str, grid_ready: bool, login_prompt: bool) -> bool:
+        """
+        A real wall either redirects to the login page or hides the grid behind the prompt.
+        The "Log In" buttons alone are on every logged-out page, so they don't count.
+        """
+        return '/accounts/login' in page_url or (login_prompt and not grid_ready)
+    
+    def _goto(self, page, url: str):
+        """Navigate once the shared rate limiter allows it"""
+        if self.rate_limiter:
+            self.rate_limiter.acquire(url)
+        response = page.goto(url, wait_until="domcontentloaded", timeout=30000)
+        self._check_throttled(url, response)
+        return response
+    
+    async def _goto_async(self, page, url: str):
+        if self.rate_limiter:
+            await self.rate_limiter.acquire_async(url)
+        response = await page.goto(url, wait_until="domcontentloaded", timeout=30000)
+        self._check_throttled(url, response)
+        return response
+    
+    def _check_throttled(self, url: str, response):
+        """HTTP 429 cools the host down for every worker and aborts the whole profile"""
+        if response and response.status == 429:
+            if self.rate_limiter:
+                self.rate_limiter.penalize(url, "HTTP 429")
+            raise Throttled("Instagram answered HTTP 429 (rate limited)")
+    
+    def _report_visit(self, url: str, login_wall: bool):
+        """Feed the outcome of a navigation back to the rate limiter"""
+        if not self.rate_limiter:
+            return
+        if login_wall:
+            self.rate_limiter.penalize(url, "login wall")
+        else:
+            self.rate_limiter.success(url)
+    
     def _try_bypass_login(self):
         """Try to bypass or dismiss login prompts"""
         try:
@@ -147,21 +478,33 @@ class InstagramScraper:
             for btn in close_buttons:
                 try:
                     btn.click()
-                    time.sleep(1)
+                    self.waiter.selector(self.page, '[role="dialog"]', state="detached",
+                                         timeout=2000, name="dismiss_dialog")
                 except:
                     pass
         except:
             pass
     
-    def _get_post_links(self) -> list[str]:
-        """Get links to individual posts"""
-        post_links = []
-        
+    def _get_grid_posts(self, instagram_url: str) -> list[dict]:
+        """Get the post grid, stopping at the club's watermark post"""
         # Instagram posts are usually in anchor tags with /p/ in the URL
-        links = self.page.query_selector_all('a[href*="/p/"]')
-        
-        for link in links:
-            href = link.get_attribute('href')
+        return self._grid_posts(extract_page(self.page, stop_at=self._stop_at(instagram_url))['posts'])
+    
+    @staticmethod
+    def _grid_posts(entries: list[dict]) -> list[dict]:
+        """Add shortcode and timestamp to grid entries from extract_page()"""
+        return [
+            dict(entry, shortcode=shortcode_from_url(entry.get('href')),
+                 timestamp=parse_datetime(entry.get('datetime')))
+            for entry in entries
+        ]
+    
+    @staticmethod
+    def _absolute_links(posts: list[dict]) -> list[str]:
+        """Turn grid entries into unique absolute post URLs"""
+        post_links = []
+        for post in posts:
+            href = post.get('href') or post.get('url')
             if href:
                 if not href.startswith('http'):
                     href = 'https://www.instagram.com' + href
@@ -170,99 +513,136 @@ class InstagramScraper:
         
         return post_links
     
-    def _scrape_post(self, post_url: str, club_name: str = None) -> Optional[dict]:
+    def _scrape_post(self, post_url: str) -> Optional[str]:
         """
-        Scrape a single post and extract event information if present
-        Uses LLM parsing if available, falls back to regex
+        Open a single post and return its text (None if it could not be read)
+        Event extraction happens afterwards, for all posts of the profile at once
         """
         try:
-            self.page.goto(post_url, wait_until="domcontentloaded", timeout=30000)
-            time.sleep(2)
-            
-            # Get post content
-            content = self._get_post_content()
-            
-            if not content:
+            self._goto(self.page, post_url)
+            login_wall = '/accounts/login' in self.page.url
+            self._report_visit(post_url, login_wall)
+            if login_wall:
+                print("    [!] Redirected to login - post not read")
                 return None
-            
-            # Check if this looks like an event
-            if not self._is_event_post(content):
+            if not self.waiter.selector(self.page, POST_CONTENT_SELECTOR_LIST, name="post_content"):
+                print("    [!] Post did not render - not read")
                 return None
             
-            # Try LLM parsing first
-            event = None
-            if LLM_AVAILABLE and os.getenv('OPENAI_API_KEY'):
-                print("    Using LLM parser...")
-                event = parse_event_with_llm(content, club_name)
-                if event:
-                    print("    [OK] LLM parsing successful")
-            
-            # Fall back to regex parsing if LLM fails
-            if not event:
-                print("    Using regex fallback...")
-                event = {
-                    'title': self._extract_title(content),
-                    'description': content,
-                    'event_date': self._extract_date(content),
-                    'location': self._extract_location(content),
-                    'category': None,
-                }
-            else:
-                # Add the full description if LLM parsing worked
-                event['description'] = event.get('description') or content
-            
-            # Add common fields
-            event['instagram_post_url'] = post_url
-            event['source'] = 'scraped'
-            event['status'] = 'draft'
-            event['scraped_at'] = datetime.now().isoformat()
-            
-            # Only return if we found at least a title or date
-            if event.get('title') or event.get('event_date'):
-                return event
-            
-            return None
+            # Get post content
+            return self._get_post_content()
             
+        except Throttled:
+            raise
         except Exception as e:
             print(f"    Error scraping post: {e}")
             return None
     
-    def _get_post_content(self) -> str:
-        """Get the text content of a post"""
-        content = ""
+    def _build_events(self, posts: list[tuple[str, str]], club_name: str = None) -> list[Optional[dict]]:
+        """
+        Turn (content, post_url) pairs into event dicts, None where a post is not an event
+        Uses LLM parsing if available (one concurrent batch), falls back to regex
+        """
+        gates, uncertain = self._triage(posts)
         
-        # Try different selectors for post content
-        selectors = [
-            'article div span',
-            'article h1',
-            '[data-testid="post-content"]',
-            'div[role="button"] span',
-        ]
+        # Try LLM parsing first, for the captions the classifier is unsure about
+        parsed = {}
+        llm = llm_parser_for(len(uncertain))
+        if llm:
+            print(f"    Using LLM parser for {len(uncertain)} posts...")
+            parsed = dict(zip(uncertain, llm.parse_events_with_llm([(posts[i][0], club_name) for i in uncertain])))
         
-        for selector in selectors:
-            elements = self.page.query_selector_all(selector)
-            for element in elements:
-                try:
-                    text = element.inner_text()
-                    if text and len(text) > 20:  # Filter out short texts
-                        content += text + "\n"
-                except:
-                    pass
+        return self._assemble_events(posts, gates, parsed)
+    
+    async def _build_events_async(self, posts: list[tuple[str, str]], club_name: str = None) -> list[Optional[dict]]:
+        """Async variant of _build_events; the LLM requests run on the running (pooled) loop"""
+        gates, uncertain = self._triage(posts)
+        
+        parsed = {}
+        llm = llm_parser_for(len(uncertain))
+        if llm:
+            print(f"    Using LLM parser for {len(uncertain)} posts...")
+            results = await llm.parse_events_with_llm_async([(posts[i][0], club_name) for i in uncertain])
+            parsed = dict(zip(uncertain, results))
         
-        return content.strip()
+        return self._assemble_events(posts, gates, parsed)
     
-    def _is_event_post(self, content: str) -> bool:
-        """Check if post content looks like an event announcement"""
-        content_lower = content.lower()
+    def _triage(self, posts: list[tuple[str, str]]) -> tuple[dict[int, tuple[str, Optional[str]]], list[int]]:
+        """Gate decisions of the posts that may be events, and the indexes that need the LLM"""
+        # Check which posts look like events; the local classifier settles the clear cases
+        gates = {}
+        for i, (content, _) in enumerate(posts):
+            if content and self._is_event_post(content):
+                decision, category = self._gate(content)
+                if decision != 'not_event':
+                    gates[i] = (decision, category)
+        uncertain = [i for i, (decision, _) in gates.items() if decision == 'uncertain']
+        return gates, uncertain
+    
+    def _assemble_events(self, posts: list[tuple[str, str]], gates: dict[int, tuple[str, Optional[str]]],
+                         parsed: dict[int, Optional[dict]]) -> list[Optional[dict]]:
+        events = [None] * len(posts)
+        for i, (_, category) in gates.items():
+            content, post_url = posts[i]
+            events[i] = self._finish_event(parsed.get(i), content, post_url, category=category)
+        return events
+    
+    def _gate(self, content: str) -> tuple[str, Optional[str]]:
+        """Classifier decision ('event', 'not_event' or 'uncertain') and its category guess"""
+        if not self.classifier:
+            return 'uncertain', None
+        decision, prediction = self.classifier.decide(content)
+        if decision == 'not_event':
+            print(f"    [--] Classifier: not an event ({prediction.event_probability:.2f})")
+        category = prediction.category if prediction.category_probability >= 0.5 else None
+        return decision, category
+    
+    def _finish_event(self, event: Optional[dict], content: str, post_url: str,
+                      category: Optional[str] = None) -> Optional[dict]:
+        """Complete an LLM result, or parse the post with regex if there is none"""
+        if event:
+            print("    [OK] LLM parsing successful")
+        
+        # Fall back to regex parsing if LLM fails
+        if not event:
+            print("    Using regex fallback...")
+            cues = EVENT_MATCHER.scan(content)
+            # Turkish and English dates, times and ranges; no year means the next occurrence
+            when = parse_event_date(content)
+            event = {
+                'title': self._extract_title(content),
+                'description': content,
+                'event_date': when.start.isoformat() if when else None,
+                'end_date': when.end.isoformat() if when and when.end else None,
+                'location': self._extract_location(content, cues),
+                'category': category,
+            }
+        else:
+            # Add the full description if LLM parsing worked
+            event['description'] = event.get('description') or content
         
-        # Count how many event keywords are present
-        keyword_count = sum(1 for keyword in EVENT_KEYWORDS if keyword in content_lower)
+        # Add common fields
+        event['instagram_post_url'] = post_url
+        event['source'] = 'scraped'
+        event['status'] = 'draft'
+        event['scraped_at'] = datetime.now().isoformat()
         
-        # Check for date patterns
-        has_date = any(re.search(pattern, content_lower) for pattern in DATE_PATTERNS)
+        # Only return if we found at least a title or date
+        if event.get('title') or event.get('event_date'):
+            return event
         
-        # Consider it an event if it has multiple keywords or has a date with at least one keyword
-        return keyword_count >= 2 or (has_date and keyword_count >= 1)
+        return None
+    
+    def _get_post_content(self) -> str:
+        """Get the text content of a post"""
+        # All selectors are read in one evaluate call; texts of 20 chars or less are dropped
+        data = extract_page(self.page, caption_selectors=POST_CONTENT_SELECTORS)
+        return "\n".join(data['captions'])
+    
+    def _is_event_post(self, content: str) -> bool:
+        """Check if post content looks like an event announcement"""
+        # Multiple keywords, or a date with at least one keyword
+        return EVENT_MATCHER.is_event(content)
     
     def _extract_title(self, content: str) -> str:
         """Extract event title from content"""
@@ -279,46 +659,16 @@ class InstagramScraper:
         
         return "Untitled Event"
     
-    def _extract_date(self, content: str) -> Optional[str]:
-        """Extract event date from content"""
-        content_lower = content.lower()
-        
-        # Try each date pattern
-        for pattern in DATE_PATTERNS:
-            match = re.search(pattern, content_lower)
-            if match:
-                try:
-                    # Try to parse the date
-                    date_str = match.group(0)
-                    parsed_date = date_parser.parse(date_str, fuzzy=True)
-                    
-                    # If date is in the past, assume it's next year
-                    if parsed_date < datetime.now():
-                        parsed_date = parsed_date.replace(year=datetime.now().year + 1)
-                    
-                    return parsed_date.isoformat()
-                except:
-                    pass
-        
-        # Default to one week from now if no date found
-        return None
-    
-    def _extract_location(self, content: str) -> Optional[str]:
+    def _extract_location(self, content: str, cues: Optional[TextCues] = None) -> Optional[str]:
         """Extract location from content"""
-        content_lower = content.lower()
+        cues = cues or EVENT_MATCHER.scan(content)
         
         # Look for location indicators
-        location_patterns = [
-            r'(?:yer|konum|location|where)[:\s]+([^\n]+)',
-            r'(?:@|📍)\s*([^\n]+)',
-        ]
-        
-        for pattern in location_patterns:
-            match = re.search(pattern, content_lower)
-            if match:
-                location = match.group(1).strip()
-                if len(location) > 3:
-                    return location[:200]  # Limit length
+        for cue in cues.locations:
+            # Original text, so a real "ı" survives; "İ" must not lower to "i" + a combining dot
+            location = content[cue.start:cue.end].replace('İ', 'i').lower().strip()
+            if len(location) > 3:
+                return location[:200]  # Limit length
         
         return None
 
@@ -335,101 +685,384 @@ def load_clubs(filename: str = "clubs.json") -> list[dict]:
         return []
 
 
-def save_events(events: list[dict], filename: str = "scraped_events.json"):
-    """Save scraped events to JSON file"""
-    with open(filename, 'w', encoding='utf-8') as f:
-        json.dump({
-            'scraped_at': datetime.now().isoformat(),
-            'total_events': len(events),
-            'events': events
-        }, f, ensure_ascii=False, indent=2)
-    print(f"\nSaved {len(events)} events to {filename}")
+def save_events(run_log: RunLog, filename: str = "scraped_events.json"):
+    """Rebuild the scraped events JSON file from the run's JSONL log"""
+    total = build_json(run_log.events_path, filename)
+    print(f"\nSaved {total} events to {filename}")
 
 
-def send_to_backend(events: list[dict], backend_url: str = "http://localhost:3001"):
-    """Send scraped events to the backend API"""
+def send_to_backend(events: list[dict], backend_url: str = "http://localhost:3001", batch_size: int = 50):
+    """
+    Send scraped events to the backend API, batch_size per request over one keep-alive session.
+    A backend without the batch endpoint (404) gets them one request per event instead.
+    """
+    import requests
+    
     print(f"\nSending {len(events)} events to backend...")
     
-    headers = {
+    session = requests.Session()
+    session.headers.update({
         'Content-Type': 'application/json',
         'x-api-key': 'hive-scraper-secret-key'
-    }
-
+    })
+    
+    # Ensure required fields
+    complete = []
     for event in events:
+        if not event.get('title') or not event.get('event_date'):
+            print(f"  [!] Skipping incomplete event: {event.get('title', 'Unknown')}")
+        else:
+            complete.append(event)
+    
+    for start in range(0, len(complete), batch_size):
+        chunk = complete[start:start + batch_size]
         try:
-            # Ensure required fields
-            if not event.get('title') or not event.get('event_date'):
-                print(f"  [!] Skipping incomplete event: {event.get('title', 'Unknown')}")
+            response = session.post(f"{backend_url}/api/events/scraped/batch", json={'events': chunk})
+            if response.status_code == 404:
+                for event in chunk:
+                    send_event(session, backend_url, event)
                 continue
-
-            response = requests.post(
-                f"{backend_url}/api/events/scraped",
-                json=event,
-                headers=headers
-            )
-            
-            if response.status_code == 201:
-                print(f"  [OK] Created: {event.get('title', 'Unknown')[:50]}")
-            elif response.status_code == 200:
-                print(f"  [i] Skipped (Duplicate): {event.get('title', 'Unknown')[:50]}")
-            else:
+            if response.status_code != 200:
                 print(f"  [!] Failed ({response.status_code}): {response.text}")
+                continue
+            
+            for result in response.json()['results']:
+                title = chunk[result['index']].get('title', 'Unknown')[:50]
+                if result['status'] == 'created':
+                    print(f"  [OK] Created: {title}")
+                elif result['status'] == 'duplicate':
+                    print(f"  [i] Skipped (Duplicate): {title}")
+                else:
+                    print(f"  [!] Failed ({result['status']}): {title}: {result.get('error')}")
         except Exception as e:
             print(f"  [X] Error: {e}")
+    session.close()
+
+
+def send_event(session, backend_url: str, event: dict):
+    """Send one event to the single-event endpoint older backends have"""
+    try:
+        response = session.post(f"{backend_url}/api/events/scraped", json=event)
+        if response.status_code == 201:
+            print(f"  [OK] Created: {event.get('title', 'Unknown')[:50]}")
+        elif response.status_code == 200:
+            print(f"  [i] Skipped (Duplicate): {event.get('title', 'Unknown')[:50]}")
+        else:
+            print(f"  [!] Failed ({response.status_code}): {response.text}")
+    except Exception as e:
+        print(f"  [X] Error: {e}")
+
+
+def close_sink(sink: Optional[SQLiteSink]):
+    """Wait for the direct hive.db writes to land (before the watermarks move on)"""
+    if sink:
+        sink.close()
+        print(sink.report())
+
+
+def print_llm_cache_report():
+    """How many LLM answers came from the cache this run"""
+    # Only a run that actually loaded the parser can have used its cache
+    cache = _llm_parser.get_cache() if _llm_parser and os.getenv('OPENAI_API_KEY') else None
+    if cache:
+        print(cache.report())
+
+
+def commit_run_state(watermarks: Optional[WatermarkStore], scheduler: Optional[ClubScheduler]):
+    """Advance the watermarks of the clubs whose events have been saved and store their cadence"""
+    if watermarks:
+        count = watermarks.commit()
+        if count:
+            print(f"[OK] Advanced watermarks of {count} clubs")
+    if scheduler:
+        scheduler.save()
+        print(scheduler.report())
+
+
+def record_visit(scheduler: Optional[ClubScheduler], scraper: 'InstagramScraper', club: dict,
+                 events: list[dict], seconds: float):
+    """Feed the outcome of one club visit back to the scheduler"""
+    # Visits that failed before reaching the post grid teach nothing about the cadence
+    key = club_key(club['instagram_url'])
+    if scheduler and key in scraper.new_post_counts:
+        new_posts = scraper.new_post_counts[key]
+        scheduler.record(club['instagram_url'], club['name'], new_posts, len(events), seconds)
+
+
+def finish_run(run_log: RunLog, clubs: list[dict]):
+    """Mark the run complete, unless clubs were left unfinished (rate limited) for --resume to retry"""
+    unfinished = [club for club in clubs if not run_log.is_done(club)]
+    if unfinished:
+        print(f"\n[!] {len(unfinished)} clubs were not finished. Run again with --resume to retry them.")
+        return
+    run_log.finish()
+
+
+def scrape_clubs_concurrently(clubs: list[dict], workers: int, concurrency: int = 1,
+                              headless: bool = False, capture_responses: bool = False,
+                              block_resources: bool = True,
+                              watermarks: Optional[WatermarkStore] = None,
+                              har: Optional[HarSession] = None,
+                              scheduler: Optional[ClubScheduler] = None,
+                              rate_limiter: Optional[RateLimiter] = None,
+                              classifier: Optional[EventClassifier] = None,
+                              parse_workers: int = 4, sink: Optional[SQLiteSink] = None,
+                              run_log: Optional[RunLog] = None) -> list[dict]:
+    """
+    Scrape clubs with a pool of isolated browser contexts in one Chromium process.
+    Browsing, parsing and collecting run as pipeline stages at the same time, so the
+    pages move on to the next club while the LLM still works on the previous one.
+    Returns the events of all clubs, in the order of the clubs list; with a run_log
+    each club's events are appended to it as the club finishes instead, and none are kept.
+    """
+    import asyncio
+    from src.core.pool import BrowserPool
+    from src.core.pipeline import Pipeline, Stage
+    
+    scraper = InstagramScraper(headless=headless, capture_responses=capture_responses,
+                               block_resources=block_resources, watermarks=watermarks, har=har,
+                               rate_limiter=rate_limiter, classifier=classifier)
+    
+    pool = BrowserPool(
+        workers=workers,
+        concurrency=concurrency,
+        headless=headless,
+        context_options={'viewport': VIEWPORT, 'user_agent': USER_AGENT},
+        route_policy=scraper.route_policy,
+        har=scraper.har,
+    )
+    
+    async def browse(item: tuple[int, dict]) -> dict:
+        index, club = item
+        started = time.monotonic()
+        try:
+            posts = await pool.call(club['instagram_url'], lambda page, url: scraper.collect_posts_async(
+                page, url, club_name=club['name']))
+        except Throttled as e:
+            print(f"  [!] {e} - {club['name']} is left for a retry")
+            return None
+        return {'index': index, 'club': club, 'posts': posts, 'seconds': time.monotonic() - started}
+    
+    async def parse(visit: dict) -> dict:
+        started = time.monotonic()
+        visit['events'] = await scraper.parse_posts_async(visit['posts'], club_name=visit['club']['name'])
+        visit['seconds'] += time.monotonic() - started
+        return visit
+    
+    results = {}
+    
+    def collect(visit: dict):
+        club = visit['club']
+        for event in visit['events']:
+            if not event.get('club_name'):
+                event['club_name'] = club['name']
+        record_visit(scheduler, scraper, club, visit['events'], visit['seconds'])
+        if run_log:
+            run_log.add_club(club, visit['events'])
+        else:
+            results[visit['index']] = visit['events']
+        if sink:
+            sink.write(visit['events'])
+    
+    pipeline = Pipeline([
+        Stage('browser', browse, workers=workers * concurrency),
+        Stage('parse', parse, workers=parse_workers),
+        Stage('collect', collect),
+    ])
+    
+    async def run():
+        try:
+            async with pool:
+                await pipeline.run(enumerate(clubs))
+        finally:
+            # The parse stage's AsyncOpenAI client belongs to this loop: close its connections with it
+            if _llm_parser:
+                await _llm_parser.close_async_client()
+    
+    asyncio.run(run())
+    print(pipeline.report())
+    print(scraper.waiter.recorder.report())
+    if scraper.route_policy:
+        print(scraper.route_policy.stats.report())
+    if rate_limiter:
+        print(rate_limiter.report())
+    if classifier:
+        print(classifier.report())
+    print_llm_cache_report()
+    
+    all_events = []
+    for index in sorted(results):
+        all_events.extend(results[index])
+    return all_events
 
 
 def main():
     """Main function to scrape Instagram events"""
+    arg_parser = argparse.ArgumentParser(description="The Hive - Instagram Event Scraper")
+    arg_parser.add_argument('--workers', type=int, default=1,
+                            help='Number of isolated browser contexts to scrape with in parallel')
+    arg_parser.add_argument('--concurrency', type=int, default=1,
+                            help='Pages per browser context when --workers > 1')
+    arg_parser.add_argument('--parse-workers', type=int, default=4,
+                            help='Clubs parsed at once while the browser pages move on, when --workers > 1')
+    arg_parser.add_argument('--headless', action='store_true', help='Run the browser headless')
+    arg_parser.add_argument('--capture', action='store_true',
+                            help='Read posts from the profile JSON responses instead of opening each post')
+    arg_parser.add_argument('--no-block', action='store_true',
+                            help='Let pages download images, video, fonts and trackers')
+    arg_parser.add_argument('--full', action='store_true',
+                            help='Ignore the per-club watermarks and re-check every visible post')
+    arg_parser.add_argument('--all', action='store_true',
+                            help='Scrape every club instead of only the ones the scheduler finds due')
+    arg_parser.add_argument('--resume', action='store_true',
+                            help='Continue an interrupted run: skip the clubs its manifest lists as finished')
+    arg_parser.add_argument('--direct', action='store_true',
+                            help='Also write the events straight into hive.db as each club finishes (on-box runs)')
+    arg_parser.add_argument('--no-gate', action='store_true',
+                            help='Send every event-like caption to the LLM, even when the local classifier is sure')
+    arg_parser.add_argument('--dry-run', action='store_true',
+                            help='List the clubs this run would scrape, then exit without opening a browser')
+    arg_parser.add_argument('--budget', type=float, metavar='MINUTES',
+                            help='Spend at most this much estimated scraping time, on the most promising clubs')
+    har_group = arg_parser.add_mutually_exclusive_group()
+    har_group.add_argument('--record', metavar='HAR', help='Record all browser traffic to a HAR archive')
+    har_group.add_argument('--replay', metavar='HAR',
+                           help='Serve browser traffic from a recorded HAR archive, offline and without pacing')
+    args = arg_parser.parse_args()
+    setup_logging()
+    
     print("=" * 60)
     print("THE HIVE - Instagram Event Scraper")
     print("Scraping events from ITU club Instagram pages")
     print("=" * 60)
     
+    if args.record:
+        har = HarSession('record', args.record)
+    elif args.replay:
+        har = HarSession('replay', args.replay)
+    else:
+        har = HarSession()
+    print(har.describe())
+    
+    # Newest post per club from earlier runs, stored in hive.db (replays stay deterministic)
+    watermarks = None if args.full or har.replaying else WatermarkStore()
+    # Posting cadence per club, also in hive.db; picks which clubs are due this run
+    scheduler = None if args.all or har.replaying else ClubScheduler()
+    # Navigation budget per host, shared with v2 runs and the daemon (replays are offline)
+    rate_limiter = None if har.replaying else RateLimiter()
+    # Trained with: python event_classifier.py train
+    classifier = None if args.no_gate else EventClassifier.load()
+    if classifier:
+        print(f"Event classifier v{classifier.version} loaded (threshold {classifier.threshold})")
+    
     # Load clubs
     clubs = load_clubs()
+    if scheduler:
+        budget = args.budget * 60 if args.budget else None
+        clubs = scheduler.plan(clubs, budget_seconds=budget)
     
     if not clubs:
-        print("\nNo clubs to scrape. Please run club_scraper.py first.")
+        print("\nNo clubs to scrape. Please run club_scraper.py first (or wait until clubs are due).")
         return
     
+    if args.dry_run:
+        print(f"\nWould scrape {len(clubs)} clubs:")
+        for club in clubs:
+            print(f"  {club['name']}: {club['instagram_url']}")
+        if scheduler:
+            print(scheduler.report())
+        return
+    
+    # Events are appended to scraped_events.jsonl club by club; the manifest lists finished clubs
+    run_log = RunLog(resume=args.resume)
+    skipped = [club for club in clubs if run_log.is_done(club)]
+    if skipped:
+        clubs = [club for club in clubs if not run_log.is_done(club)]
+        print(f"Skipping {len(skipped)} clubs finished before the interruption")
+    
     print(f"\nFound {len(clubs)} clubs to scrape")
+    # One writer thread for hive.db; the backend picks the rows up on its next query
+    sink = SQLiteSink() if args.direct else None
+    
+    if args.workers > 1:
+        print(f"Using {args.workers} workers x {args.concurrency} pages")
+        try:
+            scrape_clubs_concurrently(clubs, args.workers, args.concurrency,
+                                      headless=args.headless, capture_responses=args.capture,
+                                      block_resources=not args.no_block, watermarks=watermarks, har=har,
+                                      scheduler=scheduler, rate_limiter=rate_limiter,
+                                      classifier=classifier, parse_workers=args.parse_workers,
+                                      sink=sink, run_log=run_log)
+            finish_run(run_log, clubs)
+        except KeyboardInterrupt:
+            print("\n\nScraping interrupted by user. Run again with --resume to continue.")
+        run_log.close()
+        if run_log.events:
+            save_events(run_log)
+            print(f"\n[OK] Successfully scraped {run_log.events} potential events!")
+        else:
+            print("\n[!] No events found.")
+        close_sink(sink)
+        commit_run_state(watermarks, scheduler)
+        print("\nDone!")
+        return
     
     # Initialize scraper
-    scraper = InstagramScraper(headless=False)
+    scraper = InstagramScraper(headless=args.headless, capture_responses=args.capture,
+                               block_resources=not args.no_block, watermarks=watermarks, har=har,
+                               rate_limiter=rate_limiter, classifier=classifier)
     scraper.start()
     
-    all_events = []
-    
     try:
         for i, club in enumerate(clubs):
             print(f"\n[{i+1}/{len(clubs)}] Processing: {club['name']}")
             
-            events = scraper.scrape_instagram_profile(club['instagram_url'], club_name=club['name'])
+            started = time.monotonic()
+            try:
+                events = scraper.scrape_instagram_profile(club['instagram_url'], club_name=club['name'])
+            except Throttled as e:
+                print(f"  [!] {e} - {club['name']} is left for a retry")
+                continue
             
             # Add club info to events (in case LLM didn't get it)
             for event in events:
                 if not event.get('club_name'):
                     event['club_name'] = club['name']
             
-            all_events.extend(events)
-            
-            # Be nice to Instagram
-            time.sleep(3)
+            run_log.add_club(club, events)
+            if sink:
+                sink.write(events)
+            record_visit(scheduler, scraper, club, events, time.monotonic() - started)
+        finish_run(run_log, clubs)
         
         # Save events
-        if all_events:
-            save_events(all_events)
-            print(f"\n[OK] Successfully scraped {len(all_events)} potential events!")
+        if run_log.events:
+            save_events(run_log)
+            print(f"\n[OK] Successfully scraped {run_log.events} potential events!")
         else:
             print("\n[!] No events found.")
+        close_sink(sink)
+        commit_run_state(watermarks, scheduler)
             
     except KeyboardInterrupt:
-        print("\n\nScraping interrupted by user.")
-        if all_events:
-            save_events(all_events)
+        print("\n\nScraping interrupted by user. Run again with --resume to continue.")
+        if run_log.events:
+            save_events(run_log)
+        close_sink(sink)
+        # Only clubs that were scraped completely have a staged watermark
+        commit_run_state(watermarks, scheduler)
     
     finally:
+        run_log.close()
         scraper.stop()
+        print(scraper.waiter.recorder.report())
+        if scraper.route_policy:
+            print(scraper.route_policy.stats.report())
+        if rate_limiter:
+            print(rate_limiter.report())
+        if classifier:
+            print(classifier.report())
+        print_llm_cache_report()
     
     print("\nDone!")
 
@@ -3,8 +3,16 @@ The Hive - LLM Event Parser
 Uses OpenAI GPT-4o-mini to intelligently extract event information from Instagram post captions
 """
 
+import asyncio
+import concurrent.futures
+import hashlib
 import os
+import sqlite3
+import sys
 import json
+import threading
+import time
+import weakref
 from typing import Optional
 from datetime import datetime
 from dotenv import load_dotenv
@@ -12,10 +20,44 @@ from dotenv import load_dotenv
 # Load environment variables from .env file
 load_dotenv()
 
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI
+
+# Table-driven Turkish/English date parser, shared with the v2 package
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'instagram_scraper_v2'))
+from src.scrapers.event_dates import parse_event_date
 
 # Load API key from environment
 OPENAI_API_KEY = os.getenv('OPENAI_API_KEY')
+LLM_MODEL = "gpt-4o-mini"
+# Bump whenever the model, the prompts or the validation change, so reparse_events.py
+# re-reads the events an older version parsed (stored in events.parser_version)
+PARSER_VERSION = 1
+# Requests in flight at once per event loop, and seconds before one is abandoned
+LLM_MAX_CONCURRENCY = int(os.getenv('LLM_MAX_CONCURRENCY', '16'))
+LLM_TIMEOUT = float(os.getenv('LLM_TIMEOUT', '30'))
+# Captions packed into one request by the batch API
+LLM_BATCH_SIZE = int(os.getenv('LLM_BATCH_SIZE', '8'))
+# Result cache: "on", "off", or "refresh" (skip lookups but store the new answers)
+LLM_CACHE = os.getenv('LLM_CACHE', 'on').lower()
+LLM_CACHE_PATH = os.getenv('LLM_CACHE_PATH', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'llm_cache.db'))
+LLM_CACHE_MAX_ENTRIES = int(os.getenv('LLM_CACHE_MAX_ENTRIES', '50000'))
+LLM_CACHE_MAX_AGE_DAYS = float(os.getenv('LLM_CACHE_MAX_AGE_DAYS', '90'))
+
+
+class _ParseFailed:
+    def __repr__(self):
+        return 'PARSE_FAILED'
+
+
+# Result (with report_failures=True) for a caption the LLM could not be asked about or
+# answered malformed, as opposed to None for one without an event or too short to parse
+PARSE_FAILED = _ParseFailed()
+
+# One pooled client for sync callers, one per event loop for async callers
+_client: Optional[OpenAI] = None
+_client_lock = threading.Lock()
+_async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, tuple]" = weakref.WeakKeyDictionary()
+_cache: Optional["LLMCache"] = None
 
 # System prompt for event extraction
 SYSTEM_PROMPT = """You are an event information extractor for a university campus event platform (ITU - Istanbul Technical University).
@@ -38,72 +80,556 @@ Common time indicators: "Saat:", "🕐"
 
 Return ONLY valid JSON, no markdown formatting, no explanation, no code blocks."""
 
+# Several captions per request: the same rules, answered as a list matched back by id
+# Keys an answer has to carry (null included); one without any of them is malformed, not "no event"
+EVENT_FIELDS = ('title', 'description', 'event_date', 'end_date', 'location', 'category')
+
+BATCH_SYSTEM_PROMPT = SYSTEM_PROMPT + """
+
+You will receive several posts, each starting with a line "### POST <id>". Extract each post on its own.
+Answer with a JSON object {"events": [...]} holding exactly one object per post, with an "id" key set to
+the post's id plus the keys above (title, description, event_date, end_date, location, category)."""
+
+
+class LLMCache:
+    """
+    SQLite cache of validated LLM results, so re-running reparse_events.py or
+    re-scraping a post does not pay for the same answer twice.
+    Keys hash the normalized caption, club name, SYSTEM_PROMPT and model: editing
+    the prompt or switching models starts over. Answers without a title or date
+    are cached as None too; failed requests are not cached.
+    """
+    
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS llm_cache (
+            key TEXT PRIMARY KEY,
+            event TEXT,                 -- validated event dict as JSON, 'null' for no event
+            created_at REAL NOT NULL,
+            used_at REAL NOT NULL,
+            hits INTEGER DEFAULT 0
+        )
+    """
+    EVICT_EVERY = 500  # writes between size/age evictions
+    
+    def __init__(self, path: str = LLM_CACHE_PATH, max_entries: int = LLM_CACHE_MAX_ENTRIES,
+                 max_age_days: float = LLM_CACHE_MAX_AGE_DAYS):
+        self.path = path
+        self.max_entries = max_entries
+        self.max_age_seconds = max_age_days * 86400
+        self.hits = 0
+        self.misses = 0
+        self.bypassed = 0
+        self.writes = 0
+        self.evicted = 0
+        
+        self._lock = threading.Lock()
+        # WAL lets overlapping runs read while one of them writes
+        self._conn = sqlite3.connect(path, timeout=30, isolation_level=None, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(self.SCHEMA)
+        self.evict()
+    
+    @staticmethod
+    def key(raw_content: str, club_name: str = None) -> str:
+        """Cache key; whitespace differences in the caption don't matter"""
+        caption = " ".join((raw_content or "").split())
+        material = "\x1f".join((LLM_MODEL, SYSTEM_PROMPT, club_name or "", caption))
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+    
+    def get(self, key: str) -> tuple[bool, Optional[dict]]:
+        """(found, event); event may be None for a cached non-event"""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT event FROM llm_cache WHERE key = ? AND created_at >= ?",
+                (key, now - self.max_age_seconds),
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return False, None
+            self._conn.execute("UPDATE llm_cache SET used_at = ?, hits = hits + 1 WHERE key = ?", (now, key))
+            self.hits += 1
+        return True, json.loads(row[0])
+    
+    def put(self, key: str, event: Optional[dict]):
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO llm_cache (key, event, created_at, used_at) VALUES (?, ?, ?, ?)",
+                (key, json.dumps(event, ensure_ascii=False), now, now),
+            )
+            self.writes += 1
+        if self.writes % self.EVICT_EVERY == 0:
+            self.evict()
+    
+    def evict(self) -> int:
+        """Drop entries past the age limit, then the least recently used beyond max_entries"""
+        with self._lock:
+            removed = self._conn.execute(
+                "DELETE FROM llm_cache WHERE created_at < ?", (time.time() - self.max_age_seconds,)
+            ).rowcount
+            removed += self._conn.execute(
+                """DELETE FROM llm_cache WHERE key IN (
+                       SELECT key FROM llm_cache ORDER BY used_at DESC LIMIT -1 OFFSET ?)""",
+                (self.max_entries,),
+            ).rowcount
+        self.evicted += removed
+        return removed
+    
+    def stats(self) -> dict:
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM llm_cache").fetchone()[0]
+        lookups = self.hits + self.misses
+        return {
+            'entries': entries,
+            'hits': self.hits,
+            'misses': self.misses,
+            'bypassed': self.bypassed,
+            'writes': self.writes,
+            'evicted': self.evicted,
+            'hit_rate': round(self.hits / lookups, 3) if lookups else 0.0,
+        }
+    
+    def report(self) -> str:
+        stats = self.stats()
+        return (f"LLM cache: {stats['hits']} hits, {stats['misses']} misses "
+                f"({stats['hit_rate']:.0%} hit rate), {stats['bypassed']} bypassed, "
+                f"{stats['writes']} stored, {stats['evicted']} evicted, {stats['entries']} entries")
+
+
+def get_cache() -> Optional[LLMCache]:
+    """Shared result cache, opened on first use; None when LLM_CACHE=off"""
+    global _cache
+    if LLM_CACHE in ('off', '0', 'false', 'no'):
+        return None
+    with _client_lock:
+        if _cache is None:
+            _cache = LLMCache()
+        return _cache
+
+
+def get_client() -> OpenAI:
+    """Shared sync client; its HTTP connection pool is reused by every call and thread"""
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = OpenAI(api_key=OPENAI_API_KEY, timeout=LLM_TIMEOUT)
+        return _client
+
+
+def _async_client() -> tuple[AsyncOpenAI, asyncio.Semaphore]:
+    """Async client and in-flight limit of the running event loop (they can't be shared across loops)"""
+    loop = asyncio.get_running_loop()
+    if loop not in _async_clients:
+        _async_clients[loop] = (
+            AsyncOpenAI(api_key=OPENAI_API_KEY, timeout=LLM_TIMEOUT),
+            asyncio.Semaphore(LLM_MAX_CONCURRENCY),
+        )
+    return _async_clients[loop]
+
+
+async def close_async_client():
+    """Close the running loop's client; call before a loop created with asyncio.run() ends"""
+    entry = _async_clients.pop(asyncio.get_running_loop(), None)
+    if entry:
+        await entry[0].close()
+
 
-def parse_event_with_llm(raw_content: str, club_name: str = None) -> Optional[dict]:
+def parse_event_with_llm(raw_content: str, club_name: str = None, timeout: float = None,
+                         use_cache: bool = True) -> Optional[dict]:
     """
     Parse event information from raw Instagram post content using OpenAI GPT-4o-mini.
     
     Args:
         raw_content: The raw text content from an Instagram post
         club_name: Optional club name for context
+        timeout: Seconds before the request is abandoned (default LLM_TIMEOUT)
+        use_cache: False skips the cache lookup (the new answer is still stored)
         
     Returns:
         dict with extracted event information, or None if parsing fails
     """
-    if not OPENAI_API_KEY:
-        print("  [!] OpenAI API key not set, falling back to regex parsing")
+    request = _build_request(raw_content, club_name)
+    if not request:
         return None
     
-    if not raw_content or len(raw_content.strip()) < 20:
-        return None
+    key = LLMCache.key(raw_content, club_name)
+    found, event = _lookup(key, use_cache)
+    if found:
+        return event
     
     try:
-        client = OpenAI(api_key=OPENAI_API_KEY)
-        
-        # Build the user message
-        user_message = f"Extract event information from this Instagram post:\n\n{raw_content}"
-        if club_name:
-            user_message += f"\n\nThis post is from the club: {club_name}"
-        
-        response = client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[
-                {"role": "system", "content": SYSTEM_PROMPT},
-                {"role": "user", "content": user_message}
-            ],
-            temperature=0.1,  # Low temperature for consistent extraction
-            max_tokens=500,
-            response_format={"type": "json_object"}
-        )
-        
-        # Parse the response
-        result_text = response.choices[0].message.content.strip()
-        
-        # Parse JSON
-        parsed = json.loads(result_text)
-        
-        # Validate and clean the result
-        event = {
-            'title': _clean_string(parsed.get('title')),
-            'description': _clean_string(parsed.get('description')),
-            'event_date': _validate_date(parsed.get('event_date')),
-            'end_date': _validate_date(parsed.get('end_date')),
-            'location': _clean_location(parsed.get('location')),
-            'category': _validate_category(parsed.get('category')),
-        }
-        
-        # Only return if we got at least a title or date
-        if event['title'] or event['event_date']:
-            return event
-        
-        return None
-        
+        response = get_client().chat.completions.create(**request, timeout=timeout or LLM_TIMEOUT)
+        event = _read_response(response)
     except json.JSONDecodeError as e:
         print(f"  [!] LLM returned invalid JSON: {e}")
         return None
     except Exception as e:
         print(f"  [!] LLM parsing error: {e}")
         return None
+    
+    _store(key, event)
+    return event
+
+
+async def parse_event_with_llm_async(raw_content: str, club_name: str = None, timeout: float = None,
+                                     use_cache: bool = True) -> Optional[dict]:
+    """Async parse_event_with_llm; at most LLM_MAX_CONCURRENCY requests per loop are in flight"""
+    request = _build_request(raw_content, club_name)
+    if not request:
+        return None
+    
+    key = LLMCache.key(raw_content, club_name)
+    found, event = _lookup(key, use_cache)
+    if found:
+        return event
+    event = await _fetch_async(key, request, timeout)
+    return None if event is PARSE_FAILED else event
+
+
+async def parse_events_with_llm_async(posts: list[tuple[str, str]], timeout: float = None,
+                                      use_cache: bool = True, batch_size: int = None,
+                                      report_failures: bool = False) -> list[Optional[dict]]:
+    """
+    Parse (raw_content, club_name) pairs concurrently; results keep the input order.
+    Posts with the same cache key are sent once and get their own copy of the result.
+    Cache misses are packed `batch_size` (default LLM_BATCH_SIZE) captions per request,
+    so the system prompt is sent once per batch instead of once per caption.
+    Failed requests come back as None, or as PARSE_FAILED with report_failures.
+    """
+    keys = [LLMCache.key(raw_content, club_name) for raw_content, club_name in posts]
+    by_key = {}
+    pending = []
+    for key, (raw_content, club_name) in zip(keys, posts):
+        if key in by_key:
+            continue
+        by_key[key] = None
+        if not _build_request(raw_content, club_name):
+            continue
+        found, event = _lookup(key, use_cache)
+        if found:
+            by_key[key] = event
+        else:
+            pending.append((key, raw_content, club_name))
+    
+    size = max(1, batch_size or LLM_BATCH_SIZE)
+    chunks = [pending[i:i + size] for i in range(0, len(pending), size)]
+    for results in await asyncio.gather(*[_parse_chunk_async(chunk, timeout) for chunk in chunks]):
+        by_key.update(results)
+    return _in_order(keys, by_key, report_failures)
+
+
+def parse_events_with_llm(posts: list[tuple[str, str]], timeout: float = None, use_cache: bool = True,
+                          batch_size: int = None, report_failures: bool = False) -> list[Optional[dict]]:
+    """
+    Sync wrapper of parse_events_with_llm_async. When this thread already runs an event
+    loop (sync Playwright keeps one running), the batch runs on a worker thread with its
+    own loop, since asyncio.run() cannot be nested.
+    """
+    if not posts:
+        return []
+    
+    async def run():
+        try:
+            return await parse_events_with_llm_async(posts, timeout, use_cache, batch_size, report_failures)
+        finally:
+            await close_async_client()
+    
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(run())
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, run()).result()
+
+
+def parse_events_with_batch_job(posts: list[tuple[str, str]], job_path: str, poll_seconds: float = 30,
+                                use_cache: bool = True, report_failures: bool = False) -> list[Optional[dict]]:
+    """
+    Offline variant of parse_events_with_llm for large backfills: cache misses are
+    written to a JSONL job file, submitted as one asynchronous batch job (completed
+    within 24h at a lower price), polled until it finishes and read back in one pass.
+    Results keep the input order; captions the job failed on come back as None, or as
+    PARSE_FAILED with report_failures.
+    """
+    keys = [LLMCache.key(raw_content, club_name) for raw_content, club_name in posts]
+    by_key = {}
+    pending = []
+    for key, (raw_content, club_name) in zip(keys, posts):
+        if key in by_key:
+            continue
+        by_key[key] = None
+        request = _build_request(raw_content, club_name)
+        if not request:
+            continue
+        found, event = _lookup(key, use_cache)
+        if found:
+            by_key[key] = event
+        else:
+            pending.append((key, request))
+    
+    if pending:
+        print(f"  Submitting {len(pending)} captions as a batch job ({len(by_key) - len(pending)} cached or skipped)")
+        job_id = submit_batch_job(pending, job_path)
+        job = wait_for_batch_job(job_id, poll_seconds)
+        results = read_batch_job_results(job)
+        print(f"  Batch job {job_id} {job.status}: {len(results)} of {len(pending)} captions answered")
+        for key, event in results.items():
+            by_key[key] = event
+            _store(key, event)
+        for key, _ in pending:
+            if key not in results:
+                by_key[key] = PARSE_FAILED
+    return _in_order(keys, by_key, report_failures)
+
+
+def submit_batch_job(requests: list[tuple[str, dict]], job_path: str) -> str:
+    """Write (custom_id, chat request) pairs to a JSONL job file, upload it and start the job"""
+    with open(job_path, 'w', encoding='utf-8') as f:
+        for custom_id, request in requests:
+            line = {"custom_id": custom_id, "method": "POST", "url": "/v1/chat/completions", "body": request}
+            f.write(json.dumps(line, ensure_ascii=False) + "\n")
+    
+    client = get_client()
+    with open(job_path, 'rb') as f:
+        job_file = client.files.create(file=f, purpose="batch")
+    job = client.batches.create(input_file_id=job_file.id, endpoint="/v1/chat/completions",
+                                completion_window="24h")
+    return job.id
+
+
+def wait_for_batch_job(job_id: str, poll_seconds: float = 30):
+    """Poll a batch job until it completed, failed, expired or was cancelled"""
+    client = get_client()
+    while True:
+        job = client.batches.retrieve(job_id)
+        if job.status in ('completed', 'failed', 'expired', 'cancelled'):
+            return job
+        counts = job.request_counts
+        progress = f" ({counts.completed}/{counts.total})" if counts and counts.total else ""
+        print(f"  Batch job {job_id}: {job.status}{progress}")
+        time.sleep(poll_seconds)
+
+
+def read_batch_job_results(job) -> dict[str, Optional[dict]]:
+    """Validated events by custom_id; requests that failed or came back malformed are left out"""
+    if not job.output_file_id:
+        return {}
+    
+    results = {}
+    for line in get_client().files.content(job.output_file_id).text.splitlines():
+        if not line.strip():
+            continue
+        item = json.loads(line)
+        response = item.get('response') or {}
+        if item.get('error') or response.get('status_code') != 200:
+            continue
+        try:
+            content = response['body']['choices'][0]['message']['content']
+            parsed = json.loads(content)
+        except (KeyError, IndexError, TypeError, json.JSONDecodeError):
+            continue
+        if _answered(parsed):
+            results[item['custom_id']] = _validate_event(parsed)
+    return results
+
+
+async def _fetch_async(key: str, request: dict, timeout: float = None) -> Optional[dict]:
+    """Send one single-caption request and cache the answer; PARSE_FAILED if there is none"""
+    client, in_flight = _async_client()
+    try:
+        async with in_flight:
+            response = await client.chat.completions.create(**request, timeout=timeout or LLM_TIMEOUT)
+        event = _read_response(response)
+    except json.JSONDecodeError as e:
+        print(f"  [!] LLM returned invalid JSON: {e}")
+        return PARSE_FAILED
+    except Exception as e:
+        print(f"  [!] LLM parsing error: {e}")
+        return PARSE_FAILED
+    
+    _store(key, event)
+    return event
+
+
+async def _parse_chunk_async(chunk: list[tuple[str, str, str]], timeout: float = None) -> dict[str, Optional[dict]]:
+    """
+    Parse (key, raw_content, club_name) entries with one request; entries that come
+    back missing or malformed are retried one caption per request
+    """
+    if len(chunk) == 1:
+        key, raw_content, club_name = chunk[0]
+        return {key: await _fetch_async(key, _build_request(raw_content, club_name), timeout)}
+    
+    client, in_flight = _async_client()
+    entries = {}
+    try:
+        async with in_flight:
+            response = await client.chat.completions.create(
+                **_build_batch_request([(raw_content, club_name) for _, raw_content, club_name in chunk]),
+                timeout=timeout or LLM_TIMEOUT,
+            )
+        entries = _read_batch_response(response, len(chunk))
+    except json.JSONDecodeError as e:
+        print(f"  [!] LLM returned invalid JSON for a batch of {len(chunk)}: {e}")
+    except Exception as e:
+        print(f"  [!] LLM batch parsing error: {e}")
+    
+    results = {}
+    retry = []
+    for index, (key, raw_content, club_name) in enumerate(chunk):
+        if index in entries:
+            results[key] = entries[index]
+            # Same key as a single-caption answer: the batch prompt only adds the id framing
+            _store(key, entries[index])
+        else:
+            retry.append((key, _build_request(raw_content, club_name)))
+    
+    if retry:
+        print(f"  [!] {len(retry)} of {len(chunk)} batch entries missing or malformed, retrying them one by one")
+        retried = await asyncio.gather(*[_fetch_async(key, request, timeout) for key, request in retry])
+        results.update(zip([key for key, _ in retry], retried))
+    return results
+
+
+def _in_order(keys: list[str], by_key: dict, report_failures: bool) -> list[Optional[dict]]:
+    """Results in the order of keys, each its own copy; failures are None unless report_failures"""
+    results = []
+    for key in keys:
+        event = by_key[key]
+        if event is PARSE_FAILED:
+            results.append(PARSE_FAILED if report_failures else None)
+        else:
+            results.append(dict(event) if event else None)
+    return results
+
+
+def _lookup(key: str, use_cache: bool) -> tuple[bool, Optional[dict]]:
+    """(found, event) from the cache, honouring the bypass flag and LLM_CACHE=refresh"""
+    cache = get_cache()
+    if not cache:
+        return False, None
+    if not use_cache or LLM_CACHE == 'refresh':
+        cache.bypassed += 1
+        return False, None
+    return cache.get(key)
+
+
+def _store(key: str, event: Optional[dict]):
+    cache = get_cache()
+    if cache:
+        cache.put(key, event)
+
+
+def _build_request(raw_content: str, club_name: str = None) -> Optional[dict]:
+    """Chat completion arguments for one post, or None if it can't be parsed"""
+    if not OPENAI_API_KEY:
+        print("  [!] OpenAI API key not set, falling back to regex parsing")
+        return None
+    
+    if not raw_content or len(raw_content.strip()) < 20:
+        return None
+    
+    # Build the user message
+    user_message = f"Extract event information from this Instagram post:\n\n{raw_content}"
+    if club_name:
+        user_message += f"\n\nThis post is from the club: {club_name}"
+    
+    return {
+        'model': LLM_MODEL,
+        'messages': [
+            {"role": "system", "content": SYSTEM_PROMPT},
+            {"role": "user", "content": user_message}
+        ],
+        'temperature': 0.1,  # Low temperature for consistent extraction
+        'max_tokens': 500,
+        'response_format': {"type": "json_object"},
+    }
+
+
+def _build_batch_request(posts: list[tuple[str, str]]) -> dict:
+    """Chat completion arguments for several posts, numbered by their index"""
+    parts = []
+    for index, (raw_content, club_name) in enumerate(posts):
+        header = f"### POST {index}"
+        if club_name:
+            header += f" (from the club: {club_name})"
+        parts.append(f"{header}\n{raw_content}")
+    
+    return {
+        'model': LLM_MODEL,
+        'messages': [
+            {"role": "system", "content": BATCH_SYSTEM_PROMPT},
+            {"role": "user", "content": "Extract event information from these Instagram posts:\n\n" + "\n\n".join(parts)}
+        ],
+        'temperature': 0.1,
+        'max_tokens': 500 * len(posts),
+        'response_format': {"type": "json_object"},
+    }
+
+
+def _read_response(response) -> Optional[dict]:
+    """Validate and clean the JSON the model answered with"""
+    # Parse the response
+    result_text = response.choices[0].message.content.strip()
+    
+    # Parse JSON
+    parsed = json.loads(result_text)
+    if not _answered(parsed):
+        raise ValueError(f"answer has none of the event fields: {result_text[:80]}")
+    return _validate_event(parsed)
+
+
+def _read_batch_response(response, count: int) -> dict[int, Optional[dict]]:
+    """Validated events by post index; malformed entries and unknown or repeated ids are left out"""
+    parsed = json.loads(response.choices[0].message.content.strip())
+    items = parsed.get('events') if isinstance(parsed, dict) else None
+    
+    entries = {}
+    repeated = set()
+    for item in items if isinstance(items, list) else []:
+        if not isinstance(item, dict):
+            continue
+        try:
+            index = int(item.get('id'))
+        except (TypeError, ValueError):
+            continue
+        if not 0 <= index < count or not _answered(item):
+            continue
+        if index in entries:
+            repeated.add(index)
+        entries[index] = _validate_event(item)
+    
+    for index in repeated:
+        del entries[index]
+    return entries
+
+
+def _answered(parsed) -> bool:
+    """Whether an answer object carries any of EVENT_FIELDS; one with only an id says nothing"""
+    return isinstance(parsed, dict) and any(field in parsed for field in EVENT_FIELDS)
+
+
+def _validate_event(parsed: dict) -> Optional[dict]:
+    """Clean one extracted event; None if it has neither a title nor a date"""
+    if not isinstance(parsed, dict):
+        return None
+    
+    # Validate and clean the result
+    event = {
+        'title': _clean_string(parsed.get('title')),
+        'description': _clean_string(parsed.get('description')),
+        'event_date': _validate_date(parsed.get('event_date')),
+        'end_date': _validate_date(parsed.get('end_date')),
+        'location': _clean_location(parsed.get('location')),
+        'category': _validate_category(parsed.get('category')),
+    }
+    
+    # Only return if we got at least a title or date
+    if event['title'] or event['event_date']:
+        return event
+    
+    return None
 
 
 def _clean_string(value: str) -> Optional[str]:
@@ -162,13 +688,9 @@ def _validate_date(date_str: str) -> Optional[str]:
     except ValueError:
         pass
     
-    try:
-        # Try other common formats
-        from dateutil import parser as date_parser
-        parsed = date_parser.parse(date_str, fuzzy=True)
-        return parsed.isoformat()
-    except:
-        return None
+    # Try other common formats ("15 Mart 2025 14:00", "March 15, 2pm", "Cuma 18:00")
+    parsed = parse_event_date(date_str)
+    return parsed.start.isoformat() if parsed else None
 
 
 def _validate_category(category: str) -> Optional[str]:
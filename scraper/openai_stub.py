@@ -0,0 +1,256 @@
+"""
+The Hive - Local OpenAI Stand-in
+OpenAI-compatible stub of the chat, files and batch endpoints llm_parser uses, so the
+LLM flows (single, multi-caption and batch jobs) can be run and timed offline.
+
+    python openai_stub.py --port 8900 --latency 0.5 --batch-delay 5
+    OPENAI_BASE_URL=http://127.0.0.1:8900/v1 OPENAI_API_KEY=stub python ../reparse_events.py --batch-job
+
+Answers are built with the regex date parser, not a model: good enough to exercise
+validation, caching and the database updates, not to judge extraction quality.
+"""
+
+import argparse
+import itertools
+import json
+import os
+import re
+import sys
+import threading
+import time
+from email.parser import BytesParser
+from email.policy import default as email_policy
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Shared date parser from the v2 package
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'instagram_scraper_v2'))
+from src.scrapers.event_dates import parse_event_date
+
+LOCATION_RE = re.compile(r'(?:📍|Yer:|Konum:|Nerede:|Location:|Venue:)\s*([^\n]+)', re.IGNORECASE)
+POST_RE = re.compile(r'^### POST (\d+)[^\n]*\n', re.MULTILINE)
+SINGLE_PREFIX = "Extract event information from this Instagram post:\n\n"
+CLUB_SUFFIX = re.compile(r'\n\nThis post is from the club: [^\n]*$')
+
+
+class StubState:
+    """Uploaded files, batch jobs and usage counters, shared by all request threads"""
+
+    def __init__(self, latency: float, batch_delay: float):
+        self.latency = latency
+        self.batch_delay = batch_delay
+        self.files: dict[str, dict] = {}
+        self.batches: dict[str, dict] = {}
+        self.lock = threading.Lock()
+        self.ids = itertools.count(1)
+        self.stats = {'chat_requests': 0, 'batch_jobs': 0, 'batch_lines': 0,
+                      'captions': 0, 'prompt_tokens': 0, 'completion_tokens': 0}
+
+    def next_id(self, prefix: str) -> str:
+        return f"{prefix}-stub-{next(self.ids)}"
+
+    def count(self, **amounts):
+        with self.lock:
+            for name, amount in amounts.items():
+                self.stats[name] += amount
+
+
+def extract(raw_content: str) -> dict:
+    """Event fields for one caption, in the shape SYSTEM_PROMPT asks for"""
+    lines = [line.strip() for line in raw_content.splitlines() if line.strip()]
+    when = parse_event_date(raw_content)
+    location = LOCATION_RE.search(raw_content)
+    return {
+        'title': lines[0][:100] if lines else None,
+        'description': raw_content.strip(),
+        'event_date': when.start.isoformat() if when else None,
+        'end_date': when.end.isoformat() if when and when.end else None,
+        'location': location.group(1).strip() if location else None,
+        'category': 'other',
+    }
+
+
+def complete(state: StubState, body: dict) -> dict:
+    """Chat completion for a single-caption or a multi-caption ("### POST <id>") request"""
+    messages = body.get('messages') or []
+    prompt = "\n".join(str(message.get('content') or '') for message in messages)
+    user = str(messages[-1].get('content') or '') if messages else ''
+    
+    parts = POST_RE.split(user)
+    if len(parts) > 1:
+        # [preamble, id, caption, id, caption, ...]
+        events = [dict(extract(caption), id=post_id) for post_id, caption in zip(parts[1::2], parts[2::2])]
+        answer = {'events': events}
+        captions = len(events)
+    else:
+        caption = CLUB_SUFFIX.sub('', user[len(SINGLE_PREFIX):] if user.startswith(SINGLE_PREFIX) else user)
+        answer = extract(caption)
+        captions = 1
+    
+    content = json.dumps(answer, ensure_ascii=False)
+    # Rough token counts (4 characters per token) to compare request shapes offline
+    prompt_tokens, completion_tokens = len(prompt) // 4, len(content) // 4
+    state.count(captions=captions, prompt_tokens=prompt_tokens, completion_tokens=completion_tokens)
+    return {
+        'id': state.next_id('chatcmpl'),
+        'object': 'chat.completion',
+        'created': int(time.time()),
+        'model': body.get('model', 'stub'),
+        'choices': [{'index': 0, 'message': {'role': 'assistant', 'content': content}, 'finish_reason': 'stop'}],
+        'usage': {'prompt_tokens': prompt_tokens, 'completion_tokens': completion_tokens,
+                  'total_tokens': prompt_tokens + completion_tokens},
+    }
+
+
+def run_batch(state: StubState, batch: dict):
+    """Process a batch job in the background, like the real service does"""
+    time.sleep(state.batch_delay / 2)
+    batch.update(status='in_progress', in_progress_at=int(time.time()))
+    
+    lines = state.files[batch['input_file_id']]['content'].decode('utf-8').splitlines()
+    requests = [json.loads(line) for line in lines if line.strip()]
+    batch['request_counts']['total'] = len(requests)
+    
+    output = []
+    for request in requests:
+        response = complete(state, request.get('body') or {})
+        output.append(json.dumps({
+            'id': state.next_id('batch_req'),
+            'custom_id': request.get('custom_id'),
+            'response': {'status_code': 200, 'request_id': response['id'], 'body': response},
+            'error': None,
+        }, ensure_ascii=False))
+        batch['request_counts']['completed'] += 1
+    state.count(batch_lines=len(requests))
+    
+    time.sleep(state.batch_delay / 2)
+    output_file = store_file(state, 'batch_output.jsonl', 'batch_output', "\n".join(output).encode('utf-8'))
+    batch.update(status='completed', output_file_id=output_file['id'], completed_at=int(time.time()))
+
+
+def store_file(state: StubState, filename: str, purpose: str, content: bytes) -> dict:
+    file = {
+        'id': state.next_id('file'),
+        'object': 'file',
+        'bytes': len(content),
+        'created_at': int(time.time()),
+        'filename': filename,
+        'purpose': purpose,
+        'status': 'processed',
+    }
+    state.files[file['id']] = dict(file, content=content)
+    return file
+
+
+def make_handler(state: StubState, verbose: bool = False):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+        
+        def do_GET(self):
+            path = self.path.split('?')[0].rstrip('/')
+            if path == '/stats':
+                return self._json(200, state.stats)
+            match = re.fullmatch(r'/v1/files/([\w-]+)(/content)?', path)
+            if match and match.group(1) in state.files:
+                file = state.files[match.group(1)]
+                if match.group(2):
+                    return self._send(200, file['content'], 'application/octet-stream')
+                return self._json(200, {k: v for k, v in file.items() if k != 'content'})
+            match = re.fullmatch(r'/v1/batches/([\w-]+)', path)
+            if match and match.group(1) in state.batches:
+                return self._json(200, state.batches[match.group(1)])
+            self._json(404, {'error': {'message': f"{path} not found", 'type': 'invalid_request_error'}})
+        
+        def do_POST(self):
+            path = self.path.split('?')[0].rstrip('/')
+            body = self.rfile.read(int(self.headers.get('Content-Length') or 0))
+            
+            if path == '/v1/chat/completions':
+                time.sleep(state.latency)
+                state.count(chat_requests=1)
+                return self._json(200, complete(state, json.loads(body)))
+            
+            if path == '/v1/files':
+                fields = self._form(body)
+                file = store_file(state, fields.get('filename') or 'upload.jsonl',
+                                  (fields.get('purpose') or b'batch').decode(), fields.get('file') or b'')
+                return self._json(200, file)
+            
+            if path == '/v1/batches':
+                payload = json.loads(body)
+                if payload.get('input_file_id') not in state.files:
+                    return self._json(400, {'error': {'message': 'unknown input_file_id',
+                                                      'type': 'invalid_request_error'}})
+                batch = {
+                    'id': state.next_id('batch'),
+                    'object': 'batch',
+                    'endpoint': payload.get('endpoint'),
+                    'input_file_id': payload['input_file_id'],
+                    'completion_window': payload.get('completion_window', '24h'),
+                    'status': 'validating',
+                    'output_file_id': None,
+                    'error_file_id': None,
+                    'created_at': int(time.time()),
+                    'request_counts': {'total': 0, 'completed': 0, 'failed': 0},
+                }
+                state.batches[batch['id']] = batch
+                state.count(batch_jobs=1)
+                threading.Thread(target=run_batch, args=(state, batch), daemon=True).start()
+                return self._json(200, batch)
+            
+            self._json(404, {'error': {'message': f"{path} not found", 'type': 'invalid_request_error'}})
+        
+        def _form(self, body: bytes) -> dict:
+            """multipart/form-data fields; the uploaded file's name is kept under 'filename'"""
+            head = f"Content-Type: {self.headers.get('Content-Type')}\r\n\r\n".encode('latin-1')
+            fields = {}
+            for part in BytesParser(policy=email_policy).parsebytes(head + body).iter_parts():
+                name = part.get_param('name', header='content-disposition')
+                fields[name] = part.get_payload(decode=True)
+                if part.get_filename():
+                    fields['filename'] = part.get_filename()
+            return fields
+        
+        def _json(self, status: int, payload: dict):
+            self._send(status, json.dumps(payload, ensure_ascii=False).encode('utf-8'), 'application/json')
+        
+        def _send(self, status: int, data: bytes, content_type: str):
+            self.send_response(status)
+            self.send_header('Content-Type', content_type)
+            self.send_header('Content-Length', str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+        
+        def log_message(self, format, *args):
+            if verbose:
+                super().log_message(format, *args)
+    
+    return Handler
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="The Hive - local OpenAI-compatible stub server")
+    arg_parser.add_argument('--host', default='127.0.0.1')
+    arg_parser.add_argument('--port', type=int, default=8900)
+    arg_parser.add_argument('--latency', type=float, default=0.5,
+                            help='Seconds each chat completion request takes')
+    arg_parser.add_argument('--batch-delay', type=float, default=5,
+                            help='Seconds a batch job takes from submission to completion')
+    arg_parser.add_argument('--verbose', action='store_true', help='Log every request')
+    args = arg_parser.parse_args()
+    
+    state = StubState(args.latency, args.batch_delay)
+    server = ThreadingHTTPServer((args.host, args.port), make_handler(state, args.verbose))
+    print(f"[OK] OpenAI stub on http://{args.host}:{args.port}/v1 "
+          f"(latency {args.latency}s, batch delay {args.batch_delay}s)")
+    print(f"     OPENAI_BASE_URL=http://{args.host}:{args.port}/v1 OPENAI_API_KEY=stub")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        print(f"\nUsage: {json.dumps(state.stats)}")
+
+
+if __name__ == "__main__":
+    main()
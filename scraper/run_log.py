@@ -0,0 +1,153 @@
+"""
+The Hive - Scraper Run Log
+Crash-safe output of instagram_scraper.py: events are appended to a JSONL file and
+fsynced club by club, and a manifest next to it lists the clubs that are finished,
+so an interrupted run can be resumed (--resume) without losing or repeating work.
+    
+    python run_log.py build [--events scraped_events.jsonl] [--out scraped_events.json]
+
+rebuilds the legacy scraped_events.json from the JSONL (instagram_scraper.py does
+this at the end of every run).
+"""
+
+import argparse
+import json
+import os
+from datetime import datetime
+from typing import Iterator, Optional
+
+EVENTS_PATH = "scraped_events.jsonl"
+JSON_PATH = "scraped_events.json"
+
+
+def manifest_path(events_path: str) -> str:
+    return os.path.splitext(events_path)[0] + ".manifest.json"
+
+
+class RunLog:
+    """
+    Append-only JSONL of the events of one run plus its manifest. add_club() writes and
+    fsyncs the club's events first and only then records the club as finished, so after
+    a crash the manifest never lists a club whose events are missing. The manifest also
+    stores the JSONL size at that point; resuming cuts off whatever was written after it
+    (a club that was half written when the run died).
+    """
+    
+    def __init__(self, events_path: str = EVENTS_PATH, resume: bool = False):
+        self.events_path = events_path
+        self.manifest_path = manifest_path(events_path)
+        self.manifest = self._load_manifest() if resume else None
+        
+        if resume and not self.manifest:
+            print(f"[!] No unfinished run in {self.manifest_path}, starting a new one")
+        elif not resume and self._load_manifest():
+            print(f"[!] Discarding the unfinished run in {events_path} (continue it with --resume)")
+        if self.manifest:
+            print(f"[OK] Resuming the run started {self.manifest['started_at']}: "
+                  f"{len(self.manifest['clubs'])} clubs and {self.manifest['events']} events already done")
+            self._file = open(events_path, 'r+b')
+            self._file.truncate(self.manifest['bytes'])
+            self._file.seek(self.manifest['bytes'])
+        else:
+            self.manifest = {
+                'started_at': datetime.now().isoformat(timespec='seconds'),
+                'updated_at': None,
+                'finished': False,
+                'events': 0,
+                'bytes': 0,
+                'clubs': {},
+            }
+            self._file = open(events_path, 'wb')
+            self._save_manifest()
+    
+    @property
+    def events(self) -> int:
+        return self.manifest['events']
+    
+    def is_done(self, club: dict) -> bool:
+        return club['instagram_url'] in self.manifest['clubs']
+    
+    def add_club(self, club: dict, events: list[dict]):
+        """Append a finished club's events (fsynced), then mark the club done"""
+        for event in events:
+            line = json.dumps(event, ensure_ascii=False, default=str) + "\n"
+            self._file.write(line.encode('utf-8'))
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        
+        self.manifest['clubs'][club['instagram_url']] = {'name': club['name'], 'events': len(events)}
+        self.manifest['events'] += len(events)
+        self.manifest['bytes'] = self._file.tell()
+        self._save_manifest()
+    
+    def finish(self):
+        """Mark the run complete; --resume then starts a new one"""
+        self.manifest['finished'] = True
+        self._save_manifest()
+    
+    def close(self):
+        self._file.close()
+    
+    def _load_manifest(self) -> Optional[dict]:
+        if not os.path.exists(self.manifest_path) or not os.path.exists(self.events_path):
+            return None
+        with open(self.manifest_path, encoding='utf-8') as f:
+            manifest = json.load(f)
+        return None if manifest.get('finished') else manifest
+    
+    def _save_manifest(self):
+        """Replace the manifest atomically and durably"""
+        self.manifest['updated_at'] = datetime.now().isoformat(timespec='seconds')
+        tmp_path = self.manifest_path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.manifest, f, ensure_ascii=False, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.manifest_path)
+
+
+def read_events(events_path: str = EVENTS_PATH) -> Iterator[dict]:
+    """Events of a JSONL run log, one at a time; a torn last line (crash mid-write) is skipped"""
+    with open(events_path, encoding='utf-8') as f:
+        for line in f:
+            if not line.endswith("\n"):
+                break
+            if line.strip():
+                yield json.loads(line)
+
+
+def build_json(events_path: str = EVENTS_PATH, json_path: str = JSON_PATH) -> int:
+    """
+    Write the legacy scraped_events.json ({'scraped_at', 'total_events', 'events'}) from
+    the JSONL, streaming, so the events never all have to be in memory at once
+    """
+    total = sum(1 for _ in read_events(events_path))
+    tmp_path = json_path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write('{\n')
+        f.write(f'  "scraped_at": {json.dumps(datetime.now().isoformat())},\n')
+        f.write(f'  "total_events": {total},\n')
+        f.write('  "events": [')
+        for i, event in enumerate(read_events(events_path)):
+            body = json.dumps(event, ensure_ascii=False, indent=2).replace("\n", "\n    ")
+            f.write(f'{"," if i else ""}\n    {body}')
+        f.write('\n  ]\n}' if total else ']\n}')
+    os.replace(tmp_path, json_path)
+    return total
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="The Hive - scraper run log")
+    commands = arg_parser.add_subparsers(dest='command', required=True)
+    
+    build_parser = commands.add_parser('build', help='Rebuild scraped_events.json from the JSONL run log')
+    build_parser.add_argument('--events', default=EVENTS_PATH, help='JSONL run log to read')
+    build_parser.add_argument('--out', default=JSON_PATH, help='JSON file to write')
+    args = arg_parser.parse_args()
+    
+    total = build_json(args.events, args.out)
+    print(f"[OK] Wrote {total} events to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
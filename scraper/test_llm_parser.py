@@ -0,0 +1,63 @@
+import asyncio
+import json
+from types import SimpleNamespace
+
+import llm_parser
+
+POSTS = [("📅 15 Mart 2025 🕐 14:00 📍 İTÜ Ayazağa - Tanışma toplantısı", "ITU Music Club")]
+EVENT = {"title": "Tanışma toplantısı", "date": "2025-03-15", "time": "14:00"}
+
+
+def fake_parse(monkeypatch):
+    """Replace the API round trip with a coroutine that needs a running loop"""
+    async def parse_async(posts, timeout=None, use_cache=True, batch_size=None, report_failures=False):
+        await asyncio.sleep(0)
+        return [EVENT for _ in posts]
+    
+    monkeypatch.setattr(llm_parser, "parse_events_with_llm_async", parse_async)
+
+
+def test_parse_events_without_loop(monkeypatch):
+    fake_parse(monkeypatch)
+    assert llm_parser.parse_events_with_llm(POSTS) == [EVENT]
+
+
+def test_parse_events_inside_running_loop(monkeypatch):
+    # Sync Playwright keeps an event loop running on the thread that calls the parser
+    fake_parse(monkeypatch)
+    
+    async def caller():
+        return llm_parser.parse_events_with_llm(POSTS)
+    
+    assert asyncio.run(caller()) == [EVENT]
+
+
+def test_failed_requests_differ_from_short_captions(monkeypatch):
+    class Completions:
+        async def create(self, **request):
+            raise TimeoutError("request timed out")
+    
+    client = type("Client", (), {"chat": type("Chat", (), {"completions": Completions()})()})()
+    monkeypatch.setattr(llm_parser, "OPENAI_API_KEY", "test")
+    monkeypatch.setattr(llm_parser, "LLM_CACHE", "off")
+    monkeypatch.setattr(llm_parser, "_async_client", lambda: (client, asyncio.Semaphore(4)))
+    
+    posts = POSTS + [("too short", "ITU Music Club")]
+    assert llm_parser.parse_events_with_llm(posts) == [None, None]
+    assert llm_parser.parse_events_with_llm(posts, report_failures=True) == [llm_parser.PARSE_FAILED, None]
+
+
+def test_batch_entries_without_event_fields_are_retried(monkeypatch):
+    answer = {"events": [
+        {"id": 0, "title": "Tanışma toplantısı", "event_date": "2025-03-15"},
+        {"id": 1, "title": None, "description": None, "event_date": None, "end_date": None,
+         "location": None, "category": None},
+        {"id": 2},
+    ]}
+    message = SimpleNamespace(content=json.dumps(answer))
+    response = SimpleNamespace(choices=[SimpleNamespace(message=message)])
+    
+    entries = llm_parser._read_batch_response(response, 3)
+    assert entries[0]["title"] == "Tanışma toplantısı"
+    assert entries[1] is None  # Answered: not an event
+    assert 2 not in entries    # Only the id: malformed, retried one by one
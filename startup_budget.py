@@ -0,0 +1,95 @@
+"""
+The Hive - CLI Startup Budget
+Cold-starts each command line tool under `python -X importtime` and fails (exit code 1)
+when its imports take longer than their budget, or when it pulls in a heavy dependency
+that should only load once a command actually needs it.
+
+    python startup_budget.py [--runs 5] [--scale 2]
+
+--scale multiplies every budget, for slower machines or CI runners.
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+# (name, working directory, arguments after `python -X importtime`, import budget in ms,
+#  modules that must not be imported)
+CHECKS = [
+    ("v2 main.py --help", "instagram_scraper_v2", ["main.py", "--help"], 40,
+     ("playwright", "pydantic", "requests", "pandas", "yaml", "asyncio")),
+    ("v2 find command imports", "instagram_scraper_v2",
+     ["-c", "import main; from src.scrapers.club_finder import ClubSiteScraper; "
+            "from src.utils.storage import DataManager"], 60,
+     ("playwright", "pydantic", "requests", "pandas")),
+    ("scraper/instagram_scraper.py --help", "scraper", ["instagram_scraper.py", "--help"], 60,
+     ("playwright", "openai", "requests", "asyncio")),
+]
+
+
+def parse_importtime(stderr: str) -> list[tuple[str, int, int]]:
+    """(module, depth, cumulative microseconds) for every line of -X importtime output"""
+    modules = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        modules.append((name.strip(), depth, int(cumulative)))
+    return modules
+
+
+def measure(cwd: str, args: list[str]) -> tuple[float, float, list[tuple[str, int, int]]]:
+    """Import time and wall time (ms) of one fresh interpreter, plus what it imported"""
+    started = time.perf_counter()
+    result = subprocess.run([sys.executable, "-X", "importtime", *args], cwd=os.path.join(ROOT, cwd),
+                            capture_output=True, text=True)
+    wall_ms = (time.perf_counter() - started) * 1000
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1])
+    modules = parse_importtime(result.stderr)
+    import_ms = sum(cumulative for _, depth, cumulative in modules if depth == 0) / 1000
+    return import_ms, wall_ms, modules
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="The Hive - CLI startup time budget")
+    arg_parser.add_argument('--runs', type=int, default=5, help='Cold starts per check; the fastest one counts')
+    arg_parser.add_argument('--scale', type=float, default=1.0, help='Multiply every budget by this factor')
+    arg_parser.add_argument('--top', type=int, default=5, help='Heaviest imports to list per check')
+    args = arg_parser.parse_args()
+
+    failed = 0
+    for name, cwd, check_args, budget_ms, forbidden in CHECKS:
+        budget_ms *= args.scale
+        try:
+            runs = [measure(cwd, check_args) for _ in range(args.runs)]
+        except RuntimeError as e:
+            print(f"[X] {name}: did not start: {e}")
+            failed += 1
+            continue
+        import_ms, wall_ms, modules = min(runs, key=lambda run: run[0])
+
+        heavy = sorted({module for module, _, _ in modules if module in forbidden})
+        ok = import_ms <= budget_ms and not heavy
+        failed += not ok
+        print(f"[{'OK' if ok else 'X'}] {name}: imports {import_ms:.1f} ms (budget {budget_ms:.0f} ms), "
+              f"process {wall_ms:.0f} ms")
+        if heavy:
+            print(f"    imported on startup: {', '.join(heavy)}")
+        top = sorted((m for m in modules if m[1] == 0), key=lambda m: m[2], reverse=True)[:args.top]
+        for module, _, cumulative in top:
+            print(f"    {cumulative / 1000:7.1f} ms  {module}")
+
+    if failed:
+        print(f"\n{failed} of {len(CHECKS)} startup checks over budget")
+        sys.exit(1)
+    print(f"\nAll {len(CHECKS)} startup checks within budget")
+
+
+if __name__ == "__main__":
+    main()